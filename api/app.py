@@ -106,12 +106,11 @@ def api_jobs():
     offset = (page - 1) * per_page
 
     filters = {}
-    for key in ['search', 'status', 'employment_type', 'source']:
+    for key in ['search', 'status', 'employment_type', 'source', 'tag']:
         if request.args.get(key):
             filters[key] = request.args.get(key)
 
-    jobs = db.get_jobs(filters=filters, limit=per_page, offset=offset)
-    total = db.get_jobs_count(filters=filters)
+    jobs, total = db.get_jobs_paged(filters=filters, limit=per_page, offset=offset)
     total_pages = (total + per_page - 1) // per_page
 
     return jsonify({
@@ -652,63 +651,38 @@ def api_llm_process():
 
     app_logger.info(f"Processing {len(jobs_to_process)} jobs with LLM...")
 
-    processed = 0
-    failed = 0
-    skipped = 0
+    def log_progress(done, total, title):
+        if done % 10 == 1:
+            app_logger.info(f"[LLM] Processing {done}/{total}: {title[:50]}...")
 
-    # Process jobs one at a time and save immediately
-    for i, job in enumerate(jobs_to_process):
-        if i % 10 == 0:
-            app_logger.info(f"[LLM] Processing {i+1}/{len(jobs_to_process)}: {job.get('title', 'Unknown')[:50]}...")
-
-        # Skip if description too short
-        if len(job.get('description', '')) < 50:
-            skipped += 1
-            continue
+    # Requests run concurrently in batches; results are saved to the database as they complete
+    stats = processor.process_jobs_batch(jobs_to_process, log_progress, db_path=app.config['DB_PATH'])
+    processed = stats['processed']
+    failed = stats['failed']
+    skipped = stats['skipped']
 
+    # Also update missing job fields from extracted entities
+    jobs_by_id = {job['id']: job for job in jobs_to_process}
+    for saved_id, saved_entities in zip(stats['results']['id'], stats['results']['entities']):
+        job = jobs_by_id[saved_id]
         try:
-            result = processor.process_job(job)
-
-            if result:
-                # Save to database immediately
-                success = db.update_job_llm_data(
-                    job['id'],
-                    result['cleaned_description'],
-                    result['tags'],
-                    result['entities']
-                )
+            entities = json.loads(saved_entities) if isinstance(saved_entities, str) else saved_entities
+            updates = {}
 
-                if success:
-                    processed += 1
-
-                    # Also update missing job fields from extracted entities
-                    try:
-                        entities = json.loads(result['entities']) if isinstance(result['entities'], str) else result['entities']
-                        updates = {}
-
-                        # Fill in location if missing/unknown
-                        if (not job.get('location') or job.get('location', '').lower() in ['unknown', 'not specified', '']) and entities.get('locations'):
-                            updates['location'] = entities['locations'][0]
-
-                        # Fill in salary if missing/unknown
-                        if (not job.get('salary') or job.get('salary', '').lower() in ['unknown', 'not specified', '']) and entities.get('salary_info'):
-                            updates['salary'] = entities['salary_info']
-
-                        # Apply updates if any
-                        if updates:
-                            db.update_job(job['id'], updates)
-                            app_logger.info(f"[LLM] Updated job {job['id']} fields: {list(updates.keys())}")
-                    except Exception as e:
-                        app_logger.warning(f"[LLM] Failed to update job fields from entities: {e}")
-                else:
-                    failed += 1
-                    app_logger.error(f"[LLM] Failed to save result for: {job.get('title')}")
-            else:
-                failed += 1
+            # Fill in location if missing/unknown
+            if (not job.get('location') or job.get('location', '').lower() in ['unknown', 'not specified', '']) and entities.get('locations'):
+                updates['location'] = entities['locations'][0]
 
+            # Fill in salary if missing/unknown
+            if (not job.get('salary') or job.get('salary', '').lower() in ['unknown', 'not specified', '']) and entities.get('salary_info'):
+                updates['salary'] = entities['salary_info']
+
+            # Apply updates if any
+            if updates:
+                db.update_job(job['id'], updates)
+                app_logger.info(f"[LLM] Updated job {job['id']} fields: {list(updates.keys())}")
         except Exception as e:
-            failed += 1
-            app_logger.error(f"[LLM] Error processing {job.get('title')}: {e}")
+            app_logger.warning(f"[LLM] Failed to update job fields from entities: {e}")
 
     app_logger.info(f"LLM processing complete: {processed} processed, {failed} failed, {skipped} skipped")
 
@@ -765,50 +739,40 @@ def api_llm_status():
 
 def create_scrape_executor(db_path: str):
     """Create a scrape executor function for the scheduler."""
-    def executor(progress_callback=None):
-        """Execute scraping task."""
-        import asyncio
-
-        async def run_scrape():
-            db = JobDatabase(db_path)
-            configs = db.get_search_configs(enabled_only=True)
-            if not configs:
-                return "No enabled configs"
-
-            total_found = 0
-            for i, config in enumerate(configs):
-                if progress_callback:
-                    progress_callback(i, len(configs), f"Scraping: {config.name}")
-
-                for source_name, scraper_class in AVAILABLE_SCRAPERS.items():
-                    scraper = None
-                    try:
-                        scraper = scraper_class(db, headless=True)
-                        await scraper.init_browser()
-                        jobs = await scraper.search_jobs(
-                            config.keywords,
-                            config.location,
-                            radius=config.radius,
-                            employment_types=config.employment_types or None,
-                            max_pages=5,
-                            save_incrementally=True
-                        )
-                        total_found += len(jobs)
-                    except Exception as e:
-                        app_logger.error(f"[Scheduler] Scrape error {source_name}: {e}")
-                    finally:
-                        if scraper:
-                            await scraper.cleanup()
+    async def executor(progress_callback=None):
+        """Execute scraping task on the scheduler's event loop."""
+        db = JobDatabase(db_path)
+        configs = db.get_search_configs(enabled_only=True)
+        if not configs:
+            return "No enabled configs"
 
-            db.close()
-            return f"Found {total_found} jobs"
+        total_found = 0
+        for i, config in enumerate(configs):
+            if progress_callback:
+                progress_callback(i, len(configs), f"Scraping: {config.name}")
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(run_scrape())
-        finally:
-            loop.close()
+            for source_name, scraper_class in AVAILABLE_SCRAPERS.items():
+                scraper = None
+                try:
+                    scraper = scraper_class(db, headless=True)
+                    await scraper.init_browser()
+                    jobs = await scraper.search_jobs(
+                        config.keywords,
+                        config.location,
+                        radius=config.radius,
+                        employment_types=config.employment_types or None,
+                        max_pages=5,
+                        save_incrementally=True
+                    )
+                    total_found += len(jobs)
+                except Exception as e:
+                    app_logger.error(f"[Scheduler] Scrape error {source_name}: {e}")
+                finally:
+                    if scraper:
+                        await scraper.cleanup()
+
+        db.close()
+        return f"Found {total_found} jobs"
 
     return executor
 
@@ -829,7 +793,9 @@ def create_descriptions_executor(db_path: str):
             return "No jobs need descriptions"
 
         app_logger.info(f"[Scheduler] Found {len(jobs)} jobs needing descriptions")
-        fetcher = DescriptionFetcher(max_retries=3, timeout=30)
+        # Cache alongside the jobs DB so reruns skip pages fetched within the TTL
+        fetcher = DescriptionFetcher(max_retries=3, timeout=30,
+                                     cache_path=str(Path(db_path).with_name('descriptions_cache.db')))
         updated = 0
         expired = 0
         failed = 0
@@ -868,6 +834,7 @@ def create_descriptions_executor(db_path: str):
                 failed += 1
                 app_logger.error(f"[Scheduler] Description error for {job.title}: {e}")
 
+        fetcher.close()
         db.close()
         result = f"Updated {updated}, expired {expired}, failed {failed} of {len(jobs)}"
         app_logger.info(f"[Scheduler] Descriptions task complete: {result}")
@@ -879,11 +846,8 @@ def create_descriptions_executor(db_path: str):
 def create_llm_executor(db_path: str):
     """Create an LLM processing executor function for the scheduler."""
     def executor(progress_callback=None):
-        """Execute LLM processing task with parallel processing (3 workers for 3 API keys)."""
-        from concurrent.futures import ThreadPoolExecutor, as_completed
-        import threading
-
-        app_logger.info("[Scheduler] Starting LLM processing task (parallel)")
+        """Execute LLM processing task with concurrent batched requests, saving results as they complete."""
+        app_logger.info("[Scheduler] Starting LLM processing task (batched)")
 
         jobs = JobDatabase(db_path).get_jobs_needing_llm_processing(limit=1000)
 
@@ -898,58 +862,17 @@ def create_llm_executor(db_path: str):
         except ValueError as e:
             return f"LLM not configured: {e}"
 
-        processed = [0]  # Use list for thread-safe mutation
-        failed = [0]
-        completed = [0]
-        lock = threading.Lock()
+        def report_progress(done, total, title):
+            if progress_callback:
+                progress_callback(done, total, f"Processed {done}/{total}")
+            if done % 20 == 0:
+                app_logger.info(f"[Scheduler] LLM processed {done} jobs...")
 
-        def process_single_job(job):
-            """Process one job and save immediately."""
-            # Each thread gets its own DB connection
-            thread_db = JobDatabase(db_path)
-            try:
-                result = processor.process_job(job)
-
-                if result:
-                    success = thread_db.update_job_llm_data(
-                        job['id'],
-                        result['cleaned_description'],
-                        result['tags'],
-                        result['entities']
-                    )
-                    thread_db.close()
-                    return ('success' if success else 'db_error', job)
-                else:
-                    thread_db.close()
-                    return ('failed', job)
-            except Exception as e:
-                thread_db.close()
-                return ('error', job, str(e))
-
-        # Use 10 workers to account for API response time (~3-5s each)
-        # Rate limiting is handled by KeyRotator, so extra workers just wait for keys
-        with ThreadPoolExecutor(max_workers=10) as executor_pool:
-            futures = {executor_pool.submit(process_single_job, job): job for job in jobs}
-
-            for future in as_completed(futures):
-                result = future.result()
-
-                with lock:
-                    completed[0] += 1
-                    if progress_callback:
-                        progress_callback(completed[0], len(jobs), f"Processed {completed[0]}/{len(jobs)}")
-
-                    if result[0] == 'success':
-                        processed[0] += 1
-                        if processed[0] % 20 == 0:
-                            app_logger.info(f"[Scheduler] LLM processed {processed[0]} jobs...")
-                    elif result[0] == 'error':
-                        failed[0] += 1
-                        app_logger.error(f"[Scheduler] LLM error for {result[1].get('title')}: {result[2]}")
-                    else:
-                        failed[0] += 1
+        # Rate limiting is handled by KeyRotator; the processor bounds requests in flight
+        stats = processor.process_jobs_batch(jobs, report_progress, db_path=db_path)
 
-        result_msg = f"Processed {processed[0]}, failed {failed[0]} of {len(jobs)}"
+        result_msg = (f"Processed {stats['processed']}, failed {stats['failed']}, "
+                      f"skipped {stats['skipped']} of {len(jobs)}")
         app_logger.info(f"[Scheduler] LLM task complete: {result_msg}")
         return result_msg
 
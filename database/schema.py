@@ -1,15 +1,110 @@
 """Database schema and operations for job scraper."""
 
 import sqlite3
+import json
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Tuple, Iterator
+from dataclasses import dataclass, asdict, field, fields
 from pathlib import Path
 from difflib import SequenceMatcher
 import re
 
-
-@dataclass
+try:
+    from rapidfuzz import fuzz
+except ImportError:  # Fall back to difflib when rapidfuzz isn't installed
+    fuzz = None
+
+
+# Bump when _migrate gains new tables, columns or indexes; stored in PRAGMA user_version
+SCHEMA_VERSION = 5
+
+# Strips punctuation before comparing titles
+_NORM_RE = re.compile(r'[^\w\s]')
+# ASCII characters _NORM_RE would strip, for the bytes.translate fast path
+_NORM_ASCII_DELETE = bytes(c for c in range(128) if _NORM_RE.match(chr(c)))
+
+
+def _normalize_title(title: str) -> str:
+    """Lowercase a title and strip punctuation for fuzzy comparison."""
+    lowered = title.lower()
+    if lowered.isascii():
+        return lowered.encode('ascii').translate(None, _NORM_ASCII_DELETE).decode('ascii')
+    return _NORM_RE.sub('', lowered)
+
+
+def _canonical_title(title: str) -> str:
+    """Normalized title with its words sorted, stored as jobs.title_norm for exact dedup."""
+    return ' '.join(sorted(_normalize_title(title).split()))
+
+
+_INSERT_JOB_SQL = """
+    INSERT OR IGNORE INTO jobs
+    (title, company, location, description, salary, job_type,
+     posted_date, url, source, scraped_at, employment_type, title_norm)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_UPDATE_DUPLICATE_SQL = """
+    UPDATE jobs SET
+        title = ?,
+        description = ?,
+        salary = ?,
+        job_type = ?,
+        posted_date = ?,
+        url = ?,
+        source = ?,
+        scraped_at = ?,
+        updated_at = CURRENT_TIMESTAMP,
+        employment_type = ?,
+        title_norm = ?
+    WHERE id = ?
+"""
+
+# Batch variant: a row whose new title collides with UNIQUE(company, title, location)
+# is left untouched instead of aborting the whole transaction
+_UPDATE_OR_IGNORE_DUPLICATE_SQL = _UPDATE_DUPLICATE_SQL.replace("UPDATE", "UPDATE OR IGNORE", 1)
+
+
+def _insert_params(job: 'JobListing') -> Tuple:
+    """Bind parameters for _INSERT_JOB_SQL."""
+    return (
+        job.title, job.company, job.location, job.description,
+        job.salary, job.job_type, job.posted_date,
+        job.url, job.source, job.scraped_at, job.employment_type,
+        _canonical_title(job.title)
+    )
+
+
+def _update_params(job: 'JobListing', job_id: int) -> Tuple:
+    """Bind parameters for _UPDATE_DUPLICATE_SQL."""
+    return (
+        job.title, job.description, job.salary, job.job_type,
+        job.posted_date, job.url, job.source, job.scraped_at,
+        job.employment_type, _canonical_title(job.title), job_id
+    )
+
+
+# Per-connection tuning applied to the writer and every reader.
+# mmap_size is an upper bound on the mapping, not an allocation.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA cache_size=-65536",      # 64 MB page cache
+    "PRAGMA temp_store=MEMORY",      # Sorts and temp B-trees stay off disk
+    "PRAGMA mmap_size=268435456",    # Map up to 256 MB of the file
+)
+
+
+def _title_ratio(norm1: str, norm2: str) -> float:
+    """Similarity ratio (0-1) between two already-normalized titles."""
+    if fuzz is not None:
+        return fuzz.ratio(norm1, norm2) / 100.0
+    return SequenceMatcher(None, norm1, norm2).ratio()
+
+
+@dataclass(slots=True)
 class JobListing:
     """Represents a job listing from any source."""
     title: str
@@ -23,6 +118,8 @@ class JobListing:
     source: str = ""  # totaljobs, indeed, etc.
     scraped_at: str = ""
     employment_type: Optional[str] = None  # permanent, contract, WHF (work from home)
+    # Set by description fetching when the listing has gone (slots need it declared)
+    _expired: bool = field(default=False, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict:
         return {
@@ -39,6 +136,12 @@ class JobListing:
             'employment_type': self.employment_type
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'JobListing':
+        """Build a listing from a to_dict()-style mapping, ignoring unknown keys (e.g. id)."""
+        names = {f.name for f in fields(cls) if f.init}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
 
 @dataclass
 class SearchConfig:
@@ -148,17 +251,117 @@ class GeneratedDocument:
         return d
 
 
+def _fts_query(search: str) -> str:
+    """Turn free-text search input into an FTS5 query: every word, as a quoted prefix."""
+    terms = search.split()
+    return ' '.join('"' + term.replace('"', '""') + '"*' for term in terms)
+
+
+# Tells the scrape_log writer thread to flush and exit
+_LOG_STOP = object()
+
+# SearchConfig field order, so rows unpack positionally
+_SEARCH_CONFIG_COLUMNS = "id, name, keywords, location, radius, employment_types, enabled, created_at, updated_at"
+
+
+class _ReaderPool:
+    """Read-only connections to one database file, shared by every JobDatabase opened on it."""
+
+    __slots__ = ('connections', 'count', 'lock')
+
+    def __init__(self):
+        self.connections: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self.count = 0  # Connections opened so far, checked out or idle
+        self.lock = threading.Lock()
+
+
 class JobDatabase:
     """SQLite database for storing and analyzing job listings."""
 
+    # Maximum read-only connections per database file (opened on demand)
+    READER_POOL_SIZE = 4
+
+    # Reader pools keyed by resolved database path; shared across instances
+    # since the API opens a JobDatabase per request
+    _reader_pools: Dict[str, _ReaderPool] = {}
+    _reader_pools_lock = threading.Lock()
+
+    # Sources reported by get_rate_limit_status
+    SCRAPE_SOURCES = ('totaljobs', 'reed', 'cvlibrary', 'indeed')
+
+    # Background scrape_log writer: max rows per transaction and max wait to fill one
+    LOG_BATCH_SIZE = 64
+    LOG_FLUSH_INTERVAL = 1.0
+
+    # Batch writes at least this large trigger a passive WAL checkpoint
+    CHECKPOINT_BATCH_SIZE = 200
+
+    # update_job SQL keyed by the set of updated columns; shared across instances
+    # since the API opens a JobDatabase per request
+    _update_stmt_cache: Dict[frozenset, Tuple[str, Tuple[str, ...]]] = {}
+
     def __init__(self, db_path: str = "jobs.db"):
         self.db_path = db_path
-        self.conn = None
+        self.conn = None  # The single writer connection
+        self._readers: Optional[_ReaderPool] = None  # Looked up on first read
+        self._fts_available: Optional[bool] = None
+        # Tag name -> tags.id for names this connection has already written
+        self._tag_ids: Dict[str, int] = {}
+        # scrape_log writes go through a queue drained by a thread started on first use
+        self._log_q: "queue.Queue" = queue.Queue()
+        self._log_thread: Optional[threading.Thread] = None
+        self._log_lock = threading.Lock()
         self._init_db()
 
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection; WAL lets it read while the writer commits."""
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, timeout=60.0, check_same_thread=False,
+                               cached_statements=512)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout=60000")
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _reader(self):
+        """Check out a read-only connection from the pool for SELECT-only work."""
+        if self.db_path == ':memory:':
+            # A separate connection would see a different in-memory database
+            yield self.conn
+            return
+
+        pool = self._readers
+        if pool is None:
+            key = str(Path(self.db_path).resolve())
+            with JobDatabase._reader_pools_lock:
+                pool = JobDatabase._reader_pools.setdefault(key, _ReaderPool())
+            self._readers = pool
+
+        try:
+            conn = pool.connections.get_nowait()
+        except queue.Empty:
+            with pool.lock:
+                can_open = pool.count < self.READER_POOL_SIZE
+                if can_open:
+                    pool.count += 1
+            try:
+                conn = self._open_reader() if can_open else pool.connections.get()
+            except Exception:
+                if can_open:
+                    with pool.lock:
+                        pool.count -= 1
+                raise
+
+        try:
+            yield conn
+        finally:
+            pool.connections.put(conn)
+
     def _init_db(self):
         """Initialize database schema."""
-        self.conn = sqlite3.connect(self.db_path, timeout=60.0)
+        self.conn = sqlite3.connect(self.db_path, timeout=60.0, cached_statements=512)
         self.conn.row_factory = sqlite3.Row
 
         # Enable WAL mode for better concurrent access
@@ -168,7 +371,20 @@ class JobDatabase:
         # Synchronous NORMAL is safer than OFF but faster than FULL
         self.conn.execute("PRAGMA synchronous=NORMAL")
         self.conn.execute("PRAGMA foreign_keys=ON")
+        for pragma in _CONNECTION_PRAGMAS:
+            self.conn.execute(pragma)
+        # Checkpoint every ~1000 WAL pages so large write bursts don't stall on one big checkpoint
+        self.conn.execute("PRAGMA wal_autocheckpoint=1000")
+
+        # Schema setup only runs when the file is older than this code
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < SCHEMA_VERSION:
+            self._migrate()
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            self.conn.commit()
 
+    def _migrate(self):
+        """Create tables and indexes, apply column migrations and seed defaults."""
         # Jobs table with edit tracking
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS jobs (
@@ -217,6 +433,20 @@ class JobDatabase:
             except sqlite3.OperationalError:
                 pass  # Column already exists
 
+        # Migration: canonical title key for exact-match dedup
+        try:
+            self.conn.execute("ALTER TABLE jobs ADD COLUMN title_norm TEXT")
+            self.conn.commit()
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        rows = self.conn.execute("SELECT id, title FROM jobs WHERE title_norm IS NULL").fetchall()
+        if rows:
+            self.conn.executemany(
+                "UPDATE jobs SET title_norm = ? WHERE id = ?",
+                [(_canonical_title(row['title']), row['id']) for row in rows]
+            )
+            self.conn.commit()
+
         # Search configs table
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS search_configs (
@@ -247,6 +477,38 @@ class JobDatabase:
             )
         """)
 
+        # LLM results keyed by a hash of the job description, shared across runs
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                hash BLOB PRIMARY KEY,
+                result TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Normalized copy of jobs.tags: one row per distinct tag, one link per job/tag pair
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS tags (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE COLLATE NOCASE
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS job_tags (
+                job_id INTEGER NOT NULL,
+                tag_id INTEGER NOT NULL,
+                PRIMARY KEY (job_id, tag_id),
+                FOREIGN KEY (job_id) REFERENCES jobs(id) ON DELETE CASCADE,
+                FOREIGN KEY (tag_id) REFERENCES tags(id)
+            ) WITHOUT ROWID
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_job_tags_tag ON job_tags(tag_id);")
+        # Backfill from tags written before job_tags existed
+        if self.conn.execute("SELECT 1 FROM job_tags LIMIT 1").fetchone() is None:
+            self._write_job_tags(self.conn.execute(
+                "SELECT id, tags FROM jobs WHERE tags IS NOT NULL AND tags != '[]'"
+            ).fetchall())
+
         # Indexes for performance
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_source ON jobs(source);")
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_location ON jobs(location);")
@@ -254,6 +516,20 @@ class JobDatabase:
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_status ON jobs(status);")
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_employment_type ON jobs(employment_type);")
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_scraped_at ON jobs(scraped_at DESC);")
+        # Dedup lookups: exact (company, location, title_norm) probes, and the
+        # (company, location) prefix for the fuzzy fallback
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_title_norm ON jobs(company, location, title_norm);")
+        self.conn.execute("DROP INDEX IF EXISTS idx_company_location;")  # Superseded by idx_title_norm
+        # Partial index covering only the LLM backlog, ordered the way it is consumed
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_llm_pending ON jobs(scraped_at DESC)
+            WHERE has_full_description = 1 AND (llm_processed = 0 OR llm_processed IS NULL)
+        """)
+        # Per-source scrape counts over a recent time window
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_scrape_source_time ON scrape_log(source, started_at DESC);")
+
+        # Full-text search index over jobs, kept in sync by triggers
+        self._create_fts()
 
         # User CV table
         self.conn.execute("""
@@ -329,6 +605,56 @@ class JobDatabase:
         # Create default search configurations
         self._create_default_configs()
 
+    def _create_fts(self):
+        """Create the jobs_fts external-content FTS5 table and its sync triggers."""
+        exists = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+        ).fetchone()
+        try:
+            self.conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                    title, description, company,
+                    content='jobs', content_rowid='id',
+                    tokenize='porter unicode61'
+                )
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+                    INSERT INTO jobs_fts(rowid, title, description, company)
+                    VALUES (new.id, new.title, new.description, new.company);
+                END
+            """)
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+                    INSERT INTO jobs_fts(jobs_fts, rowid, title, description, company)
+                    VALUES ('delete', old.id, old.title, old.description, old.company);
+                END
+            """)
+            # Only text edits touch the index; status/flag updates skip it
+            self.conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF title, description, company ON jobs BEGIN
+                    INSERT INTO jobs_fts(jobs_fts, rowid, title, description, company)
+                    VALUES ('delete', old.id, old.title, old.description, old.company);
+                    INSERT INTO jobs_fts(rowid, title, description, company)
+                    VALUES (new.id, new.title, new.description, new.company);
+                END
+            """)
+            if not exists:
+                # Index rows that predate the FTS table
+                self.conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+            self.conn.commit()
+        except sqlite3.OperationalError as e:
+            self.conn.rollback()
+            print(f"FTS5 unavailable, search will use LIKE: {e}")
+
+    def _has_fts(self) -> bool:
+        """Whether the jobs_fts index exists in this database."""
+        if self._fts_available is None:
+            self._fts_available = self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+            ).fetchone() is not None
+        return self._fts_available
+
     def _create_default_configs(self):
         """Create default search configurations if they don't exist."""
         # Check if configs already exist to avoid unnecessary writes
@@ -351,47 +677,93 @@ class JobDatabase:
             {'name': 'AI DevOps - Manchester', 'keywords': 'ai devops', 'location': 'Manchester', 'radius': 10, 'employment_types': 'contract,permanent'},
         ]
 
-        for config_data in default_configs:
-            # Use INSERT OR IGNORE to atomically handle duplicates
-            self.conn.execute("""
-                INSERT OR IGNORE INTO search_configs (name, keywords, location, radius, employment_types, enabled)
-                VALUES (?, ?, ?, ?, ?, 1)
-            """, (
-                config_data['name'],
-                config_data['keywords'],
-                config_data['location'],
-                config_data['radius'],
-                config_data['employment_types']
-            ))
+        # Use INSERT OR IGNORE to atomically handle duplicates
+        self.conn.executemany("""
+            INSERT OR IGNORE INTO search_configs (name, keywords, location, radius, employment_types, enabled)
+            VALUES (?, ?, ?, ?, ?, 1)
+        """, [
+            (c['name'], c['keywords'], c['location'], c['radius'], c['employment_types'])
+            for c in default_configs
+        ])
 
         self.conn.commit()
 
     def _similarity_score(self, str1: str, str2: str) -> float:
         """Calculate string similarity score (0-1)."""
-        # Normalize strings
-        s1 = re.sub(r'[^\w\s]', '', str1.lower())
-        s2 = re.sub(r'[^\w\s]', '', str2.lower())
-        return SequenceMatcher(None, s1, s2).ratio()
+        return _title_ratio(_normalize_title(str1), _normalize_title(str2))
 
-    def _find_duplicate(self, job: JobListing) -> Optional[Dict]:
-        """Find potential duplicate based on company + title + location."""
-        cursor = self.conn.execute("""
-            SELECT id, title, company, location, is_edited
-            FROM jobs
-            WHERE company = ? AND location = ?
-        """, (job.company, job.location))
+    def _find_duplicate(self, job: JobListing,
+                        dedup_index: Optional[Dict[Tuple[str, str], List[Dict]]] = None) -> Optional[Dict]:
+        """
+        Find potential duplicate based on company + title + location.
+        An exact title_norm match wins; fuzzy title similarity is the fallback.
+        Returns a sqlite3.Row, or the mutable index entry when dedup_index is given.
+        """
+        job_title_fuzzy = _normalize_title(job.title)
+        job_title_norm = ' '.join(sorted(job_title_fuzzy.split()))
+
+        if dedup_index is not None:
+            candidates = dedup_index.get((job.company, job.location), [])
+            for candidate in candidates:
+                if candidate['title_norm'] == job_title_norm:
+                    return candidate
+        else:
+            row = self.conn.execute("""
+                SELECT id, title, company, location, is_edited
+                FROM jobs
+                WHERE company = ? AND location = ? AND title_norm = ?
+                LIMIT 1
+            """, (job.company, job.location, job_title_norm)).fetchone()
+            if row:
+                return row
 
-        for row in cursor.fetchall():
-            row_dict = dict(row)
-            title_similarity = self._similarity_score(job.title, row_dict['title'])
+            cursor = self.conn.execute("""
+                SELECT id, title, company, location, is_edited
+                FROM jobs
+                WHERE company = ? AND location = ?
+            """, (job.company, job.location))
+            # Rows support ['id'] / ['is_edited'] access, so return them as-is
+            for row in cursor:
+                if _title_ratio(job_title_fuzzy, _normalize_title(row['title'])) > 0.85:
+                    return row
+            return None
+
+        for candidate in candidates:
+            title_similarity = _title_ratio(job_title_fuzzy, candidate['title_fuzzy'])
             if title_similarity > 0.85:  # High similarity threshold
-                return row_dict
+                return candidate
         return None
 
-    def insert_job(self, job: JobListing) -> Tuple[bool, str]:
+    def _build_dedup_index(self, jobs: List[JobListing]) -> Dict[Tuple[str, str], List[Dict]]:
+        """
+        Load existing rows for the batch's companies into a dict keyed by
+        (company, location), so each dedup lookup is a hash probe instead of a query.
+        """
+        index: Dict[Tuple[str, str], List[Dict]] = {}
+        companies = list({job.company for job in jobs})
+
+        # Stay well under SQLite's bound-parameter limit
+        chunk_size = 500
+        for start in range(0, len(companies), chunk_size):
+            chunk = companies[start:start + chunk_size]
+            placeholders = ', '.join('?' * len(chunk))
+            cursor = self.conn.execute(f"""
+                SELECT id, title, company, location, is_edited, title_norm
+                FROM jobs
+                WHERE company IN ({placeholders})
+            """, chunk)
+            for row in cursor:
+                index.setdefault((row['company'], row['location']), []).append(
+                    dict(row, title_fuzzy=_normalize_title(row['title'])))
+
+        return index
+
+    def insert_job(self, job: JobListing, commit: bool = True) -> Tuple[bool, str]:
         """
         Insert a job listing with smart deduplication.
         Returns (success: bool, message: str).
+
+        Pass commit=False when the caller manages the surrounding transaction.
         """
         try:
             # Check for existing edited duplicate
@@ -403,39 +775,15 @@ class JobDatabase:
                     return False, "Skipped (duplicate of edited entry)"
                 else:
                     # Update existing unedited entry
-                    self.conn.execute("""
-                        UPDATE jobs SET
-                            title = ?,
-                            description = ?,
-                            salary = ?,
-                            job_type = ?,
-                            posted_date = ?,
-                            url = ?,
-                            source = ?,
-                            scraped_at = ?,
-                            updated_at = CURRENT_TIMESTAMP,
-                            employment_type = ?
-                        WHERE id = ?
-                    """, (
-                        job.title, job.description, job.salary, job.job_type,
-                        job.posted_date, job.url, job.source, job.scraped_at,
-                        job.employment_type, duplicate['id']
-                    ))
-                    self.conn.commit()
+                    self.conn.execute(_UPDATE_DUPLICATE_SQL, _update_params(job, duplicate['id']))
+                    if commit:
+                        self.conn.commit()
                     return True, "Updated existing duplicate"
 
             # No duplicate found, insert new
-            self.conn.execute("""
-                INSERT OR IGNORE INTO jobs
-                (title, company, location, description, salary, job_type,
-                 posted_date, url, source, scraped_at, employment_type)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                job.title, job.company, job.location, job.description,
-                job.salary, job.job_type, job.posted_date,
-                job.url, job.source, job.scraped_at, job.employment_type
-            ))
-            self.conn.commit()
+            self.conn.execute(_INSERT_JOB_SQL, _insert_params(job))
+            if commit:
+                self.conn.commit()
             return True, "Added new job"
 
         except sqlite3.IntegrityError:
@@ -444,12 +792,111 @@ class JobDatabase:
             print(f"Error inserting job: {e}")
             return False, f"Error: {e}"
 
+    def insert_jobs(self, jobs: List[JobListing]) -> List[Tuple[bool, str]]:
+        """
+        Insert multiple jobs with smart deduplication in a single transaction.
+        Returns a (success, message) tuple per job, in input order.
+        """
+        return self._insert_jobs(jobs)
+
+    def _insert_jobs(self, jobs: List[JobListing], defer_indexes: bool = False) -> List[Tuple[bool, str]]:
+        """
+        Shared body of insert_jobs and bulk_import. With defer_indexes, the
+        secondary jobs indexes are dropped around the bulk INSERT and rebuilt
+        once at the end, inside the same transaction.
+        """
+        results: List[Tuple[bool, str]] = []
+        insert_rows: List[Tuple] = []
+        update_rows: List[Tuple] = []
+
+        # One BEGIN/COMMIT for the whole batch instead of a commit per row
+        if not self.conn.in_transaction:
+            self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            dedup_index = self._build_dedup_index(jobs)
+
+            # Partition the batch, then write the inserts with one executemany
+            for job in jobs:
+                duplicate = self._find_duplicate(job, dedup_index)
+
+                if duplicate is None:
+                    # Queue the insert and make it visible to later jobs in the batch
+                    dedup_index.setdefault((job.company, job.location), []).append({
+                        'id': None, 'title': job.title, 'company': job.company,
+                        'location': job.location, 'is_edited': 0,
+                        'title_norm': _canonical_title(job.title),
+                        'title_fuzzy': _normalize_title(job.title),
+                        'pending_row': len(insert_rows),
+                    })
+                    insert_rows.append(_insert_params(job))
+                    results.append((True, "Added new job"))
+                elif duplicate['is_edited']:
+                    # Don't overwrite user-edited entries
+                    results.append((False, "Skipped (duplicate of edited entry)"))
+                else:
+                    if duplicate['id'] is None:
+                        # Duplicate of a row queued earlier in this batch: the later job wins
+                        insert_rows[duplicate['pending_row']] = _insert_params(job)
+                    else:
+                        update_rows.append((len(results), _update_params(job, duplicate['id'])))
+                    duplicate['title'] = job.title
+                    duplicate['title_norm'] = _canonical_title(job.title)
+                    duplicate['title_fuzzy'] = _normalize_title(job.title)
+                    results.append((True, "Updated existing duplicate"))
+
+            if insert_rows:
+                deferred = self._drop_secondary_indexes() if defer_indexes else []
+                self.conn.executemany(_INSERT_JOB_SQL, insert_rows)
+                for index_sql in deferred:
+                    self.conn.execute(index_sql)
+            for position, params in update_rows:
+                # rowcount is 0 when OR IGNORE skipped the row on a UNIQUE conflict
+                if self.conn.execute(_UPDATE_OR_IGNORE_DUPLICATE_SQL, params).rowcount == 0:
+                    results[position] = (False, "Duplicate (exact match)")
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            print(f"Error inserting jobs batch: {e}")
+            return [(False, f"Error: {e}")] * len(jobs)
+        except Exception:
+            self.conn.rollback()
+            raise
+
+        return results
+
+    def _drop_secondary_indexes(self) -> List[str]:
+        """
+        Drop the jobs table's explicit indexes and return their CREATE statements.
+        The UNIQUE(company, title, location) autoindex can't be dropped and stays.
+        """
+        rows = self.conn.execute("""
+            SELECT name, sql FROM sqlite_master
+            WHERE type = 'index' AND tbl_name = 'jobs' AND sql IS NOT NULL
+        """).fetchall()
+        for row in rows:
+            self.conn.execute(f"DROP INDEX {row['name']}")
+        return [row['sql'] for row in rows]
+
+    def bulk_import(self, jobs: List[JobListing]) -> Dict[str, int]:
+        """
+        Insert a large batch (e.g. an initial scrape import) with index
+        maintenance deferred until all rows are written. Dedup runs in Python
+        first, exactly as in insert_jobs_batch. Returns stats dict.
+
+        Rebuilding every secondary index costs a full pass over the table, so
+        only use this when the batch is large relative to what is stored.
+        """
+        return self.tally_insert_results(self._insert_jobs(jobs, defer_indexes=True))
+
     def insert_jobs_batch(self, jobs: List[JobListing]) -> Dict[str, int]:
-        """Insert multiple jobs. Returns stats dict."""
+        """Insert multiple jobs in a single transaction. Returns stats dict."""
+        return self.tally_insert_results(self.insert_jobs(jobs))
+
+    def tally_insert_results(self, results: List[Tuple[bool, str]]) -> Dict[str, int]:
+        """Count (success, message) results from insert_jobs by outcome, as insert_jobs_batch reports them."""
         stats = {'added': 0, 'updated': 0, 'skipped': 0, 'errors': 0}
 
-        for job in jobs:
-            success, message = self.insert_job(job)
+        for success, message in results:
             if 'Added' in message:
                 stats['added'] += 1
             elif 'Updated' in message:
@@ -463,88 +910,128 @@ class JobDatabase:
 
     def get_job(self, job_id: int) -> Optional[Dict]:
         """Get a single job by ID."""
-        cursor = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        with self._reader() as conn:
+            cursor = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
 
-    def get_jobs(self, filters: Optional[Dict] = None, limit: int = 100, offset: int = 0) -> List[Dict]:
-        """Retrieve jobs with optional filters and pagination."""
-        query = "SELECT * FROM jobs WHERE 1=1"
+    def _build_where(self, filters: Optional[Dict]) -> Tuple[str, List]:
+        """Build the WHERE clause and parameters shared by the job listing queries."""
+        where = "1=1"
         params = []
 
         if filters:
             if filters.get('source'):
-                query += " AND source = ?"
+                where += " AND source = ?"
                 params.append(filters['source'])
             if filters.get('location'):
-                query += " AND location LIKE ?"
+                where += " AND location LIKE ?"
                 params.append(f"%{filters['location']}%")
             if filters.get('company'):
-                query += " AND company LIKE ?"
+                where += " AND company LIKE ?"
                 params.append(f"%{filters['company']}%")
             if filters.get('status'):
-                query += " AND status = ?"
+                where += " AND status = ?"
                 params.append(filters['status'])
             if filters.get('employment_type'):
-                query += " AND employment_type = ?"
+                where += " AND employment_type = ?"
                 params.append(filters['employment_type'])
             if filters.get('is_applied') is not None:
-                query += " AND is_applied = ?"
+                where += " AND is_applied = ?"
                 params.append(filters['is_applied'])
             if filters.get('search'):
-                query += " AND (title LIKE ? OR description LIKE ? OR company LIKE ?)"
-                search_term = f"%{filters['search']}%"
-                params.extend([search_term, search_term, search_term])
+                match = _fts_query(filters['search'])
+                if self._has_fts() and match:
+                    where += " AND id IN (SELECT rowid FROM jobs_fts WHERE jobs_fts MATCH ?)"
+                    params.append(match)
+                else:
+                    where += " AND (title LIKE ? OR description LIKE ? OR company LIKE ?)"
+                    search_term = f"%{filters['search']}%"
+                    params.extend([search_term, search_term, search_term])
+            if filters.get('tag'):
+                where += " AND id IN (SELECT job_id FROM job_tags JOIN tags ON tags.id = job_tags.tag_id WHERE tags.name = ?)"
+                params.append(filters['tag'])
+
+        return where, params
 
-        query += " ORDER BY scraped_at DESC LIMIT ? OFFSET ?"
+    def get_jobs(self, filters: Optional[Dict] = None, limit: int = 100, offset: int = 0) -> List[Dict]:
+        """Retrieve jobs with optional filters and pagination."""
+        return list(self.get_jobs_iter(filters, limit, offset))
+
+    def get_jobs_iter(self, filters: Optional[Dict] = None, limit: int = 100, offset: int = 0) -> Iterator[Dict]:
+        """Like get_jobs, but yields rows as they are read instead of building a list."""
+        where, params = self._build_where(filters)
+        query = f"SELECT * FROM jobs WHERE {where} ORDER BY scraped_at DESC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
 
-        cursor = self.conn.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        with self._reader() as conn:
+            for row in conn.execute(query, params):
+                yield dict(row)
 
     def get_jobs_count(self, filters: Optional[Dict] = None) -> int:
         """Get total count of jobs matching filters."""
-        query = "SELECT COUNT(*) as count FROM jobs WHERE 1=1"
-        params = []
+        where, params = self._build_where(filters)
 
-        if filters:
-            if filters.get('source'):
-                query += " AND source = ?"
-                params.append(filters['source'])
-            if filters.get('location'):
-                query += " AND location LIKE ?"
-                params.append(f"%{filters['location']}%")
-            if filters.get('company'):
-                query += " AND company LIKE ?"
-                params.append(f"%{filters['company']}%")
-            if filters.get('status'):
-                query += " AND status = ?"
-                params.append(filters['status'])
-            if filters.get('employment_type'):
-                query += " AND employment_type = ?"
-                params.append(filters['employment_type'])
-            if filters.get('search'):
-                query += " AND (title LIKE ? OR description LIKE ? OR company LIKE ?)"
-                search_term = f"%{filters['search']}%"
-                params.extend([search_term, search_term, search_term])
+        with self._reader() as conn:
+            cursor = conn.execute(f"SELECT COUNT(*) as count FROM jobs WHERE {where}", params)
+            return cursor.fetchone()['count']
 
-        cursor = self.conn.execute(query, params)
-        return cursor.fetchone()['count']
+    def get_jobs_paged(self, filters: Optional[Dict] = None, limit: int = 100,
+                       offset: int = 0) -> Tuple[List[Dict], int]:
+        """
+        Retrieve a page of jobs together with the total match count in one query.
+        Returns (jobs, total).
+        """
+        where, params = self._build_where(filters)
+        query = f"""
+            SELECT *, COUNT(*) OVER () AS _total FROM jobs
+            WHERE {where}
+            ORDER BY scraped_at DESC LIMIT ? OFFSET ?
+        """
+        params.extend([limit, offset])
+
+        with self._reader() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        if not rows:
+            # An empty page carries no window total; only count if past the first page
+            return [], self.get_jobs_count(filters) if offset else 0
+
+        total = rows[0]['_total']
+        jobs = []
+        for row in rows:
+            job = dict(row)
+            del job['_total']
+            jobs.append(job)
+        return jobs, total
 
     def update_job(self, job_id: int, updates: Dict) -> bool:
         """Update a job and mark as edited."""
         try:
-            # Build set clause and values from updates BEFORE modifying the dict
-            set_clause = ", ".join(f"{k} = ?" for k in updates.keys())
-            values = list(updates.values())
+            if 'title' in updates:
+                # Keep the dedup key in step with edited titles
+                updates = dict(updates, title_norm=_canonical_title(updates['title']))
+
+            # Reuse the statement built for this set of columns; sqlite3's own
+            # statement cache then skips re-preparing it
+            key = frozenset(updates.keys())
+            cached = self._update_stmt_cache.get(key)
+            if cached is None:
+                columns = tuple(sorted(key))
+                set_clause = ", ".join(f"{k} = ?" for k in columns)
+                query = f"UPDATE jobs SET {set_clause}, is_edited = 1, updated_at = ? WHERE id = ?"
+            else:
+                query, columns = cached
 
-            # Add is_edited and updated_at to the query
-            query = f"UPDATE jobs SET {set_clause}, is_edited = 1, updated_at = ? WHERE id = ?"
+            values = [updates[k] for k in columns]
             values.append(datetime.utcnow().isoformat())  # for updated_at
             values.append(job_id)  # for WHERE id = ?
 
             self.conn.execute(query, values)
             self.conn.commit()
+            # Only cache statements that prepared successfully
+            if cached is None:
+                self._update_stmt_cache[key] = (query, columns)
             return True
         except sqlite3.Error as e:
             print(f"Error updating job: {e}")
@@ -581,39 +1068,58 @@ class JobDatabase:
 
     def get_stats(self) -> Dict:
         """Get comprehensive statistics about stored jobs."""
-        cursor = self.conn.execute("""
-            SELECT
-                COUNT(*) as total,
-                COUNT(DISTINCT source) as sources,
-                COUNT(DISTINCT company) as companies,
-                COUNT(CASE WHEN is_applied = 1 THEN 1 END) as applied,
-                COUNT(CASE WHEN is_edited = 1 THEN 1 END) as edited,
-                COUNT(CASE WHEN status = 'interested' THEN 1 END) as interested,
-                COUNT(CASE WHEN status = 'applied' THEN 1 END) as status_applied,
-                COUNT(CASE WHEN status = 'interviewing' THEN 1 END) as interviewing,
-                COUNT(CASE WHEN employment_type = 'contract' THEN 1 END) as contract,
-                COUNT(CASE WHEN employment_type = 'permanent' THEN 1 END) as permanent,
-                COUNT(CASE WHEN employment_type = 'WHF' OR location LIKE '%Remote%' THEN 1 END) as remote
-            FROM jobs
-        """)
-        return dict(cursor.fetchone())
+        with self._reader() as conn:
+            totals = conn.execute("""
+                SELECT
+                    COUNT(*) as total,
+                    COUNT(DISTINCT source) as sources,
+                    COUNT(DISTINCT company) as companies,
+                    COALESCE(SUM(is_applied = 1), 0) as applied,
+                    COALESCE(SUM(is_edited = 1), 0) as edited,
+                    COALESCE(SUM(employment_type = 'WHF' OR location LIKE '%Remote%'), 0) as remote
+                FROM jobs
+            """).fetchone()
+            # Grouped counts are answered from idx_status / idx_employment_type alone
+            by_status = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall())
+            by_employment_type = dict(conn.execute(
+                "SELECT employment_type, COUNT(*) FROM jobs GROUP BY employment_type"
+            ).fetchall())
+
+        return {
+            'total': totals['total'],
+            'sources': totals['sources'],
+            'companies': totals['companies'],
+            'applied': totals['applied'],
+            'edited': totals['edited'],
+            'interested': by_status.get('interested', 0),
+            'status_applied': by_status.get('applied', 0),
+            'interviewing': by_status.get('interviewing', 0),
+            'contract': by_employment_type.get('contract', 0),
+            'permanent': by_employment_type.get('permanent', 0),
+            'remote': totals['remote'],
+        }
 
     # Search Config Methods
     def get_search_configs(self, enabled_only: bool = False) -> List[SearchConfig]:
         """Get all search configurations."""
-        query = "SELECT * FROM search_configs"
+        query = f"SELECT {_SEARCH_CONFIG_COLUMNS} FROM search_configs"
         if enabled_only:
             query += " WHERE enabled = 1"
         query += " ORDER BY name"
 
-        cursor = self.conn.execute(query)
-        return [SearchConfig(**dict(row)) for row in cursor.fetchall()]
+        with self._reader() as conn:
+            cursor = conn.execute(query)
+            return [SearchConfig(*row) for row in cursor.fetchall()]
 
     def get_search_config(self, config_id: int) -> Optional[SearchConfig]:
         """Get a single search configuration."""
-        cursor = self.conn.execute("SELECT * FROM search_configs WHERE id = ?", (config_id,))
-        row = cursor.fetchone()
-        return SearchConfig(**dict(row)) if row else None
+        with self._reader() as conn:
+            cursor = conn.execute(f"SELECT {_SEARCH_CONFIG_COLUMNS} FROM search_configs WHERE id = ?",
+                                  (config_id,))
+            row = cursor.fetchone()
+            return SearchConfig(*row) if row else None
 
     def create_search_config(self, config: SearchConfig) -> SearchConfig:
         """Create a new search configuration."""
@@ -652,44 +1158,116 @@ class JobDatabase:
     # Scrape Log Methods
     def log_scrape(self, source: str, config_id: Optional[int], jobs_found: int, jobs_added: int,
                    success: bool = True, error_message: str = None):
-        """Log a scraping run."""
-        self.conn.execute("""
-            INSERT INTO scrape_log (source, search_config_id, jobs_found, jobs_added, completed_at, success, error_message)
-            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, ?, ?)
-        """, (source, config_id, jobs_found, jobs_added, success, error_message))
-        self.conn.commit()
+        """Log a scraping run. The row is written by a background thread; close() flushes it."""
+        if self.db_path == ':memory:':
+            # The writer thread's own connection would see a different database
+            self._write_scrape_logs(self.conn, [
+                (source, config_id, jobs_found, jobs_added, success, error_message, time.time())
+            ])
+            return
+
+        with self._log_lock:
+            if self._log_thread is None:
+                self._log_thread = threading.Thread(
+                    target=self._log_drain, name='scrape-log-writer', daemon=True
+                )
+                self._log_thread.start()
+        self._log_q.put((source, config_id, jobs_found, jobs_added, success, error_message, time.time()))
+
+    def _write_scrape_logs(self, conn: sqlite3.Connection, items: List[Tuple]):
+        """Insert queued log entries in one transaction, stamped with their enqueue time."""
+        with conn:
+            conn.executemany("""
+                INSERT INTO scrape_log (source, search_config_id, jobs_found, jobs_added,
+                                        started_at, completed_at, success, error_message)
+                VALUES (?, ?, ?, ?, datetime(?, 'unixepoch'), datetime(?, 'unixepoch'), ?, ?)
+            """, [
+                (source, config_id, found, added, logged_at, logged_at, success, error)
+                for source, config_id, found, added, success, error, logged_at in items
+            ])
+
+    def _log_drain(self):
+        """Writer thread: batch queued scrape_log rows on a dedicated connection."""
+        conn = sqlite3.connect(self.db_path, timeout=60.0)
+        conn.execute("PRAGMA busy_timeout=60000")
+        try:
+            stop = False
+            while not stop:
+                batch = [self._log_q.get()]
+                deadline = time.monotonic() + self.LOG_FLUSH_INTERVAL
+                while len(batch) < self.LOG_BATCH_SIZE and batch[-1] is not _LOG_STOP:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(self._log_q.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+
+                stop = batch[-1] is _LOG_STOP
+                items = [item for item in batch if item is not _LOG_STOP]
+                if items:
+                    try:
+                        self._write_scrape_logs(conn, items)
+                    except sqlite3.Error as e:
+                        print(f"Error writing scrape log: {e}")
+                for _ in batch:
+                    self._log_q.task_done()
+        finally:
+            conn.close()
+
+    def _flush_scrape_log(self):
+        """Block until every queued scrape_log row has been written."""
+        if self._log_thread is not None:
+            self._log_q.join()
 
     def get_recent_scrape_log(self, limit: int = 20) -> List[Dict]:
         """Get recent scraping logs."""
-        cursor = self.conn.execute("""
-            SELECT * FROM scrape_log ORDER BY started_at DESC LIMIT ?
-        """, (limit,))
-        return [dict(row) for row in cursor.fetchall()]
+        return list(self.get_recent_scrape_log_iter(limit))
+
+    def get_recent_scrape_log_iter(self, limit: int = 20) -> Iterator[Dict]:
+        """Like get_recent_scrape_log, but yields rows as they are read."""
+        self._flush_scrape_log()
+        with self._reader() as conn:
+            cursor = conn.execute("""
+                SELECT * FROM scrape_log ORDER BY started_at DESC LIMIT ?
+            """, (limit,))
+            for row in cursor:
+                yield dict(row)
 
     def get_scrape_count_last_hour(self, source: str) -> int:
         """Check how many scrapes for this source in the last hour (for rate limiting)."""
-        cursor = self.conn.execute("""
-            SELECT COUNT(*) as count FROM scrape_log
-            WHERE source = ? AND started_at >= datetime('now', '-1 hour')
-        """, (source,))
-        return cursor.fetchone()['count']
+        self._flush_scrape_log()
+        with self._reader() as conn:
+            cursor = conn.execute("""
+                SELECT COUNT(*) as count FROM scrape_log
+                WHERE source = ? AND started_at >= datetime('now', '-1 hour')
+            """, (source,))
+            return cursor.fetchone()['count']
 
     def get_rate_limit_status(self) -> Dict:
         """Get scrape status for all sources (rate limiting disabled - scrapers have built-in delays)."""
-        sources = ['totaljobs', 'reed', 'cvlibrary', 'indeed']
+        self._flush_scrape_log()
+        placeholders = ','.join('?' * len(self.SCRAPE_SOURCES))
+        with self._reader() as conn:
+            counts = dict(conn.execute(f"""
+                SELECT source, COUNT(*) FROM scrape_log
+                WHERE source IN ({placeholders}) AND started_at >= datetime('now', '-1 hour')
+                GROUP BY source
+            """, self.SCRAPE_SOURCES).fetchall())
         status = {}
-        for source in sources:
-            count = self.get_scrape_count_last_hour(source)
+        for source in self.SCRAPE_SOURCES:
             # Rate limiting disabled - scrapers have built-in delays between requests
             # Just tracking counts for informational purposes
             status[source] = {
-                'count': count,
+                'count': counts.get(source, 0),
                 'limited': False  # No arbitrary limits
             }
         return status
 
     def reset_rate_limit(self, source: str = None) -> int:
         """Reset rate limit by clearing recent scrape logs. Returns number of entries cleared."""
+        self._flush_scrape_log()
         if source:
             cursor = self.conn.execute("""
                 DELETE FROM scrape_log
@@ -705,8 +1283,13 @@ class JobDatabase:
 
     def get_jobs_needing_descriptions(self, limit: int = 100, source: str = None) -> List[JobListing]:
         """Get jobs that don't have full descriptions yet (excluding expired)."""
+        return list(self.get_jobs_needing_descriptions_iter(limit, source))
+
+    def get_jobs_needing_descriptions_iter(self, limit: int = 100, source: str = None) -> Iterator[JobListing]:
+        """Like get_jobs_needing_descriptions, but yields jobs as rows are read."""
+        # Columns are listed in JobListing field order so rows unpack positionally
         query = """
-            SELECT id, title, company, location, description, salary, job_type,
+            SELECT title, company, location, description, salary, job_type,
                    posted_date, url, source, scraped_at, employment_type
             FROM jobs
             WHERE (has_full_description = 0 OR has_full_description IS NULL)
@@ -723,26 +1306,10 @@ class JobDatabase:
         query += " ORDER BY scraped_at DESC LIMIT ?"
         params.append(limit)
 
-        cursor = self.conn.execute(query, params)
-
-        jobs = []
-        for row in cursor.fetchall():
-            job_dict = dict(row)
-            jobs.append(JobListing(
-                title=job_dict['title'],
-                company=job_dict['company'],
-                location=job_dict['location'],
-                description=job_dict['description'],
-                salary=job_dict.get('salary'),
-                job_type=job_dict.get('job_type'),
-                posted_date=job_dict.get('posted_date'),
-                url=job_dict['url'],
-                source=job_dict['source'],
-                scraped_at=job_dict['scraped_at'],
-                employment_type=job_dict.get('employment_type')
-            ))
-
-        return jobs
+        # Read through the pool so callers can write back while still iterating
+        with self._reader() as conn:
+            for row in conn.execute(query, params):
+                yield JobListing(*row)
 
     def mark_job_expired(self, job_id: int) -> bool:
         """Mark a job as expired (listing no longer available)."""
@@ -766,25 +1333,26 @@ class JobDatabase:
 
     def get_partial_description_count(self) -> Dict:
         """Get count of jobs needing full descriptions by source (excluding expired)."""
-        cursor = self.conn.execute("""
-            SELECT source, COUNT(*) as count
-            FROM jobs
-            WHERE (has_full_description = 0 OR has_full_description IS NULL)
-            AND (is_expired = 0 OR is_expired IS NULL)
-            AND url IS NOT NULL AND url != ''
-            GROUP BY source
-        """)
-        result = {row['source']: row['count'] for row in cursor.fetchall()}
+        with self._reader() as conn:
+            cursor = conn.execute("""
+                SELECT source, COUNT(*) as count
+                FROM jobs
+                WHERE (has_full_description = 0 OR has_full_description IS NULL)
+                AND (is_expired = 0 OR is_expired IS NULL)
+                AND url IS NOT NULL AND url != ''
+                GROUP BY source
+            """)
+            result = {row['source']: row['count'] for row in cursor.fetchall()}
 
-        # Get total
-        cursor = self.conn.execute("""
-            SELECT COUNT(*) as total FROM jobs
-            WHERE (has_full_description = 0 OR has_full_description IS NULL)
-            AND url IS NOT NULL AND url != ''
-        """)
-        result['total'] = cursor.fetchone()['total']
+            # Get total
+            cursor = conn.execute("""
+                SELECT COUNT(*) as total FROM jobs
+                WHERE (has_full_description = 0 OR has_full_description IS NULL)
+                AND url IS NOT NULL AND url != ''
+            """)
+            result['total'] = cursor.fetchone()['total']
 
-        return result
+            return result
 
     def update_job_description(self, job_id: int, description: str, mark_full: bool = True, url: str = None) -> bool:
         """Update a job's description and optionally mark as having full description.
@@ -838,36 +1406,43 @@ class JobDatabase:
 
     def get_jobs_needing_llm_processing(self, limit: int = 1000) -> List[Dict]:
         """Get jobs that have full descriptions but haven't been LLM processed yet."""
-        cursor = self.conn.execute("""
-            SELECT id, title, company, location, description, salary, job_type,
-                   posted_date, url, source, scraped_at, employment_type
-            FROM jobs
-            WHERE has_full_description = 1
-            AND (llm_processed = 0 OR llm_processed IS NULL)
-            AND description IS NOT NULL
-            AND description != ''
-            ORDER BY scraped_at DESC
-            LIMIT ?
-        """, (limit,))
-        return [dict(row) for row in cursor.fetchall()]
+        return list(self.get_jobs_needing_llm_processing_iter(limit))
+
+    def get_jobs_needing_llm_processing_iter(self, limit: int = 1000) -> Iterator[Dict]:
+        """Like get_jobs_needing_llm_processing, but yields rows as they are read."""
+        with self._reader() as conn:
+            cursor = conn.execute("""
+                SELECT id, title, company, location, description, salary, job_type,
+                       posted_date, url, source, scraped_at, employment_type
+                FROM jobs
+                WHERE has_full_description = 1
+                AND (llm_processed = 0 OR llm_processed IS NULL)
+                AND description IS NOT NULL
+                AND description != ''
+                ORDER BY scraped_at DESC
+                LIMIT ?
+            """, (limit,))
+            for row in cursor:
+                yield dict(row)
 
     def get_llm_processing_count(self) -> Dict:
         """Get count of jobs needing LLM processing."""
-        cursor = self.conn.execute("""
-            SELECT COUNT(*) as pending FROM jobs
-            WHERE has_full_description = 1
-            AND (llm_processed = 0 OR llm_processed IS NULL)
-            AND description IS NOT NULL AND description != ''
-        """)
-        pending = cursor.fetchone()['pending']
+        with self._reader() as conn:
+            cursor = conn.execute("""
+                SELECT COUNT(*) as pending FROM jobs
+                WHERE has_full_description = 1
+                AND (llm_processed = 0 OR llm_processed IS NULL)
+                AND description IS NOT NULL AND description != ''
+            """)
+            pending = cursor.fetchone()['pending']
 
-        cursor = self.conn.execute("""
-            SELECT COUNT(*) as processed FROM jobs
-            WHERE llm_processed = 1
-        """)
-        processed = cursor.fetchone()['processed']
+            cursor = conn.execute("""
+                SELECT COUNT(*) as processed FROM jobs
+                WHERE llm_processed = 1
+            """)
+            processed = cursor.fetchone()['processed']
 
-        return {'pending': pending, 'processed': processed, 'total': pending + processed}
+            return {'pending': pending, 'processed': processed, 'total': pending + processed}
 
     def update_job_llm_data(self, job_id: int, cleaned_description: str, tags: str, entities: str) -> bool:
         """Update a job with LLM processed data."""
@@ -881,12 +1456,103 @@ class JobDatabase:
                     updated_at = CURRENT_TIMESTAMP
                 WHERE id = ?
             """, (cleaned_description, tags, entities, job_id))
+            self._write_job_tags([(job_id, tags)])
             self.conn.commit()
             return True
         except sqlite3.Error as e:
+            self.conn.rollback()
+            self._tag_ids.clear()
             print(f"Error updating LLM data: {e}")
             return False
 
+    def update_jobs_llm_data_batch(self, items: List[Tuple[int, str, str, str]]) -> bool:
+        """
+        Update many jobs with LLM processed data in a single transaction.
+        items: (job_id, cleaned_description, tags, entities) tuples.
+        """
+        if not items:
+            return True
+        try:
+            if not self.conn.in_transaction:
+                self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany("""
+                UPDATE jobs SET
+                    cleaned_description = ?,
+                    tags = ?,
+                    entities = ?,
+                    llm_processed = 1,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, [(cleaned, tags, entities, job_id) for job_id, cleaned, tags, entities in items])
+            self._write_job_tags([(job_id, tags) for job_id, _, tags, _ in items])
+            self.conn.commit()
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            self._tag_ids.clear()
+            print(f"Error updating LLM data batch: {e}")
+            return False
+
+        # Large batches fill the WAL faster than autocheckpoint drains it
+        if len(items) >= self.CHECKPOINT_BATCH_SIZE:
+            try:
+                self.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            except sqlite3.Error:
+                pass  # Checkpointing is best-effort
+        return True
+
+    def _write_job_tags(self, items: List[Tuple[int, Optional[str]]]):
+        """Mirror jobs' JSON tag arrays into tags/job_tags. Runs in the caller's transaction."""
+        links = []
+        for job_id, tags_json in items:
+            try:
+                names = json.loads(tags_json) if tags_json else []
+            except ValueError:
+                names = []
+            if not isinstance(names, list):
+                continue
+            for name in names:
+                if isinstance(name, str) and name.strip():
+                    links.append((job_id, self._tag_id(name.strip())))
+
+        self.conn.executemany("DELETE FROM job_tags WHERE job_id = ?", [(job_id,) for job_id, _ in items])
+        self.conn.executemany("INSERT OR IGNORE INTO job_tags (job_id, tag_id) VALUES (?, ?)", links)
+
+    def _tag_id(self, name: str) -> int:
+        """Id of a tag, creating it on first use. Repeat names are served from _tag_ids."""
+        tag_id = self._tag_ids.get(name)
+        if tag_id is None:
+            self.conn.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (name,))
+            tag_id = self.conn.execute("SELECT id FROM tags WHERE name = ?", (name,)).fetchone()[0]
+            self._tag_ids[name] = tag_id
+        return tag_id
+
+    def get_llm_cache(self, hashes: List[bytes]) -> Dict[bytes, str]:
+        """Look up cached LLM results (JSON text) by description hash."""
+        found = {}
+        # Stay well under SQLite's bound-parameter limit
+        chunk_size = 500
+        with self._reader() as conn:
+            for start in range(0, len(hashes), chunk_size):
+                chunk = hashes[start:start + chunk_size]
+                placeholders = ', '.join('?' * len(chunk))
+                cursor = conn.execute(f"SELECT hash, result FROM llm_cache WHERE hash IN ({placeholders})", chunk)
+                for row in cursor:
+                    found[row[0]] = row[1]
+        return found
+
+    def save_llm_cache(self, entries: List[Tuple[bytes, str]]) -> bool:
+        """Store LLM results (hash, JSON text) for reuse on identical descriptions."""
+        if not entries:
+            return True
+        try:
+            self.conn.executemany("INSERT OR REPLACE INTO llm_cache (hash, result) VALUES (?, ?)", entries)
+            self.conn.commit()
+            return True
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            print(f"Error saving LLM cache: {e}")
+            return False
+
     # ==================== CV Methods ====================
 
     def save_cv(self, filename: str, file_path: str, raw_text: str, parsed_data: str) -> int:
@@ -1120,7 +1786,13 @@ class JobDatabase:
             return False
 
     def close(self):
-        """Close database connection."""
+        """Close database connections."""
+        if self._log_thread is not None:
+            # Let the writer flush what is queued, then stop it
+            self._log_q.put(_LOG_STOP)
+            self._log_thread.join()
+            self._log_thread = None
+        # Pooled readers are shared with other instances on this file and stay open
         if self.conn:
             self.conn.close()
 
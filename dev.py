@@ -4,6 +4,7 @@
 import subprocess
 import sys
 import os
+import select
 import signal
 import time
 from pathlib import Path
@@ -37,6 +38,49 @@ def check_dependencies():
         sys.exit(1)
 
 
+def wait_for_exit(processes):
+    """Block until one of the child processes exits and return it."""
+    # Linux 5.3+: a pidfd becomes readable when its process exits
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfds = {os.pidfd_open(proc.pid): proc for proc in processes}
+        except OSError:
+            pidfds = None
+        if pidfds:
+            # Register once and reuse: each wait is a single poll() over every child
+            poller = select.poll()
+            for fd in pidfds:
+                poller.register(fd, select.POLLIN)
+            try:
+                while True:
+                    for fd, _ in poller.poll():
+                        if pidfds[fd].poll() is not None:
+                            return pidfds[fd]
+            finally:
+                for fd in pidfds:
+                    os.close(fd)
+
+    # Other POSIX systems: SIGCHLD writes to a wakeup pipe that select watches
+    if hasattr(signal, "SIGCHLD"):
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(write_fd, False)
+        signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+        signal.set_wakeup_fd(write_fd)
+        while True:
+            for proc in processes:
+                if proc.poll() is not None:
+                    return proc
+            select.select([read_fd], [], [])
+            os.read(read_fd, 512)
+
+    # No child-exit notification available: poll
+    while True:
+        for proc in processes:
+            if proc.poll() is not None:
+                return proc
+        time.sleep(1)
+
+
 def run_dev():
     """Run both backend and frontend for development."""
     processes = []
@@ -98,13 +142,9 @@ def run_dev():
 
     # Wait for processes
     try:
-        while True:
-            # Check if any process has died
-            for proc in processes:
-                if proc.poll() is not None:
-                    print(f"⚠️  Process exited with code {proc.returncode}")
-                    cleanup()
-            time.sleep(1)
+        proc = wait_for_exit(processes)
+        print(f"⚠️  Process exited with code {proc.returncode}")
+        cleanup()
     except KeyboardInterrupt:
         cleanup()
 
@@ -2,15 +2,30 @@
 
 import os
 import json
+import atexit
 import time
+import asyncio
+import hashlib
+import heapq
+import queue
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from collections import deque
-from openai import OpenAI
+from collections import deque, OrderedDict
+import httpx
+from openai import OpenAI, AsyncOpenAI
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module when orjson isn't installed
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:  # Fall back to a character-count estimate for truncation
+    tiktoken = None
+
 load_dotenv()
 
 # Rate limiting: 40 RPM per key, 3 keys = 120 RPM total
@@ -19,6 +34,120 @@ RATE_WINDOW_SECONDS = 60
 # Number of parallel workers (higher than API keys to account for response time)
 MAX_WORKERS = 10
 
+NIM_BASE_URL = "https://integrate.api.nvidia.com/v1"
+
+
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=MAX_WORKERS * 2,
+    max_keepalive_connections=MAX_WORKERS * 2,
+    keepalive_expiry=120
+)
+_HTTP_TIMEOUT = httpx.Timeout(connect=5, read=120, write=30, pool=5)
+
+
+def _json_loads(text: str):
+    """Parse JSON text; raises json.JSONDecodeError (orjson's error subclasses it)."""
+    return orjson.loads(text) if orjson else json.loads(text)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize to a JSON string for storage."""
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj)
+
+
+# Longest description sent to the LLM, in tokens (about 4 characters each without tiktoken)
+MAX_DESC_TOKENS = 12000
+
+# Tells the result committer thread to write what it has and exit
+_COMMIT_STOP = object()
+
+
+def _description_hash(description: str) -> bytes:
+    """Content key for the LLM result cache."""
+    return hashlib.blake2b(description.encode(), digest_size=16).digest()
+
+
+_encoding = None
+_encoding_lock = threading.Lock()
+
+
+def _get_encoding():
+    """Load the BPE used for truncation once; None if tiktoken or its data is unavailable."""
+    global _encoding
+    if tiktoken is None:
+        return None
+    with _encoding_lock:
+        if _encoding is None:
+            try:
+                _encoding = tiktoken.encoding_for_model("gpt-4o-mini")  # Close enough to the NIM model's BPE
+            except Exception as e:
+                print(f"[LLM] tiktoken encoding unavailable, estimating tokens from length: {e}")
+                _encoding = False
+        return _encoding or None
+
+
+def _truncate_description(description: str) -> str:
+    """Cut a description down to MAX_DESC_TOKENS so scrape artifacts can't blow the context window."""
+    # Every token is at least one character, so shorter texts can't be over the limit
+    if len(description) <= MAX_DESC_TOKENS:
+        return description
+
+    encoding = _get_encoding()
+    if encoding is None:
+        return description[:MAX_DESC_TOKENS * 4]
+
+    ids = encoding.encode(description, disallowed_special=())
+    if len(ids) <= MAX_DESC_TOKENS:
+        return description
+    return encoding.decode(ids[:MAX_DESC_TOKENS])
+
+
+def _extract_json(text: str) -> Optional[str]:
+    """Return the first balanced {...} in text, skipping braces inside strings; None if there isn't one."""
+    start = text.find('{')
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def _output_budget(description: str) -> int:
+    """max_tokens for one job's result: the cleaned text runs a little longer than the input."""
+    # About 3 characters per token, plus room for the tags and entities
+    return min(4096, int(len(description) / 3 * 1.3 + 512))
+
+
+def _create_client(api_key: str) -> OpenAI:
+    """Create an OpenAI client with a keep-alive connection pool sized for the workers."""
+    http_client = httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    return OpenAI(base_url=NIM_BASE_URL, api_key=api_key, http_client=http_client)
+
+
+def _create_async_client(api_key: str) -> AsyncOpenAI:
+    """Async counterpart of _create_client, usable only on the event loop that first uses it."""
+    http_client = httpx.AsyncClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+    return AsyncOpenAI(base_url=NIM_BASE_URL, api_key=api_key, http_client=http_client)
+
 
 @dataclass
 class APIKey:
@@ -26,6 +155,8 @@ class APIKey:
     key: str
     name: str
     request_times: deque  # timestamps of recent requests
+    client: OpenAI  # reused across calls so connections stay open
+    next_free: float = 0.0  # when the key can take another request; 0 while under the limit
 
 
 class KeyRotator:
@@ -33,8 +164,11 @@ class KeyRotator:
 
     def __init__(self):
         self.keys: List[APIKey] = []
-        self.lock = threading.Lock()
+        # Guards request_times; waiters in acquire_slot sleep on it until a slot frees
+        self.cond = threading.Condition()
         self._load_keys()
+        # (next_free, index, key): the head is always the key that frees up soonest
+        self.heap: List[Tuple[float, int, APIKey]] = [(0.0, i, k) for i, k in enumerate(self.keys)]
 
     def _load_keys(self):
         """Load API keys from environment."""
@@ -50,7 +184,8 @@ class KeyRotator:
                 self.keys.append(APIKey(
                     key=key,
                     name=name,
-                    request_times=deque(maxlen=RATE_LIMIT_PER_KEY)
+                    request_times=deque(maxlen=RATE_LIMIT_PER_KEY),
+                    client=_create_client(key)
                 ))
 
         if not self.keys:
@@ -61,45 +196,72 @@ class KeyRotator:
     def _clean_old_requests(self, api_key: APIKey):
         """Remove requests older than the rate window."""
         current_time = time.time()
+        freed = False
         while api_key.request_times and (current_time - api_key.request_times[0]) > RATE_WINDOW_SECONDS:
             api_key.request_times.popleft()
+            freed = True
+        if freed:
+            self.cond.notify()
 
-    def get_available_key(self) -> Optional[Tuple[str, str]]:
-        """Get an available API key that's under rate limit. Returns (key, name) or None."""
-        with self.lock:
-            current_time = time.time()
-
-            for api_key in self.keys:
-                self._clean_old_requests(api_key)
-
-                if len(api_key.request_times) < RATE_LIMIT_PER_KEY:
-                    api_key.request_times.append(current_time)
-                    return api_key.key, api_key.name
-
+    def _take_slot(self) -> Optional[APIKey]:
+        """Claim a request slot on the key that frees up soonest, if it is free. Caller holds self.cond."""
+        current_time = time.time()
+        next_free, index, api_key = self.heap[0]
+        if next_free > current_time:
             return None
 
+        self._clean_old_requests(api_key)
+        claimed = len(api_key.request_times) < RATE_LIMIT_PER_KEY
+        if claimed:
+            api_key.request_times.append(current_time)
+
+        if len(api_key.request_times) < RATE_LIMIT_PER_KEY:
+            api_key.next_free = 0.0
+        else:
+            api_key.next_free = api_key.request_times[0] + RATE_WINDOW_SECONDS
+        heapq.heapreplace(self.heap, (api_key.next_free, index, api_key))
+        return api_key if claimed else None
+
+    def get_available_key(self) -> Optional[APIKey]:
+        """Get an available API key that's under rate limit, or None."""
+        with self.cond:
+            return self._take_slot()
+
+    def acquire_slot(self, timeout: float) -> Optional[APIKey]:
+        """Block until a key is under its rate limit and claim a slot on it. None on timeout."""
+        deadline = time.time() + timeout
+        with self.cond:
+            while True:
+                api_key = self._take_slot()
+                if api_key:
+                    return api_key
+
+                now = time.time()
+                if now >= deadline:
+                    return None
+                self.cond.wait(timeout=min(self.heap[0][0], deadline) - now)
+
+    async def acquire_slot_async(self, timeout: float) -> Optional[APIKey]:
+        """Like acquire_slot, but waits on the event loop instead of blocking the thread."""
+        deadline = time.time() + timeout
+        while True:
+            api_key = self.get_available_key()
+            if api_key:
+                return api_key
+
+            now = time.time()
+            if now >= deadline:
+                return None
+            await asyncio.sleep(min(self.get_wait_time(), deadline - now))
+
     def get_wait_time(self) -> float:
         """Get seconds to wait until a key becomes available."""
-        with self.lock:
-            current_time = time.time()
-            min_wait = float('inf')
-
-            for api_key in self.keys:
-                self._clean_old_requests(api_key)
-
-                if len(api_key.request_times) < RATE_LIMIT_PER_KEY:
-                    return 0
-
-                if api_key.request_times:
-                    oldest = api_key.request_times[0]
-                    wait = RATE_WINDOW_SECONDS - (current_time - oldest)
-                    min_wait = min(min_wait, max(0, wait))
-
-            return min_wait if min_wait != float('inf') else 1.0
+        with self.cond:
+            return max(0.0, self.heap[0][0] - time.time())
 
     def get_status(self) -> Dict:
         """Get current rate limit status for all keys."""
-        with self.lock:
+        with self.cond:
             status = {}
             for api_key in self.keys:
                 self._clean_old_requests(api_key)
@@ -115,7 +277,18 @@ class JobDescriptionProcessor:
     """Processes job descriptions using NVIDIA NIM LLM."""
 
     MODEL = "moonshotai/kimi-k2-instruct-0905"
-    BASE_URL = "https://integrate.api.nvidia.com/v1"
+    BASE_URL = NIM_BASE_URL
+
+    # Jobs packed into one request by process_jobs_batch, and the output token cap for it
+    BATCH_SIZE = 4
+    BATCH_MAX_TOKENS = 16384
+
+    # Distinct descriptions whose LLM results are kept in memory
+    CACHE_SIZE = 5000
+
+    # Batch results written per transaction, and max wait to fill one, when saving to a db_path
+    COMMIT_BATCH = 64
+    COMMIT_INTERVAL = 0.5
 
     SYSTEM_PROMPT = """You are a job description processor. Your task is to analyze job descriptions and produce structured output.
 
@@ -150,65 +323,123 @@ For each job description, provide a JSON response with these fields:
 
 Respond ONLY with valid JSON, no markdown code blocks or other text."""
 
+    # System messages are built once so every request sends a byte-identical prefix,
+    # which the endpoint's automatic prefix caching can reuse between calls
+    SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+    JSON_SYSTEM_MESSAGE = {"role": "system",
+                           "content": "You are a helpful assistant that responds only with valid JSON."}
+
     def __init__(self):
         self.key_rotator = KeyRotator()
+        # Batches run on one long-lived event loop thread, so its async clients and their
+        # keep-alive connections carry over between process_jobs_batch calls
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._async_clients: Dict[str, AsyncOpenAI] = {}
+        # Formatted LLM results by description hash, least recently used first
+        self._cache: "OrderedDict[bytes, Dict]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background event loop thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="llm-loop", daemon=True).start()
+                self._loop = loop
+                atexit.register(self.shutdown)
+            return self._loop
+
+    def shutdown(self):
+        """Close the persistent async clients and stop the background event loop."""
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+
+        async def close_clients():
+            for client in self._async_clients.values():
+                await client.close()
+            self._async_clients = {}
 
-    def _create_client(self, api_key: str) -> OpenAI:
-        """Create OpenAI client with given API key."""
-        return OpenAI(
-            base_url=self.BASE_URL,
-            api_key=api_key
-        )
+        try:
+            asyncio.run_coroutine_threadsafe(close_clients(), loop).result(timeout=10)
+        except Exception as e:
+            print(f"[LLM] Error closing async clients: {e}")
+        loop.call_soon_threadsafe(loop.stop)
 
-    def _wait_for_key(self) -> Optional[Tuple[str, str]]:
+    def _wait_for_key(self) -> Optional[APIKey]:
         """Wait for an available API key with rate limiting."""
-        max_wait_time = 120  # Max 2 minutes wait
-        total_waited = 0
+        api_key = self.key_rotator.acquire_slot(120)  # Max 2 minutes wait
+        if not api_key:
+            print("[LLM] Timeout waiting for available API key")
+        return api_key
+
+    def _completion_args(self, system_message: Dict, user_prompt: str, max_tokens: int) -> Dict:
+        """Keyword arguments for chat.completions.create, shared by the sync and async paths."""
+        return dict(
+            model=self.MODEL,
+            messages=[
+                system_message,
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.3,
+            top_p=0.9,
+            max_tokens=max_tokens,
+            stream=False,
+            response_format={"type": "json_object"}  # Every caller parses the reply as JSON
+        )
 
-        while total_waited < max_wait_time:
-            result = self.key_rotator.get_available_key()
-            if result:
-                return result
+    def _call_llm_raw(self, system_message: Dict, user_prompt: str, label: str = "request",
+                      max_tokens: int = 4096, retry_max_tokens: Optional[int] = None) -> Optional[str]:
+        """
+        Call LLM with a prebuilt system message and a user prompt; return raw response text.
+        A reply cut off at max_tokens is requested again with retry_max_tokens, if larger.
+        """
+        api_key = self._wait_for_key()
+        if not api_key:
+            return None
 
-            wait_time = min(self.key_rotator.get_wait_time(), 0.5)  # Quick retry
-            if wait_time > 0.1:
-                print(f"[LLM] Rate limited, waiting {wait_time:.1f}s...")
-            time.sleep(wait_time)
-            total_waited += wait_time
+        print(f"[LLM] Using {api_key.name} for: {label[:50]}...")
 
-        print("[LLM] Timeout waiting for available API key")
-        return None
+        try:
+            completion = api_key.client.chat.completions.create(
+                **self._completion_args(system_message, user_prompt, max_tokens)
+            )
+
+            if completion.choices[0].finish_reason == "length" and (retry_max_tokens or 0) > max_tokens:
+                print(f"[LLM] Response hit {max_tokens} tokens, retrying with {retry_max_tokens}")
+                return self._call_llm_raw(system_message, user_prompt, label, retry_max_tokens)
 
-    def _call_llm_raw(self, system_prompt: str, user_prompt: str,
-                      label: str = "request") -> Optional[str]:
-        """Call LLM with arbitrary prompts and return raw response text."""
-        key_result = self._wait_for_key()
-        if not key_result:
+            full_response = completion.choices[0].message.content or ""
+            return full_response.strip()
+
+        except Exception as e:
+            print(f"[LLM] API error: {e}")
+            return None
+
+    async def _call_llm_raw_async(self, clients: Dict[str, AsyncOpenAI], system_message: Dict,
+                                  user_prompt: str, label: str = "request", max_tokens: int = 4096,
+                                  retry_max_tokens: Optional[int] = None) -> Optional[str]:
+        """Async _call_llm_raw using the per-run clients from process_jobs_batch_async."""
+        api_key = await self.key_rotator.acquire_slot_async(120)  # Max 2 minutes wait
+        if not api_key:
+            print("[LLM] Timeout waiting for available API key")
             return None
 
-        api_key, key_name = key_result
-        print(f"[LLM] Using {key_name} for: {label[:50]}...")
+        print(f"[LLM] Using {api_key.name} for: {label[:50]}...")
 
         try:
-            client = self._create_client(api_key)
-            completion = client.chat.completions.create(
-                model=self.MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.3,
-                top_p=0.9,
-                max_tokens=4096,
-                stream=True
+            completion = await clients[api_key.name].chat.completions.create(
+                **self._completion_args(system_message, user_prompt, max_tokens)
             )
 
-            # Collect response
-            full_response = ""
-            for chunk in completion:
-                if chunk.choices[0].delta.content:
-                    full_response += chunk.choices[0].delta.content
+            if completion.choices[0].finish_reason == "length" and (retry_max_tokens or 0) > max_tokens:
+                print(f"[LLM] Response hit {max_tokens} tokens, retrying with {retry_max_tokens}")
+                return await self._call_llm_raw_async(clients, system_message, user_prompt, label,
+                                                      retry_max_tokens)
 
+            full_response = completion.choices[0].message.content or ""
             return full_response.strip()
 
         except Exception as e:
@@ -216,40 +447,45 @@ Respond ONLY with valid JSON, no markdown code blocks or other text."""
             return None
 
     def _parse_json_response(self, response: str) -> Optional[Dict]:
-        """Parse JSON from LLM response, handling markdown code blocks."""
+        """Parse JSON from LLM response, tolerating code fences or chatter around the object."""
         if not response:
             return None
 
         try:
-            response_text = response.strip()
-            if response_text.startswith("```"):
-                response_text = response_text.split("```")[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
-            response_text = response_text.strip()
-
-            return json.loads(response_text)
+            return _json_loads(response)
         except json.JSONDecodeError as e:
-            print(f"[LLM] Failed to parse JSON response: {e}")
-            print(f"[LLM] Response was: {response[:500]}...")
-            return None
+            error = e  # JSON mode not honoured; look for the object inside the text
+
+        extracted = _extract_json(response)
+        if extracted is not None:
+            try:
+                return _json_loads(extracted)
+            except json.JSONDecodeError as e:
+                error = e
+
+        print(f"[LLM] Failed to parse JSON response: {error}")
+        print(f"[LLM] Response was: {response[:500]}...")
+        return None
 
     def _call_llm_with_prompt(self, prompt: str, label: str = "request") -> Optional[str]:
         """Call LLM with a single prompt (system prompt embedded in user prompt)."""
-        system = "You are a helpful assistant that responds only with valid JSON."
-        return self._call_llm_raw(system, prompt, label)
+        return self._call_llm_raw(self.JSON_SYSTEM_MESSAGE, prompt, label)
 
-    def _call_llm(self, description: str, job_title: str, company: str) -> Optional[Dict]:
-        """Call the LLM API for job processing with rate limiting and key rotation."""
-        user_prompt = f"""Process this job description:
+    def _job_prompt(self, description: str, job_title: str, company: str) -> str:
+        """User prompt for processing a single job description."""
+        return f"""Process this job description:
 
 Job Title: {job_title}
 Company: {company}
 
 Description:
-{description}"""
+{_truncate_description(description)}"""
 
-        response = self._call_llm_raw(self.SYSTEM_PROMPT, user_prompt, job_title)
+    def _call_llm(self, description: str, job_title: str, company: str) -> Optional[Dict]:
+        """Call the LLM API for job processing with rate limiting and key rotation."""
+        user_prompt = self._job_prompt(description, job_title, company)
+        response = self._call_llm_raw(self.SYSTEM_MESSAGE, user_prompt, job_title,
+                                      max_tokens=_output_budget(description), retry_max_tokens=4096)
         return self._parse_json_response(response)
 
     def process_job(self, job: Dict) -> Optional[Dict]:
@@ -262,60 +498,315 @@ Description:
             print(f"[LLM] Skipping job {job.get('id')} - description too short")
             return None
 
+        key = _description_hash(description)
+        cached = self._cache_get(key)
+        if cached:
+            return dict(cached)
+
         result = self._call_llm(description, title, company)
 
         if result:
-            return {
-                'cleaned_description': result.get('cleaned_description', description),
-                'tags': json.dumps(result.get('tags', [])),
-                'entities': json.dumps(result.get('entities', {}))
-            }
+            formatted = self._format_result(result, description)
+            self._cache_put(key, formatted)
+            return dict(formatted)
+
+        return None
+
+    async def process_job_async(self, clients: Dict[str, AsyncOpenAI], job: Dict) -> Optional[Dict]:
+        """Async process_job for jobs already filtered by process_jobs_batch_async."""
+        description = job['description']
+        title = job.get('title', 'Unknown')
+        company = job.get('company', 'Unknown')
+
+        user_prompt = self._job_prompt(description, title, company)
+        response = await self._call_llm_raw_async(clients, self.SYSTEM_MESSAGE, user_prompt, title,
+                                                  max_tokens=_output_budget(description),
+                                                  retry_max_tokens=4096)
+        result = self._parse_json_response(response)
+
+        if result:
+            return self._format_result(result, description)
 
         return None
 
-    def process_jobs_batch(self, jobs: List[Dict], progress_callback=None) -> Dict:
-        """Process a batch of jobs in parallel. Returns stats."""
-        stats = {'processed': 0, 'failed': 0, 'skipped': 0}
-        stats_lock = threading.Lock()
-        processed_count = [0]  # Use list for mutability in closure
+    def _format_result(self, result: Dict, description: str) -> Dict:
+        """Shape a parsed LLM result into the columns stored on the job."""
+        return {
+            'cleaned_description': result.get('cleaned_description', description),
+            'tags': _json_dumps(result.get('tags', [])),
+            'entities': _json_dumps(result.get('entities', {}))
+        }
+
+    async def _call_llm_batch(self, clients: Dict[str, AsyncOpenAI],
+                              jobs_slice: List[Dict]) -> List[Optional[Dict]]:
+        """Process several jobs in one request. Results line up with jobs_slice, None where missing."""
+        count = len(jobs_slice)
+        sections = []
+        for i, job in enumerate(jobs_slice, 1):
+            sections.append(f"""### JOB {i}
+Job Title: {job.get('title', 'Unknown')}
+Company: {job.get('company', 'Unknown')}
 
-        def process_single_job(job: Dict) -> Tuple[Dict, Optional[Dict]]:
-            """Process a single job and return (job, result)."""
-            return job, self.process_job(job)
+Description:
+{_truncate_description(job['description'])}""")
 
-        # Use ThreadPoolExecutor for parallel processing
-        # MAX_WORKERS matches API key count for optimal throughput
-        num_workers = min(MAX_WORKERS, len(jobs))
+        user_prompt = (
+            f"Process these {count} job descriptions. Respond with a JSON object of the form "
+            f'{{"results": [...]}} where "results" holds exactly {count} objects, one per job, '
+            f"in the same order.\n\n" + "\n\n".join(sections)
+        )
 
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            # Submit all jobs
-            future_to_job = {executor.submit(process_single_job, job): job for job in jobs}
+        label = f"{count} jobs: {jobs_slice[0].get('title', 'Unknown')}"
+        budget = sum(_output_budget(job['description']) for job in jobs_slice)
+        response = await self._call_llm_raw_async(clients, self.SYSTEM_MESSAGE, user_prompt, label,
+                                                  max_tokens=min(budget, self.BATCH_MAX_TOKENS),
+                                                  retry_max_tokens=min(4096 * count, self.BATCH_MAX_TOKENS))
+        parsed = self._parse_json_response(response)
+
+        results = parsed.get('results') if isinstance(parsed, dict) else None
+        if not isinstance(results, list) or len(results) != count:
+            print(f"[LLM] Batch response did not contain {count} results")
+            return [None] * count
+        return [r if isinstance(r, dict) else None for r in results]
+
+    async def _process_chunk(self, clients: Dict[str, AsyncOpenAI],
+                             chunk: List[Dict]) -> List[Tuple[Dict, Optional[Dict]]]:
+        """Process a chunk of jobs with one request, retrying singly any the batch missed."""
+        if len(chunk) > 1:
+            batch_results = await self._call_llm_batch(clients, chunk)
+        else:
+            batch_results = [None] * len(chunk)
+
+        results = {}
+        for job, result in zip(chunk, batch_results):
+            if result:
+                results[id(job)] = self._format_result(result, job['description'])
+
+        pairs = []
+        for job in chunk:
+            result = results.get(id(job))
+            if result is None:
+                result = await self.process_job_async(clients, job)
+            pairs.append((job, result))
+        return pairs
+
+    def process_jobs_batch(self, jobs: List[Dict], progress_callback=None, db_path: str = None) -> Dict:
+        """
+        Process a batch of jobs concurrently on the processor's event loop thread. Returns stats,
+        with the successful results as parallel lists under stats['results'] ('id',
+        'cleaned_description', 'tags', 'entities'), ready for update_jobs_llm_data_batch.
+        With db_path, results are saved to those jobs as they complete, and LLM results are also
+        looked up in and saved to that database's llm_cache.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.process_jobs_batch_async(jobs, progress_callback, db_path), self._get_loop()
+        )
+        return future.result()
+
+    async def process_jobs_batch_async(self, jobs: List[Dict], progress_callback=None,
+                                       db_path: str = None) -> Dict:
+        """Process a batch of jobs concurrently on the current event loop. Returns stats."""
+        # Descriptions too short to be worth processing never reach the LLM path
+        eligible = [job for job in jobs if len(job.get('description') or '') >= 50]
+        stats = {'processed': 0, 'failed': 0, 'skipped': len(jobs) - len(eligible)}
+        processed_count = 0
+        # Results column by column rather than written back onto the job dicts
+        ids, cleaneds, tags_json, entities_json = [], [], [], []
+
+        # Completed results are written in batched transactions by a committer thread
+        results_q: Optional[queue.SimpleQueue] = None
+        committer = None
+        # Job ids whose results the committer could not save
+        unsaved: List[int] = []
+        if db_path:
+            results_q = queue.SimpleQueue()
+            committer = threading.Thread(target=self._commit_results, args=(db_path, results_q, unsaved),
+                                         name="llm-commit", daemon=True)
+            committer.start()
+
+        def record(job: Dict, result: Optional[Dict]):
+            nonlocal processed_count
+            processed_count += 1
+            if progress_callback:
+                progress_callback(processed_count, len(eligible), job.get('title', 'Unknown'))
 
-            for future in as_completed(future_to_job):
-                job = future_to_job[future]
+            if result:
+                stats['processed'] += 1
+                ids.append(job['id'])
+                cleaneds.append(result['cleaned_description'])
+                tags_json.append(result['tags'])
+                entities_json.append(result['entities'])
+                if results_q is not None:
+                    results_q.put((job['id'], result['cleaned_description'], result['tags'], result['entities']))
+            else:
+                stats['failed'] += 1
+
+        # Identical descriptions are sent once: cache hits are answered now, and the
+        # rest are grouped by hash so one LLM result fills in every copy
+        hashes = {id(job): _description_hash(job['description']) for job in eligible}
+        if db_path:
+            try:
+                await asyncio.to_thread(self._load_cache, db_path, set(hashes.values()))
+            except Exception as e:
+                print(f"[LLM] Could not load cached results: {e}")
+
+        pending: Dict[bytes, List[Dict]] = {}
+        for job in eligible:
+            key = hashes[id(job)]
+            cached = self._cache_get(key)
+            if cached:
+                record(job, cached)
+            else:
+                pending.setdefault(key, []).append(job)
+        unique = [group[0] for group in pending.values()]
+        new_entries: List[Tuple[bytes, Dict]] = []
+
+        # Pack several jobs into each request to share the system prompt and rate-limit slot
+        chunks = [unique[i:i + self.BATCH_SIZE] for i in range(0, len(unique), self.BATCH_SIZE)]
+
+        # Requests in flight are bounded here; the key rotator paces them to the rate limit
+        semaphore = asyncio.Semaphore(MAX_WORKERS * 4)
+        # Async clients are tied to the loop that opens their connections: reuse the persistent
+        # ones on our own loop, and give runs on any other loop their own
+        persistent = asyncio.get_running_loop() is self._loop
+        if persistent and self._async_clients:
+            clients = self._async_clients
+        else:
+            clients = {api_key.name: _create_async_client(api_key.key) for api_key in self.key_rotator.keys}
+            if persistent:
+                self._async_clients = clients
+
+        async def run_chunk(chunk: List[Dict]):
+            async with semaphore:
                 try:
-                    job, result = future.result()
-
-                    with stats_lock:
-                        processed_count[0] += 1
-                        if progress_callback:
-                            progress_callback(processed_count[0], len(jobs), job.get('title', 'Unknown'))
-
-                        if result:
-                            stats['processed'] += 1
-                            job['llm_result'] = result
-                        else:
-                            if len(job.get('description', '')) < 50:
-                                stats['skipped'] += 1
-                            else:
-                                stats['failed'] += 1
+                    return chunk, await self._process_chunk(clients, chunk)
                 except Exception as e:
-                    with stats_lock:
-                        stats['failed'] += 1
-                        print(f"[LLM] Error processing job {job.get('id')}: {e}")
+                    print(f"[LLM] Error processing jobs {[job.get('id') for job in chunk]}: {e}")
+                    return chunk, [(job, None) for job in chunk]
+
+        try:
+            for next_done in asyncio.as_completed([run_chunk(chunk) for chunk in chunks]):
+                chunk, pairs = await next_done
+                for job, result in pairs:
+                    key = hashes[id(job)]
+                    if result:
+                        self._cache_put(key, result)
+                        new_entries.append((key, result))
+                    for same in pending[key]:
+                        record(same, result)
+        finally:
+            if not persistent:
+                for client in clients.values():
+                    await client.close()
+            if committer is not None:
+                results_q.put(_COMMIT_STOP)
+                await asyncio.to_thread(committer.join)
+
+        # A result that never reached the database counts as failed, not processed
+        if unsaved:
+            unsaved_ids = set(unsaved)
+            keep = [i for i, job_id in enumerate(ids) if job_id not in unsaved_ids]
+            dropped = len(ids) - len(keep)
+            stats['processed'] -= dropped
+            stats['failed'] += dropped
+            ids, cleaneds, tags_json, entities_json = (
+                [column[i] for i in keep] for column in (ids, cleaneds, tags_json, entities_json)
+            )
+
+        if db_path and new_entries:
+            await asyncio.to_thread(self._save_cache, db_path, new_entries)
 
+        stats['results'] = {
+            'id': ids,
+            'cleaned_description': cleaneds,
+            'tags': tags_json,
+            'entities': entities_json
+        }
         return stats
 
+    def _commit_results(self, db_path: str, results_q: queue.SimpleQueue, unsaved: List[int]):
+        """
+        Committer thread: write queued (job_id, cleaned, tags, entities) rows in batches.
+        The job ids of any batch that could not be written are appended to unsaved.
+        """
+        from database.schema import JobDatabase
+
+        try:
+            db = JobDatabase(db_path)
+        except Exception as e:
+            # Keep draining the queue so every queued result is reported as unsaved
+            print(f"[LLM] Could not open database to save results: {e}")
+            db = None
+        try:
+            stop = False
+            while not stop:
+                batch = [results_q.get()]
+                deadline = time.monotonic() + self.COMMIT_INTERVAL
+                while len(batch) < self.COMMIT_BATCH and batch[-1] is not _COMMIT_STOP:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(results_q.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+
+                stop = batch[-1] is _COMMIT_STOP
+                items = [item for item in batch if item is not _COMMIT_STOP]
+                if items:
+                    try:
+                        saved = db is not None and db.update_jobs_llm_data_batch(items)
+                    except Exception as e:
+                        print(f"[LLM] Error saving results batch: {e}")
+                        saved = False
+                    if not saved:
+                        unsaved.extend(item[0] for item in items)
+        finally:
+            if db is not None:
+                db.close()
+
+    def _cache_get(self, key: bytes) -> Optional[Dict]:
+        """Return a cached result for a description hash, marking it recently used."""
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+
+    def _cache_put(self, key: bytes, result: Dict):
+        """Cache a result, evicting the least recently used entry when full."""
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+    def _load_cache(self, db_path: str, hashes: set):
+        """Pull persisted results for any of these hashes not already cached in memory."""
+        from database.schema import JobDatabase
+
+        with self._cache_lock:
+            missing = [key for key in hashes if key not in self._cache]
+        if not missing:
+            return
+
+        db = JobDatabase(db_path)
+        try:
+            for key, result in db.get_llm_cache(missing).items():
+                self._cache_put(key, _json_loads(result))
+        finally:
+            db.close()
+
+    def _save_cache(self, db_path: str, entries: List[Tuple[bytes, Dict]]):
+        """Persist newly computed results so later runs can reuse them."""
+        from database.schema import JobDatabase
+
+        db = JobDatabase(db_path)
+        try:
+            db.save_llm_cache([(key, _json_dumps(result)) for key, result in entries])
+        finally:
+            db.close()
+
     def get_rate_limit_status(self) -> Dict:
         """Get current rate limit status."""
         return self.key_rotator.get_status()
@@ -3,8 +3,16 @@
 
 import asyncio
 import argparse
+import functools
+import json
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from dataclasses import dataclass
 from typing import List, Dict, Optional
-from database.schema import JobDatabase
+from playwright.async_api import async_playwright, Browser, BrowserContext
+from database.schema import JobDatabase, JobListing
+from scrapers.base import BaseScraper
 from scrapers.totaljobs import TotalJobsDetailedScraper
 from scrapers.reed import ReedScraper
 from scrapers.indeed import IndeedScraper
@@ -18,90 +26,174 @@ AVAILABLE_SCRAPERS = {
     'indeed': IndeedScraper,
     'cvlibrary': CVLibraryScraper,
 }
+_ALL_SOURCES = tuple(AVAILABLE_SCRAPERS)
+_SOURCE_SET = frozenset(AVAILABLE_SCRAPERS)
+_SOURCES_HELP = ('Comma-separated list of sources (e.g., reed,totaljobs). Available: '
+                 + ', '.join(_ALL_SOURCES))
+
+logger = logging.getLogger('job_scraper')
 
 # Search configurations
 DEFAULT_SEARCHES = [
 ]
 
 
+@dataclass(slots=True)
+class ScrapeReport:
+    """Outcome of one search against one source."""
+    source: str
+    search: str
+    count: int = 0
+    error: Optional[str] = None
+
+
 class JobScraperOrchestrator:
     """Orchestrates parallel scraping across multiple job sites."""
 
     def __init__(self, db_path: str = "jobs.db"):
         self.db = JobDatabase(db_path)
-
-    async def scrape_source(self, source_name: str, search: Dict, headless: bool = True) -> Dict:
-        """Scrape a single source for a single search."""
+        # One Chromium and one stealth context shared by every scrape; each scraper opens its own page
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _ensure_browser(self, headless: bool = True) -> Browser:
+        """Launch the shared browser on first use."""
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+        async with self._browser_lock:
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=headless,
+                    args=BaseScraper.BROWSER_ARGS
+                )
+            return self._browser
+
+    async def _ensure_context(self, headless: bool = True) -> BrowserContext:
+        """Create the shared stealth context on first use."""
+        browser = await self._ensure_browser(headless)
+        async with self._browser_lock:
+            if self._context is None:
+                self._context = await BaseScraper.new_stealth_context(browser)
+            return self._context
+
+    async def close(self):
+        """Close the shared context, browser and Playwright."""
+        try:
+            if self._context:
+                await self._context.close()
+        except Exception:
+            pass
+        try:
+            if self._browser:
+                await self._browser.close()
+        except Exception:
+            pass
+        try:
+            if self._playwright:
+                await self._playwright.stop()
+        except Exception:
+            pass
+        self._context = None
+        self._browser = None
+        self._playwright = None
+
+    async def scrape_source(self, source_name: str, searches: List[Dict], headless: bool = True) -> List[ScrapeReport]:
+        """Scrape a single source for each search, reusing one page in the shared context."""
         if source_name not in AVAILABLE_SCRAPERS:
-            return {'source': source_name, 'error': f'Unknown source: {source_name}'}
+            return [ScrapeReport(source_name, 'all searches', error=f'Unknown source: {source_name}')]
 
         scraper_class = AVAILABLE_SCRAPERS[source_name]
         scraper = scraper_class(self.db, headless=headless)
-        result = {'source': source_name, 'search': f"{search['term']} in {search['location']}", 'found': 0}
+        reports = []
 
         try:
-            await scraper.init_browser()
-            jobs = await scraper.search_jobs(
-                search_term=search['term'],
-                location=search['location'],
-                save_incrementally=True
-            )
-            result['found'] = len(jobs)
+            await scraper.init_browser(context=await self._ensure_context(headless))
+            for i, search in enumerate(searches):
+                report = ScrapeReport(source_name, f"{search['term']} in {search['location']}")
+                reports.append(report)
+                try:
+                    if i:
+                        await scraper.reset_between_searches()
+                    jobs = await scraper.search_jobs(
+                        search_term=search['term'],
+                        location=search['location'],
+                        save_incrementally=True
+                    )
+                    report.count = len(jobs)
+                except Exception as e:
+                    report.error = str(e)
+                    logger.error(f"[{source_name}] Error: {e}")
         except Exception as e:
-            result['error'] = str(e)
-            print(f"[{source_name}] Error: {e}")
+            reports.append(ScrapeReport(source_name, 'all searches', error=str(e)))
+            logger.error(f"[{source_name}] Error: {e}")
         finally:
             await scraper.cleanup()
 
-        return result
+        return reports
 
     async def scrape_all(self, searches: List[Dict], headless: bool = True,
-                         sources: Optional[List[str]] = None) -> Dict[str, int]:
-        """Run scrapers in parallel for all searches."""
-        results = {}
+                         sources: Optional[List[str]] = None,
+                         max_concurrency: int = 6) -> List[ScrapeReport]:
+        """Run scrapers in parallel across sources.
+
+        Each source runs its searches in sequence on one page of the shared
+        context, so cookies and connections carry over. At most max_concurrency
+        sources have a page open at once.
+        """
+        reports: List[ScrapeReport] = []
 
         # Use specified sources or all available
-        active_sources = sources if sources else list(AVAILABLE_SCRAPERS.keys())
+        active_sources = sources or _ALL_SOURCES
 
-        # Filter to valid sources
-        active_sources = [s for s in active_sources if s in AVAILABLE_SCRAPERS]
+        # Filter to valid sources, dropping repeats so a source never gets two tasks
+        active_sources = [s for s in dict.fromkeys(active_sources) if s in _SOURCE_SET]
 
         if not active_sources:
-            print("No valid sources specified")
-            return results
+            logger.warning("No valid sources specified")
+            return reports
 
-        print(f"Scraping from: {', '.join(active_sources)}")
+        logger.info(f"Scraping from: {', '.join(active_sources)}")
 
-        # Create tasks for all source/search combinations
-        tasks = []
-        for search in searches:
-            for source in active_sources:
-                tasks.append(self.scrape_source(source, search, headless))
+        sem = asyncio.Semaphore(max(1, max_concurrency))
 
-        # Run all tasks in parallel
-        task_results = await asyncio.gather(*tasks, return_exceptions=True)
+        async def gated(source: str) -> List[ScrapeReport]:
+            async with sem:
+                return await self.scrape_source(source, searches, headless)
+
+        # One task per source; searches run sequentially within it
+        task_results = await asyncio.gather(*(gated(source) for source in active_sources),
+                                            return_exceptions=True)
 
         # Aggregate results
-        for task_result in task_results:
-            if isinstance(task_result, Exception):
-                print(f"Task failed: {task_result}")
+        for source, source_reports in zip(active_sources, task_results):
+            if isinstance(source_reports, BaseException):
+                logger.error(f"Task failed: {source_reports}")
+                reports.append(ScrapeReport(source, 'all searches', error=str(source_reports)))
                 continue
-            if isinstance(task_result, dict):
-                key = f"[{task_result['source']}] {task_result.get('search', 'unknown')}"
-                results[key] = task_result.get('found', 0)
-                if 'error' in task_result:
-                    results[key] = f"Error: {task_result['error']}"
+            reports.extend(source_reports)
 
-        return results
+        return reports
 
-    def print_results(self, results: Dict[str, int]):
+    def print_results(self, reports: List[ScrapeReport]):
         """Print scraping results."""
         print("\n" + "="*60)
         print("SCRAPING RESULTS")
         print("="*60)
 
-        for search, count in results.items():
-            print(f"  {search}: {count} new jobs")
+        for report in reports:
+            if report.error:
+                print(f"  [{report.source}] {report.search}: Error: {report.error}")
+            else:
+                print(f"  [{report.source}] {report.search}: {report.count} new jobs")
 
         stats = self.db.get_stats()
         print("\nDATABASE STATS:")
@@ -112,25 +204,46 @@ class JobScraperOrchestrator:
         print("="*60 + "\n")
 
 
-async def main():
-    """Main entry point."""
+def setup_logging(level: int = logging.INFO) -> QueueListener:
+    """Route log records through a queue so scrapers never block on console writes."""
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(name)s - %(message)s'))
+    listener = QueueListener(log_queue, handler)
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+    listener.start()
+    return listener
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once."""
     parser = argparse.ArgumentParser(description="Job Scraper Automation")
     parser.add_argument('--search', type=str, help='Search term (default: use preset searches)')
     parser.add_argument('--location', type=str, default='London', help='Job location')
-    parser.add_argument('--sources', type=str, help='Comma-separated list of sources (e.g., reed,totaljobs). Available: ' + ', '.join(AVAILABLE_SCRAPERS.keys()))
+    parser.add_argument('--sources', type=str, help=_SOURCES_HELP)
     parser.add_argument('--headless', action='store_true', default=True, help='Run headless')
     parser.add_argument('--visible', action='store_false', dest='headless', help='Run visible (for debugging)')
     parser.add_argument('--detailed', action='store_true', help='Fetch full job details (slower)')
     parser.add_argument('--stats', action='store_true', help='Show database stats only')
     parser.add_argument('--db', type=str, default='jobs.db', help='Database path')
     parser.add_argument('--list-sources', action='store_true', help='List available sources')
+    parser.add_argument('--concurrency', type=int, default=6, help='Maximum scrapes running at once')
+    parser.add_argument('--import-jobs', type=str, metavar='FILE',
+                        help='Import jobs from a JSON list of job objects in one bulk transaction')
+    return parser
 
-    args = parser.parse_args()
+
+async def main():
+    """Main entry point."""
+    args = _build_parser().parse_args()
 
     # List sources mode
     if args.list_sources:
         print("\nAvailable sources:")
-        for source in AVAILABLE_SCRAPERS.keys():
+        for source in _ALL_SOURCES:
             print(f"  - {source}")
         return
 
@@ -144,6 +257,16 @@ async def main():
             print(f"  {k}: {v}")
         return
 
+    # Bulk import mode
+    if args.import_jobs:
+        with open(args.import_jobs, encoding='utf-8') as f:
+            jobs = [JobListing.from_dict(item) for item in json.load(f)]
+        stats = orchestrator.db.bulk_import(jobs)
+        print(f"\nIMPORTED {len(jobs)} jobs:")
+        for k, v in stats.items():
+            print(f"  {k}: {v}")
+        return
+
     # Single search mode
     if args.search:
         searches = [{'term': args.search, 'location': args.location}]
@@ -160,14 +283,27 @@ async def main():
     if args.sources:
         sources = [s.strip().lower() for s in args.sources.split(',')]
 
-    results = await orchestrator.scrape_all(
-        searches=searches,
-        headless=args.headless,
-        sources=sources
-    )
+    # Closes the shared browser once every scrape has finished
+    async with orchestrator:
+        results = await orchestrator.scrape_all(
+            searches=searches,
+            headless=args.headless,
+            sources=sources,
+            max_concurrency=args.concurrency
+        )
 
     orchestrator.print_results(results)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-based loop when available (falls back to the default asyncio loop)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    listener = setup_logging()
+    try:
+        asyncio.run(main())
+    finally:
+        listener.stop()
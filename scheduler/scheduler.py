@@ -1,15 +1,22 @@
 """Background scheduler for autonomous job scraping pipeline."""
 
 import asyncio
+import heapq
 import threading
 import time
 import json
-from datetime import datetime
-from typing import Dict, Optional, Callable
-from dataclasses import dataclass, asdict
+import sqlite3
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple, Callable
+from dataclasses import dataclass, replace
 from enum import Enum
 
 
+def _utc_now() -> str:
+    """Timezone-aware UTC timestamp for task state transitions."""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
 class TaskStatus(Enum):
     IDLE = "idle"
     RUNNING = "running"
@@ -17,7 +24,7 @@ class TaskStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskState:
     """Tracks state of a running task."""
     status: TaskStatus = TaskStatus.IDLE
@@ -40,7 +47,10 @@ class TaskState:
         }
 
 
-@dataclass
+_TASK_STATE_FIELDS = frozenset(TaskState.__dataclass_fields__)
+
+
+@dataclass(slots=True)
 class SchedulerConfig:
     """Scheduler configuration."""
     enabled: bool = False
@@ -52,7 +62,8 @@ class SchedulerConfig:
     llm_enabled: bool = True
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Fields are all scalars, so skip asdict's recursive deep copy
+        return {f: getattr(self, f) for f in self.__dataclass_fields__}
 
     @classmethod
     def from_dict(cls, data: dict) -> 'SchedulerConfig':
@@ -65,42 +76,65 @@ class JobScheduler:
 
     Pipeline: Scrape -> Get Descriptions -> AI Process
     Each step runs independently without blocking others.
+
+    The loop sleeps until the earliest due task instead of polling; config
+    changes, manual runs and task completions wake it to reschedule.
     """
 
+    TASK_NAMES = ("scrape", "descriptions", "llm")
+
+    # Coalesce progress updates to at most one per 200ms per task
+    PROGRESS_MIN_INTERVAL_NS = 200_000_000
+
+    # Delay before retrying a task whose last run failed
+    RETRY_DELAY_SECONDS = 10
+
     def __init__(self, db_path: str = "data/jobs.db"):
         self.db_path = db_path
         self.config = SchedulerConfig()
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-
-        # Task states (independent tracking for each task type)
-        self.task_states: Dict[str, TaskState] = {
-            "scrape": TaskState(),
-            "descriptions": TaskState(),
-            "llm": TaskState(),
+        self._wake_event = threading.Event()
+
+        # Task states (independent tracking for each task type). Both dicts are
+        # copy-on-write: writers publish a new dict under _state_lock, readers
+        # take the current reference without locking.
+        self.task_states: Dict[str, TaskState] = {name: TaskState() for name in self.TASK_NAMES}
+        self._state_dicts: Dict[str, dict] = {
+            name: state.to_dict() for name, state in self.task_states.items()
         }
         self._state_lock = threading.Lock()
+        # Last accepted progress update per task, for debouncing update_state
+        self._last_update_ns: Dict[str, int] = {}
 
-        # Last run times
-        self._last_runs: Dict[str, float] = {
-            "scrape": 0,
-            "descriptions": 0,
-            "llm": 0,
-        }
+        # Last successful completion and last failure times
+        self._last_runs: Dict[str, float] = {name: 0 for name in self.TASK_NAMES}
+        self._last_failures: Dict[str, float] = {name: 0 for name in self.TASK_NAMES}
 
-        # Task executors (will be set by the app)
+        # Task executors (will be set by the app); may be sync or async callables
         self._executors: Dict[str, Callable] = {}
 
+        # All tasks run on one event loop thread, started on first dispatch
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+
+        # One connection for config reads and writes, in autocommit mode
+        self._conn_lock = threading.Lock()
+        self._conn = self._connect()
+
         # Load config from database
         self._load_config()
 
-    def _load_config(self):
-        """Load scheduler config from database."""
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the long-lived config connection and ensure its table exists."""
         try:
-            import sqlite3
-            conn = sqlite3.connect(self.db_path)
+            conn = sqlite3.connect(self.db_path, timeout=60.0, check_same_thread=False,
+                                   isolation_level=None)
             conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=60000")
+            conn.execute("PRAGMA synchronous=NORMAL")
 
             # Ensure scheduler_config table exists
             conn.execute("""
@@ -110,55 +144,108 @@ class JobScheduler:
                     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
-            conn.commit()
+            return conn
+        except Exception as e:
+            print(f"[Scheduler] Error opening config database: {e}")
+            return None
 
-            cursor = conn.execute("SELECT config_json FROM scheduler_config WHERE id = 1")
-            row = cursor.fetchone()
+    def _load_config(self):
+        """Load scheduler config from database."""
+        if self._conn is None:
+            return
+        try:
+            with self._conn_lock:
+                row = self._conn.execute(
+                    "SELECT config_json FROM scheduler_config WHERE id = 1"
+                ).fetchone()
             if row:
                 self.config = SchedulerConfig.from_dict(json.loads(row['config_json']))
-            conn.close()
         except Exception as e:
             print(f"[Scheduler] Error loading config: {e}")
 
     def save_config(self):
         """Save scheduler config to database."""
-        try:
-            import sqlite3
-            conn = sqlite3.connect(self.db_path)
-            conn.execute("""
-                INSERT OR REPLACE INTO scheduler_config (id, config_json, updated_at)
-                VALUES (1, ?, CURRENT_TIMESTAMP)
-            """, (json.dumps(self.config.to_dict()),))
-            conn.commit()
-            conn.close()
-        except Exception as e:
-            print(f"[Scheduler] Error saving config: {e}")
+        if self._conn is not None:
+            try:
+                with self._conn_lock:
+                    self._conn.execute("""
+                        INSERT OR REPLACE INTO scheduler_config (id, config_json, updated_at)
+                        VALUES (1, ?, CURRENT_TIMESTAMP)
+                    """, (json.dumps(self.config.to_dict()),))
+            except Exception as e:
+                print(f"[Scheduler] Error saving config: {e}")
+        # Intervals or enabled flags may have changed
+        self._wake_event.set()
 
     def set_executor(self, task_name: str, executor: Callable):
-        """Set the executor function for a task type."""
+        """Set the executor function for a task type.
+
+        Coroutine functions run directly on the scheduler's event loop; plain
+        functions are run in a worker thread via asyncio.to_thread.
+        """
         self._executors[task_name] = executor
 
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the task event loop thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="scheduler-tasks", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
     def get_state(self, task_name: str) -> TaskState:
         """Get current state of a task."""
-        with self._state_lock:
-            return self.task_states.get(task_name, TaskState())
+        return self.task_states.get(task_name, TaskState())
 
     def get_all_states(self) -> Dict[str, dict]:
-        """Get states of all tasks."""
-        with self._state_lock:
-            return {name: state.to_dict() for name, state in self.task_states.items()}
+        """Get states of all tasks. The returned snapshot must not be mutated."""
+        return self._state_dicts
+
+    def _publish_state(self, task_name: str, changes: dict):
+        """Replace a task's state with an updated copy. Caller holds _state_lock."""
+        state = self.task_states.get(task_name)
+        if state is None:
+            return
+        state = replace(state, **{k: v for k, v in changes.items() if k in _TASK_STATE_FIELDS})
+        self.task_states = {**self.task_states, task_name: state}
+        self._state_dicts = {**self._state_dicts, task_name: state.to_dict()}
 
     def update_state(self, task_name: str, **kwargs):
-        """Update state of a task."""
+        """Update state of a task.
+
+        Progress-only updates arriving within PROGRESS_MIN_INTERVAL_NS of the last
+        accepted one are dropped, except the final tick (progress >= total).
+        Updates that change status are always applied.
+        """
+        if 'status' not in kwargs:
+            now = time.monotonic_ns()
+            progress, total = kwargs.get('progress'), kwargs.get('total')
+            final = progress is not None and total is not None and progress >= total
+            if not final and now - self._last_update_ns.get(task_name, 0) < self.PROGRESS_MIN_INTERVAL_NS:
+                return
+            self._last_update_ns[task_name] = now
+
         with self._state_lock:
-            state = self.task_states.get(task_name)
-            if state:
-                for key, value in kwargs.items():
-                    if hasattr(state, key):
-                        setattr(state, key, value)
+            self._publish_state(task_name, kwargs)
 
-    def _should_run_task(self, task_name: str) -> bool:
-        """Check if a task should run based on interval."""
+    def _mark_running(self, task_name: str) -> bool:
+        """Atomically move a task to RUNNING; False if it already is."""
+        with self._state_lock:
+            state = self.task_states.get(task_name)
+            if state is None or state.status == TaskStatus.RUNNING:
+                return False
+            self._publish_state(task_name, {
+                'status': TaskStatus.RUNNING,
+                'started_at': _utc_now(),
+                'progress': 0,
+                'error': None,
+                'message': f"Starting {task_name}...",
+            })
+            return True
+
+    def _build_schedule(self) -> List[Tuple[float, str]]:
+        """Build a heap of (next_run_ts, task_name) for enabled, idle tasks."""
         intervals = {
             "scrape": self.config.scrape_interval_minutes,
             "descriptions": self.config.description_interval_minutes,
@@ -170,78 +257,84 @@ class JobScheduler:
             "llm": self.config.llm_enabled,
         }
 
-        if not enabled.get(task_name, False):
-            return False
-
-        # Check if task is already running
-        with self._state_lock:
-            if self.task_states[task_name].status == TaskStatus.RUNNING:
-                return False
-
-        interval_seconds = intervals.get(task_name, 60) * 60
-        last_run = self._last_runs.get(task_name, 0)
-        return (time.time() - last_run) >= interval_seconds
-
-    def _run_task(self, task_name: str):
-        """Run a task in a separate thread."""
+        heap = []
+        states = self.task_states
+        for task_name in self.TASK_NAMES:
+            if not enabled.get(task_name, False):
+                continue
+            # Running tasks are rescheduled when they finish
+            if states[task_name].status == TaskStatus.RUNNING:
+                continue
+            interval_seconds = intervals.get(task_name, 60) * 60
+            next_run = max(self._last_runs[task_name] + interval_seconds,
+                           self._last_failures[task_name] + self.RETRY_DELAY_SECONDS)
+            heap.append((next_run, task_name))
+        heapq.heapify(heap)
+        return heap
+
+    def _run_task(self, task_name: str) -> bool:
+        """Run a task on the scheduler's event loop. Returns False if it could not start."""
         executor = self._executors.get(task_name)
         if not executor:
             print(f"[Scheduler] No executor for task: {task_name}")
-            return
+            return False
 
-        def task_wrapper():
-            try:
-                self.update_state(
-                    task_name,
-                    status=TaskStatus.RUNNING,
-                    started_at=datetime.utcnow().isoformat(),
-                    progress=0,
-                    error=None,
-                    message=f"Starting {task_name}..."
-                )
+        # Mark running before dispatch so neither the loop nor a manual run can start it twice
+        if not self._mark_running(task_name):
+            return False
 
+        def progress_callback(p, t, m):
+            self.update_state(task_name, progress=p, total=t, message=m)
+
+        async def task_wrapper():
+            try:
                 # Run the executor
-                result = executor(
-                    progress_callback=lambda p, t, m: self.update_state(
-                        task_name, progress=p, total=t, message=m
-                    )
-                )
+                if asyncio.iscoroutinefunction(executor):
+                    result = await executor(progress_callback=progress_callback)
+                else:
+                    result = await asyncio.to_thread(executor, progress_callback=progress_callback)
 
+                self._last_runs[task_name] = time.time()
                 self.update_state(
                     task_name,
                     status=TaskStatus.COMPLETED,
-                    completed_at=datetime.utcnow().isoformat(),
+                    completed_at=_utc_now(),
                     message=f"Completed: {result}" if result else "Completed"
                 )
-                self._last_runs[task_name] = time.time()
 
             except Exception as e:
+                self._last_failures[task_name] = time.time()
                 self.update_state(
                     task_name,
                     status=TaskStatus.FAILED,
-                    completed_at=datetime.utcnow().isoformat(),
+                    completed_at=_utc_now(),
                     error=str(e),
                     message=f"Failed: {e}"
                 )
                 print(f"[Scheduler] Task {task_name} failed: {e}")
 
-        thread = threading.Thread(target=task_wrapper, daemon=True)
-        thread.start()
+            finally:
+                self._wake_event.set()
+
+        asyncio.run_coroutine_threadsafe(task_wrapper(), self._get_loop())
+        return True
 
     def _scheduler_loop(self):
         """Main scheduler loop."""
         print("[Scheduler] Starting scheduler loop...")
 
         while not self._stop_event.is_set():
-            if self.config.enabled:
-                # Check each task independently
-                for task_name in ["scrape", "descriptions", "llm"]:
-                    if self._should_run_task(task_name):
-                        print(f"[Scheduler] Starting task: {task_name}")
-                        self._run_task(task_name)
+            self._wake_event.clear()
+            heap = self._build_schedule() if self.config.enabled else []
+
+            now = time.time()
+            while heap and heap[0][0] <= now:
+                _, task_name = heapq.heappop(heap)
+                print(f"[Scheduler] Starting task: {task_name}")
+                self._run_task(task_name)
 
-            # Sleep for a bit before checking again
-            self._stop_event.wait(10)  # Check every 10 seconds
+            # Sleep until the next task is due, or indefinitely until woken
+            self._wake_event.wait(heap[0][0] - now if heap else None)
 
         print("[Scheduler] Scheduler loop stopped")
 
@@ -252,6 +345,7 @@ class JobScheduler:
 
         self._running = True
         self._stop_event.clear()
+        self._wake_event.clear()
         self._thread = threading.Thread(target=self._scheduler_loop, daemon=True)
         self._thread.start()
         print("[Scheduler] Scheduler started")
@@ -260,6 +354,7 @@ class JobScheduler:
         """Stop the scheduler."""
         self._running = False
         self._stop_event.set()
+        self._wake_event.set()
         if self._thread:
             self._thread.join(timeout=5)
         print("[Scheduler] Scheduler stopped")
@@ -268,20 +363,12 @@ class JobScheduler:
         """Manually trigger a task to run now."""
         if task_name not in self.task_states:
             return False
-
-        # Check if already running
-        with self._state_lock:
-            if self.task_states[task_name].status == TaskStatus.RUNNING:
-                return False
-
-        self._run_task(task_name)
-        return True
+        return self._run_task(task_name)
 
     def is_task_running(self, task_name: str) -> bool:
         """Check if a task is currently running."""
-        with self._state_lock:
-            state = self.task_states.get(task_name)
-            return state and state.status == TaskStatus.RUNNING
+        state = self.task_states.get(task_name)
+        return state is not None and state.status == TaskStatus.RUNNING
 
 
 # Singleton instance
@@ -4,24 +4,144 @@ import asyncio
 import logging
 import random
 import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+from playwright.async_api import async_playwright, Browser, Page, BrowserContext, ElementHandle
 from database.schema import JobListing, JobDatabase
 from scrapers.description_fetcher import DescriptionFetcher
 
 logger = logging.getLogger('scrapers.base')
 
+# A CSS selector, or a tuple of selectors tried in priority order (see extract_cards)
+Selector = Union[str, Tuple[str, ...]]
+
+# Injected into every context to hide automation; built once at import
+_STEALTH_JS = """
+// Hide webdriver property
+Object.defineProperty(navigator, 'webdriver', {
+    get: () => undefined
+});
+
+// Mock plugins
+Object.defineProperty(navigator, 'plugins', {
+    get: () => [
+        { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' },
+        { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
+        { name: 'Native Client', filename: 'internal-nacl-plugin' }
+    ]
+});
+
+// Mock languages
+Object.defineProperty(navigator, 'languages', {
+    get: () => ['en-GB', 'en', 'en-US']
+});
+
+// Override permissions API
+const originalQuery = window.navigator.permissions.query;
+window.navigator.permissions.query = (parameters) => (
+    parameters.name === 'notifications' ?
+        Promise.resolve({ state: Notification.permission }) :
+        originalQuery(parameters)
+);
+
+// Mock chrome object (for detection)
+if (!window.chrome) {
+    window.chrome = {};
+}
+window.chrome.runtime = {};
+
+// Mock navigator.connection
+navigator.connection = {
+    effectiveType: '4g',
+    rtt: 50,
+    downlink: 10,
+    saveData: false
+};
+
+// Hide automation indicators
+delete navigator.__proto__.webdriver;
+
+// Mock performance
+Object.defineProperty(window.performance, 'memory', {
+    value: {
+        totalJSHeapSize: 50000000,
+        usedJSHeapSize: 40000000,
+        jsHeapSizeLimit: 2000000000
+    }
+});
+"""
+
+# Scrolls by each (pixels, pause_seconds) step inside the page
+_SCROLL_JS = """async (steps) => {
+    for (const [dy, pause] of steps) {
+        window.scrollBy(0, dy);
+        await new Promise(r => setTimeout(r, pause * 1000));
+    }
+}"""
+
+# Reads every job card in-page. For each card: title text and raw href of the title
+# link, trimmed innerText of the first match of each field selector (null when none),
+# the requested card attributes, and trimmed innerText of every match of each list selector.
+# A title or field selector given as a list is tried in order, first selector that matches wins.
+_CARDS_JS = """({cardSelector, titleSelector, fields, attrs, lists}) => {
+    const text = el => el ? el.innerText.trim() : null;
+    const pick = (card, sel) => {
+        if (!Array.isArray(sel)) return card.querySelector(sel);
+        for (const s of sel) {
+            const el = card.querySelector(s);
+            if (el) return el;
+        }
+        return null;
+    };
+    return Array.from(document.querySelectorAll(cardSelector)).map(card => {
+        const titleEl = pick(card, titleSelector);
+        const data = {
+            title: text(titleEl),
+            url: titleEl ? titleEl.getAttribute('href') : null,
+        };
+        for (const [name, sel] of Object.entries(fields)) {
+            data[name] = text(pick(card, sel));
+        }
+        for (const name of attrs) {
+            data[name] = card.getAttribute(name);
+        }
+        for (const [name, sel] of Object.entries(lists)) {
+            data[name] = Array.from(card.querySelectorAll(sel), text);
+        }
+        return data;
+    });
+}"""
+
+# First element found by trying each [selector, texts] strategy in order; a non-null
+# texts only accepts elements whose trimmed, lowercased innerText is one of them
+_FIND_FIRST_JS = """(strategies) => {
+    for (const [selector, texts] of strategies) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (!texts || texts.includes(el.innerText.trim().toLowerCase())) return el;
+        }
+    }
+    return null;
+}"""
+
 
 class BaseScraper(ABC):
     """Abstract base class for job site scrapers with stealth capabilities."""
 
+    # Site name used as the job source and rate-limit key; set by each subclass
+    SITE_NAME: str = ""
+
     # Rate limiting: minimum seconds between requests
     MIN_DELAY_BETWEEN_REQUESTS = 2.0
     MAX_DELAY_BETWEEN_REQUESTS = 5.0
 
+    # Per-site request pacing shared across all scraper instances
+    _next_allowed: Dict[str, float] = {}
+    # Loop -> {site: Lock}; weak so locks go away with short-lived loops
+    _site_locks = weakref.WeakKeyDictionary()
+
     # Maximum retries for failed requests
     MAX_RETRIES = 3
 
@@ -41,6 +161,33 @@ class BaseScraper(ABC):
         "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     ]
 
+    # Chromium flags for anti-detection; shared browsers are launched with the same set
+    BROWSER_ARGS = [
+        '--disable-blink-features=AutomationControlled',
+        '--disable-dev-shm-usage',
+        '--no-sandbox',
+        '--disable-setuid-sandbox',
+        '--disable-web-security',
+        # Chromium only honours the last --disable-features, so list them all in one flag
+        '--disable-features=IsolateOrigins,site-per-process,VizDisplayCompositor',
+        '--disable-site-isolation-trials',
+    ]
+
+    # save_job write-behind: flush after this many jobs or seconds
+    WRITE_BATCH_SIZE = 25
+    WRITE_FLUSH_INTERVAL = 5.0
+
+    # Post-load behaviour in navigate_with_retry: "minimal" skips the idle
+    # pause/scroll/mouse sequence, "full" keeps it for sites that watch engagement
+    STEALTH_LEVEL = "minimal"
+
+    # Drop cookies when one context runs several searches in a row
+    CLEAR_COOKIES_BETWEEN_SEARCHES = False
+
+    # Request types aborted in every context; results only need markup and scripts.
+    # Stylesheets still load since innerText and visibility checks depend on them.
+    BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
     # Viewport sizes to rotate through
     VIEWPORTS = [
         {'width': 1920, 'height': 1080},
@@ -56,31 +203,19 @@ class BaseScraper(ABC):
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.playwright = None
-        self.last_request_time = 0
-
-    async def init_browser(self):
-        """Initialize browser with stealth settings."""
-        self.playwright = await async_playwright().start()
-
-        # Launch browser with anti-detection settings
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-web-security',
-                '--disable-features=IsolateOrigins,site-per-process',
-                '--disable-site-isolation-trials',
-                '--disable-features=VizDisplayCompositor',
-            ]
-        )
-
-        # Create context with realistic browser fingerprint
-        self.context = await self.browser.new_context(
-            user_agent=random.choice(self.USER_AGENTS),
-            viewport=random.choice(self.VIEWPORTS),
+        self.owns_browser = False
+        self.owns_context = False
+        # Write-behind queue for save_job and its running outcome counts
+        self._pending_jobs: List[JobListing] = []
+        self._last_flush = time.monotonic()
+        self._tally = {'added': 0, 'updated': 0, 'skipped': 0, 'errors': 0}
+
+    @classmethod
+    async def new_stealth_context(cls, browser: Browser) -> BrowserContext:
+        """Create a context with a realistic fingerprint and the stealth script injected."""
+        context = await browser.new_context(
+            user_agent=random.choice(cls.USER_AGENTS),
+            viewport=random.choice(cls.VIEWPORTS),
             locale='en-GB',
             timezone_id='Europe/London',
             geolocation={'latitude': 51.5074, 'longitude': -0.1278},  # London
@@ -93,60 +228,54 @@ class BaseScraper(ABC):
         )
 
         # Inject scripts to hide automation - comprehensive stealth
-        await self.context.add_init_script("""
-            // Hide webdriver property
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-
-            // Mock plugins
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [
-                    { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' },
-                    { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
-                    { name: 'Native Client', filename: 'internal-nacl-plugin' }
-                ]
-            });
-
-            // Mock languages
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-GB', 'en', 'en-US']
-            });
-
-            // Override permissions API
-            const originalQuery = window.navigator.permissions.query;
-            window.navigator.permissions.query = (parameters) => (
-                parameters.name === 'notifications' ?
-                    Promise.resolve({ state: Notification.permission }) :
-                    originalQuery(parameters)
-            );
-
-            // Mock chrome object (for detection)
-            if (!window.chrome) {
-                window.chrome = {};
-            }
-            window.chrome.runtime = {};
-
-            // Mock navigator.connection
-            navigator.connection = {
-                effectiveType: '4g',
-                rtt: 50,
-                downlink: 10,
-                saveData: false
-            };
-
-            // Hide automation indicators
-            delete navigator.__proto__.webdriver;
-
-            // Mock performance
-            Object.defineProperty(window.performance, 'memory', {
-                value: {
-                    totalJSHeapSize: 50000000,
-                    usedJSHeapSize: 40000000,
-                    jsHeapSizeLimit: 2000000000
-                }
-            });
-        """)
+        await context.add_init_script(_STEALTH_JS)
+
+        # Skip downloading images, fonts and media nothing reads
+        blocked = cls.BLOCKED_RESOURCE_TYPES
+        if blocked:
+            async def block_heavy_resources(route):
+                if route.request.resource_type in blocked:
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await context.route('**/*', block_heavy_resources)
+        return context
+
+    async def init_browser(self, browser: Optional[Browser] = None,
+                           context: Optional[BrowserContext] = None):
+        """
+        Initialize browser with stealth settings.
+
+        Pass a running browser to share it: only a new context and page are created
+        here, and cleanup() leaves the browser open for its owner to close. Pass a
+        context from new_stealth_context() to share that too, so only a page is
+        opened; scrapers that clear cookies between searches still get their own.
+        """
+        if context is not None and not self.CLEAR_COOKIES_BETWEEN_SEARCHES:
+            self.browser = context.browser
+            self.owns_browser = False
+            self.context = context
+            self.owns_context = False
+        else:
+            if browser is None and context is not None:
+                browser = context.browser
+            if browser is not None:
+                self.browser = browser
+                self.owns_browser = False
+            else:
+                self.playwright = await async_playwright().start()
+
+                # Launch browser with anti-detection settings
+                self.browser = await self.playwright.chromium.launch(
+                    headless=self.headless,
+                    args=self.BROWSER_ARGS
+                )
+                self.owns_browser = True
+
+            # Create context with realistic browser fingerprint
+            self.context = await self.new_stealth_context(self.browser)
+            self.owns_context = True
 
         self.page = await self.context.new_page()
 
@@ -154,28 +283,32 @@ class BaseScraper(ABC):
         self.page.set_default_timeout(30000)
         self.page.set_default_navigation_timeout(30000)
 
-    async def _rate_limit_delay(self):
-        """Apply rate limiting between requests."""
-        now = time.time()
-        time_since_last = now - self.last_request_time
-
-        if time_since_last < self.MIN_DELAY_BETWEEN_REQUESTS:
-            delay = self.MIN_DELAY_BETWEEN_REQUESTS - time_since_last + random.uniform(0.5, 1.5)
-            await asyncio.sleep(delay)
-        else:
-            await asyncio.sleep(random.uniform(0.5, 1.5))
+    def _site_lock(self) -> asyncio.Lock:
+        """Return the rate-limit lock for this site on the running event loop."""
+        # asyncio locks bind to one loop, and the API and scheduler run scrapers on different loops
+        locks = BaseScraper._site_locks.setdefault(asyncio.get_running_loop(), {})
+        site = self.get_site_name()
+        lock = locks.get(site)
+        if lock is None:
+            lock = locks[site] = asyncio.Lock()
+        return lock
 
-        self.last_request_time = time.time()
+    async def _rate_limit_delay(self):
+        """Apply rate limiting between requests, shared by every scraper for the same site."""
+        site = self.get_site_name()
+        async with self._site_lock():
+            wait = max(0.0, BaseScraper._next_allowed.get(site, 0.0) - time.monotonic())
+            await asyncio.sleep(wait + random.uniform(0.5, 1.5))
+            BaseScraper._next_allowed[site] = time.monotonic() + self.MIN_DELAY_BETWEEN_REQUESTS
 
     async def random_delay(self, min_sec: float = 1.0, max_sec: float = 3.0):
         """Add random human-like delay."""
         await asyncio.sleep(random.uniform(min_sec, max_sec))
 
     async def human_like_scroll(self, count: int = 3):
-        """Scroll like a human being would."""
-        for _ in range(count):
-            await self.page.evaluate(f"window.scrollBy(0, {random.randint(200, 500)})")
-            await self.random_delay(0.2, 0.6)
+        """Scroll like a human being would, in a single round trip to the page."""
+        steps = [(random.randint(200, 500), random.uniform(0.2, 0.6)) for _ in range(count)]
+        await self.page.evaluate(_SCROLL_JS, steps)
 
     async def human_like_mouse_move(self):
         """Simulate human-like mouse movements."""
@@ -186,10 +319,49 @@ class BaseScraper(ABC):
         except:
             pass
 
-    async def navigate_with_retry(self, url: str, max_retries: int = None) -> bool:
-        """Navigate with retry logic and delays between requests."""
+    async def extract_cards(self, card_selector: str, title_selector: Selector,
+                            fields: Dict[str, Selector], attrs: Tuple[str, ...] = (),
+                            lists: Optional[Dict[str, str]] = None) -> List[dict]:
+        """Read every job card on the page in one round trip.
+
+        Returns one dict per card with 'title' and 'url' (the title link's raw href),
+        each field's trimmed text, each requested card attribute, and each list's texts.
+        A title or field selector may be a tuple of selectors tried in priority order,
+        where a comma-joined selector would take whichever match comes first in the card.
+        """
+        return await self.page.evaluate(_CARDS_JS, {
+            'cardSelector': card_selector,
+            'titleSelector': title_selector,
+            'fields': fields,
+            'attrs': list(attrs),
+            'lists': lists or {},
+        })
+
+    async def find_first(self, strategies: List[Tuple[str, Optional[Tuple[str, ...]]]]) -> Optional[ElementHandle]:
+        """Return the element found by the first (selector, texts) strategy that matches.
+
+        texts, when given, only accepts elements whose text (trimmed, lowercase) is
+        one of them. Every strategy is tried in-page, in one round trip.
+        """
+        handle = await self.page.evaluate_handle(
+            _FIND_FIRST_JS, [[selector, list(texts) if texts else None] for selector, texts in strategies]
+        )
+        element = handle.as_element()
+        if element is None:
+            await handle.dispose()
+        return element
+
+    async def navigate_with_retry(self, url: str, max_retries: int = None,
+                                  stealth: Optional[str] = None) -> bool:
+        """Navigate with retry logic and delays between requests.
+
+        stealth is "full" to pause, scroll and move the mouse after the page
+        loads, or "minimal" to return as soon as it does; defaults to STEALTH_LEVEL.
+        """
         if max_retries is None:
             max_retries = self.MAX_RETRIES
+        if stealth is None:
+            stealth = self.STEALTH_LEVEL
 
         await self._rate_limit_delay()
 
@@ -198,25 +370,26 @@ class BaseScraper(ABC):
                 response = await self.page.goto(url, wait_until='domcontentloaded')
 
                 if response and response.status == 200:
-                    # Random human-like behavior
-                    await asyncio.sleep(random.uniform(1, 2))
-                    await self.human_like_scroll(2)
-                    await self.human_like_mouse_move()
+                    if stealth == "full":
+                        # Random human-like behavior
+                        await asyncio.sleep(random.uniform(1, 2))
+                        await self.human_like_scroll(2)
+                        await self.human_like_mouse_move()
                     return True
                 elif response and response.status == 429:
                     wait_time = (attempt + 1) * 30
-                    print(f"[!] Site rate limited (429). Waiting {wait_time}s...")
+                    logger.warning(f"[{self.get_site_name()}] Site rate limited (429). Waiting {wait_time}s...")
                     await asyncio.sleep(wait_time)
                 elif response and response.status == 403:
-                    print(f"[!] Access forbidden (403). IP may be blocked.")
+                    logger.warning(f"[{self.get_site_name()}] Access forbidden (403). IP may be blocked.")
                     return False
                 else:
                     status = response.status if response else 'unknown'
-                    print(f"[!] Got status {status}, retrying...")
+                    logger.warning(f"[{self.get_site_name()}] Got status {status}, retrying...")
                     await asyncio.sleep(5)
 
             except Exception as e:
-                print(f"[!] Navigation error (attempt {attempt + 1}): {e}")
+                logger.warning(f"[{self.get_site_name()}] Navigation error (attempt {attempt + 1}): {e}")
                 await asyncio.sleep(5)
 
         return False
@@ -226,14 +399,48 @@ class BaseScraper(ABC):
         """Search for jobs on this platform. Must be implemented by subclasses."""
         pass
 
-    @abstractmethod
     def get_site_name(self) -> str:
         """Return the name of this job site."""
-        pass
+        return self.SITE_NAME
 
-    def save_job(self, job: JobListing) -> Tuple[bool, str]:
-        """Save a single job to the database immediately."""
-        return self.db.insert_job(job)
+    def save_job(self, job: JobListing, force_sync: bool = False) -> Tuple[bool, str]:
+        """Queue a job for saving; queued jobs are written in one transaction per flush.
+
+        The queue flushes itself every WRITE_BATCH_SIZE jobs or WRITE_FLUSH_INTERVAL
+        seconds. Pass force_sync=True to write this job now and get its real result.
+
+        Returns (True, "Queued") for a queued job: the insert outcome is not known
+        yet and is only counted in the stats returned by flush_jobs. With force_sync,
+        returns insert_job's (success, message).
+        """
+        if force_sync:
+            self.flush_jobs_queue()
+            return self.db.insert_job(job)
+
+        self._pending_jobs.append(job)
+        if (len(self._pending_jobs) >= self.WRITE_BATCH_SIZE or
+                time.monotonic() - self._last_flush >= self.WRITE_FLUSH_INTERVAL):
+            self.flush_jobs_queue()
+        return True, "Queued"
+
+    def flush_jobs_queue(self):
+        """Write queued jobs in a single transaction and add the outcomes to the tally."""
+        self._last_flush = time.monotonic()
+        if not self._pending_jobs:
+            return
+        jobs, self._pending_jobs = self._pending_jobs, []
+        results = self.db.insert_jobs(jobs)
+        for job, (success, message) in zip(jobs, results):
+            if 'Added' in message:
+                logger.info(f"Saved: {job.title} at {job.company}")
+        for key, count in self.db.tally_insert_results(results).items():
+            self._tally[key] += count
+
+    def flush_jobs(self) -> Dict[str, int]:
+        """Flush queued jobs and return save counts since the previous call."""
+        self.flush_jobs_queue()
+        stats, self._tally = self._tally, dict.fromkeys(self._tally, 0)
+        return stats
 
     async def scrape_and_store(self, search_term: str, location: str = "London",
                                save_incrementally: bool = True) -> int:
@@ -247,38 +454,41 @@ class BaseScraper(ABC):
         await self.init_browser()
 
         try:
-            print(f"[*] Starting scrape on {self.get_site_name()} for '{search_term}' in {location}")
+            logger.info(f"Starting scrape on {self.get_site_name()} for '{search_term}' in {location}")
 
             # Jobs are saved incrementally during search_jobs if save_incrementally=True
             jobs = await self.search_jobs(search_term, location)
 
-            print(f"[*] Found {len(jobs)} jobs")
+            logger.info(f"Found {len(jobs)} jobs")
 
             if not save_incrementally:
                 # Only do batch insert if not saving incrementally
                 stats = self.db.insert_jobs_batch(jobs)
                 added = stats.get('added', 0)
-                print(f"[*] Added {added} new jobs to database")
-                print(f"    Updated: {stats.get('updated', 0)}, Skipped: {stats.get('skipped', 0)}")
+                logger.info(f"Added {added} new jobs to database "
+                            f"(updated: {stats.get('updated', 0)}, skipped: {stats.get('skipped', 0)})")
                 return added
             else:
                 # Jobs already saved during scraping - just report what we found
-                print(f"[*] Jobs were saved incrementally during scraping")
+                logger.info("Jobs were saved incrementally during scraping")
                 return len(jobs)
 
         finally:
             await self.cleanup()
 
-    async def fetch_full_descriptions(self, jobs: List[JobListing], max_jobs: int = None) -> List[JobListing]:
+    async def fetch_full_descriptions(self, jobs: List[JobListing], max_jobs: int = None,
+                                      max_concurrency: int = 5) -> List[JobListing]:
         """
         Fetch full descriptions for a list of jobs using curl_cffi.
 
         Uses curl_cffi's browser TLS impersonation to bypass anti-bot protections.
-        This method is inherited by all scrapers.
+        This method is inherited by all scrapers. Fetches share one pooled async
+        session, at most max_concurrency at a time.
 
         Args:
             jobs: List of jobs to fetch descriptions for
             max_jobs: Maximum number of jobs to process (None = all)
+            max_concurrency: Maximum fetches in flight at once
 
         Returns:
             List of jobs with updated descriptions
@@ -291,17 +501,18 @@ class BaseScraper(ABC):
 
         # Initialize the description fetcher with TLS impersonation
         fetcher = DescriptionFetcher(max_retries=3, timeout=30)
+        sem = asyncio.Semaphore(max(1, max_concurrency))
 
-        for i, job in enumerate(jobs):
+        async def fetch_one(i: int, job: JobListing):
             if not job.url:
                 logger.warning(f"[{source}] Skipping {job.title} - no URL")
-                continue
+                return
 
             try:
-                logger.info(f"[{source}] [{i+1}/{len(jobs)}] Fetching: {job.title}")
+                async with sem:
+                    logger.info(f"[{source}] [{i+1}/{len(jobs)}] Fetching: {job.title}")
 
-                # Use curl_cffi to fetch the description
-                description = fetcher.fetch_description(job.url, source=source)
+                    description = await fetcher.fetch_description_async(job.url, source=source)
 
                 # Handle expired jobs - don't update description
                 if description == DescriptionFetcher.EXPIRED:
@@ -313,17 +524,36 @@ class BaseScraper(ABC):
                 else:
                     logger.warning(f"[{source}] Could not extract description for {job.title}")
 
-                # Small delay between requests
-                await asyncio.sleep(0.5)
-
             except Exception as e:
                 logger.error(f"[{source}] Error fetching details for {job.title}: {e}")
 
+        try:
+            await asyncio.gather(*(fetch_one(i, job) for i, job in enumerate(jobs)))
+        finally:
+            await fetcher.aclose()
+
         logger.info(f"[{source}] Completed fetching descriptions for {len(jobs)} jobs")
         return jobs
 
+    async def reset_between_searches(self):
+        """Prepare the context for the next search in the same session.
+
+        Cookies are kept by default so consecutive searches look like one
+        visitor; subclasses can set CLEAR_COOKIES_BETWEEN_SEARCHES to drop them.
+        """
+        if self.CLEAR_COOKIES_BETWEEN_SEARCHES and self.context:
+            try:
+                await self.context.clear_cookies()
+            except Exception as e:
+                logger.warning(f"[{self.get_site_name()}] Failed to clear cookies: {e}")
+
     async def cleanup(self):
-        """Clean up browser resources."""
+        """Flush queued jobs and clean up browser resources."""
+        try:
+            self.flush_jobs_queue()
+        except Exception as e:
+            logger.error(f"[{self.get_site_name()}] Failed to save queued jobs: {e}")
+
         try:
             if self.page:
                 await self.page.close()
@@ -331,11 +561,14 @@ class BaseScraper(ABC):
             pass
 
         try:
-            if self.context:
+            if self.context and self.owns_context:
                 await self.context.close()
         except:
             pass
 
+        if not self.owns_browser:
+            return
+
         try:
             if self.browser:
                 await self.browser.close()
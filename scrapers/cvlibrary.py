@@ -1,6 +1,8 @@
 """CV-Library scraper with stealth mode."""
 
 import logging
+import re
+from datetime import datetime, timezone
 from typing import List, Optional
 from urllib.parse import urlencode
 
@@ -9,11 +11,11 @@ from database.schema import JobListing
 
 logger = logging.getLogger('scrapers.cvlibrary')
 
-
 class CVLibraryScraper(BaseScraper):
     """Scraper for CV-Library.co.uk with anti-detection measures."""
 
     BASE_URL = "https://www.cv-library.co.uk"
+    SITE_NAME = "cvlibrary"
 
     # Employment type mappings for CV-Library
     EMPLOYMENT_TYPES = {
@@ -26,15 +28,32 @@ class CVLibraryScraper(BaseScraper):
         'part time': 'Part Time',
     }
 
-    def get_site_name(self) -> str:
-        return "cvlibrary"
+    # Job card selectors, read in one page.evaluate per results page. CV-Library's markup
+    # varies, so each title/field selector tuple is tried in priority order
+    _CARD_SEL = '.results__item, .job-card, article[data-job-id]'
+    _TITLE_SEL = ('.job__title a', 'h2 a', '.results__title a', 'a[data-job-title]')
+    _CARD_FIELDS = {
+        'company': ('.job__company', '.results__company', '[data-company-name]'),
+        'location': ('.job__location', '.results__location', '[data-location]'),
+        'salary': ('.job__salary', '.results__salary', '[data-salary]'),
+        'description': ('.job__description', '.results__description', '.job-card__snippet'),
+        'posted_date': ('.job__posted', '.results__posted', '[data-posted-date]'),
+        'job_type': ('.job__type', '.results__type', '[data-job-type]'),
+    }
+
+    # Employment type keywords on a job card, matched case-insensitively in one pass;
+    # when several appear the first in _EMP_CARD_TYPES wins, wherever it is in the text
+    _EMP_RE = re.compile(r'contract|perm|temp', re.I)
+    _EMP_CARD_TYPES = {'contract': 'contract', 'perm': 'permanent', 'temp': 'temporary'}
+    # Locations that mean the job is worked from home
+    _REMOTE_RE = re.compile(r'remote|home|wfh', re.I)
 
     def _normalize_employment_type(self, emp_type: str) -> Optional[str]:
         """Normalize employment type to match site expectations."""
         if not emp_type:
             return None
-        normalized = emp_type.lower().strip()
-        return self.EMPLOYMENT_TYPES.get(normalized, None)
+        # Callers pass already-stripped values
+        return self.EMPLOYMENT_TYPES.get(emp_type.lower())
 
     async def search_jobs(self,
                          search_term: str,
@@ -80,77 +99,80 @@ class CVLibraryScraper(BaseScraper):
             logger.error(f"Failed to load {search_url}")
             return jobs
 
+        # Cards already read while checking a page-param navigation
+        next_cards: Optional[List[dict]] = None
+        # Cleared after the first page-param miss; later pages go straight to the pagination links
+        use_page_param = True
+
         for page_num in range(1, max_pages + 1):
-            # Wait for job listings to load
-            try:
-                await self.page.wait_for_selector('.results__item, .job-card, [data-job-id]', timeout=10000)
-            except:
-                logger.info(f"No more jobs found on page {page_num}")
-                break
+            if next_cards is not None:
+                cards_data, next_cards = next_cards, None
+            else:
+                # Wait for job listings to load
+                try:
+                    await self.page.wait_for_selector('.results__item, .job-card, [data-job-id]', timeout=10000)
+                except:
+                    logger.info(f"No more jobs found on page {page_num}")
+                    break
 
-            # Extract job cards - CV-Library uses various selectors
-            job_cards = await self.page.query_selector_all('.results__item, .job-card, article[data-job-id]')
-            logger.info(f"Found {len(job_cards)} job cards on page {page_num}")
+                # Extract every job card's fields in one round trip
+                cards_data = await self._extract_cards()
+            logger.info(f"Found {len(cards_data)} job cards on page {page_num}")
 
-            if not job_cards:
+            if not cards_data:
                 logger.info("No more job cards found, stopping pagination")
                 break
 
-            for card in job_cards:
+            scraped_at = self._get_timestamp()
+            for card_data in cards_data:
                 try:
-                    job_data = await self._extract_job_data(card)
+                    job_data = self._job_from_card_data(card_data, scraped_at)
                     if job_data:
                         jobs.append(job_data)
                         if save_incrementally:
-                            success, message = self.save_job(job_data)
-                            if 'Added' in message:
-                                stats['added'] += 1
-                                logger.info(f"Saved: {job_data.title} at {job_data.company}")
-                            elif 'Updated' in message:
-                                stats['updated'] += 1
-                            elif 'Skipped' in message or 'Duplicate' in message:
-                                stats['skipped'] += 1
-                            else:
-                                stats['errors'] += 1
+                            self.save_job(job_data)
                 except Exception as e:
                     logger.error(f"Error extracting job: {e}")
                     continue
 
             if save_incrementally:
+                for key, count in self.flush_jobs().items():
+                    stats[key] += count
                 logger.info(f"Page {page_num} complete - Total: {len(jobs)} scraped, {stats['added']} added, {stats['skipped']} skipped")
 
-            # Check for next page - try multiple methods
-            next_button = None
+            if page_num == max_pages:
+                break
+
+            logger.info(f"Navigating to page {page_num + 1}...")
+            if use_page_param:
+                # Results pages are addressed by a page query param, so try the next one directly
+                current_url = self.page.url
+                next_cards = await self._goto_page_param(search_url, page_num + 1, cards_data[0].get('url'))
+                if next_cards is not None:
+                    continue
 
-            # Method 1: Standard pagination selectors
-            next_button = (
-                await self.page.query_selector('a.pagination__link--next') or
-                await self.page.query_selector('a[rel="next"]') or
-                await self.page.query_selector('.pagination__next a') or
-                await self.page.query_selector('a[aria-label="Next"]') or
-                await self.page.query_selector('a[aria-label="Next page"]')
-            )
+                # No fresh results that way - go back and follow the site's pagination links
+                logger.info(f"Page {page_num + 1} not reachable via page param, falling back to pagination links")
+                use_page_param = False
+                try:
+                    await self.page.goto(current_url, wait_until='domcontentloaded', timeout=15000)
+                except Exception as e:
+                    logger.warning(f"Failed to return to page {page_num}: {e}")
+                    break
 
-            # Method 2: Look for link containing "Next" text
-            if not next_button:
-                all_links = await self.page.query_selector_all('a')
-                for link in all_links:
-                    try:
-                        text = await link.inner_text()
-                        if text.strip().lower() in ['next', 'next page', '›', '»']:
-                            next_button = link
-                            break
-                    except:
-                        continue
-
-            # Method 3: Look for page parameter in URL (page=2, p=2, offset=)
-            if not next_button:
-                next_page_num = page_num + 1
-                next_button = (
-                    await self.page.query_selector(f'a[href*="page={next_page_num}"]') or
-                    await self.page.query_selector(f'a[href*="p={next_page_num}"]') or
-                    await self.page.query_selector(f'a[href*="offset="]')
-                )
+            # Check for next page - try multiple methods, in order, in one lookup
+            next_page_num = page_num + 1
+            next_button = await self.find_first([
+                # Standard pagination selectors
+                ('a.pagination__link--next, a[rel="next"], .pagination__next a, '
+                 'a[aria-label="Next"], a[aria-label="Next page"]', None),
+                # Link containing "Next" text
+                ('a', ('next', 'next page', '›', '»')),
+                # Page parameter in URL (page=2, p=2)
+                (f'a[href*="page={next_page_num}"], a[href*="p={next_page_num}"]', None),
+                # Any offset link is a last resort
+                ('a[href*="offset="]', None),
+            ])
 
             if not next_button:
                 logger.info(f"No next page button found, stopping at page {page_num}")
@@ -164,7 +186,6 @@ class CVLibraryScraper(BaseScraper):
                 break
 
             # Navigate to next page
-            logger.info(f"Navigating to page {page_num + 1}...")
             try:
                 next_href = await next_button.get_attribute('href')
                 if next_href:
@@ -184,99 +205,68 @@ class CVLibraryScraper(BaseScraper):
             logger.info(f"Final stats - Added: {stats['added']}, Updated: {stats['updated']}, Skipped: {stats['skipped']}")
         return jobs
 
-    async def _extract_job_data(self, card) -> Optional[JobListing]:
-        """Extract data from a CV-Library job card element."""
-        scraped_at = self._get_timestamp()
+    async def _goto_page_param(self, search_url: str, page_num: int,
+                               prev_first_url: Optional[str]) -> Optional[List[dict]]:
+        """Load results page page_num via its page param and return its cards; None unless they are new."""
+        # Paced by the per-site rate limit like every other navigation; one attempt only,
+        # since a miss just means falling back to the pagination links
+        if not await self.navigate_with_retry(f"{search_url}&page={page_num}", max_retries=1):
+            logger.debug(f"Page param navigation to page {page_num} failed")
+            return None
+        try:
+            await self.page.wait_for_selector(self._CARD_SEL, timeout=10000)
+            cards_data = await self._extract_cards()
+        except Exception as e:
+            logger.debug(f"No job cards on page param page {page_num}: {e}")
+            return None
+        # A site that ignores the param serves the same page again
+        if not cards_data or cards_data[0].get('url') == prev_first_url:
+            return None
+        return cards_data
+
+    async def _extract_cards(self) -> List[dict]:
+        """Read every CV-Library job card on the page in one round trip."""
+        return await self.extract_cards(self._CARD_SEL, self._TITLE_SEL, self._CARD_FIELDS)
 
+    def _job_from_card_data(self, data: dict, scraped_at: str) -> Optional[JobListing]:
+        """Build a JobListing from the fields extract_cards read off one CV-Library card."""
         try:
-            # Title and URL - try multiple selectors
-            title_elem = (
-                await card.query_selector('.job__title a') or
-                await card.query_selector('h2 a') or
-                await card.query_selector('.results__title a') or
-                await card.query_selector('a[data-job-title]')
-            )
-            if not title_elem:
+            title = data.get('title')
+            if title is None:
                 return None
 
-            title = await title_elem.inner_text()
-            url = await title_elem.get_attribute('href')
+            url = data.get('url')
             if url and not url.startswith('http'):
                 url = f"{self.BASE_URL}{url}"
 
-            # Company
-            company_elem = (
-                await card.query_selector('.job__company') or
-                await card.query_selector('.results__company') or
-                await card.query_selector('[data-company-name]')
-            )
-            company = await company_elem.inner_text() if company_elem else "Unknown"
-
-            # Location
-            location_elem = (
-                await card.query_selector('.job__location') or
-                await card.query_selector('.results__location') or
-                await card.query_selector('[data-location]')
-            )
-            location = await location_elem.inner_text() if location_elem else "Unknown"
-
-            # Salary
-            salary_elem = (
-                await card.query_selector('.job__salary') or
-                await card.query_selector('.results__salary') or
-                await card.query_selector('[data-salary]')
-            )
-            salary = await salary_elem.inner_text() if salary_elem else None
-
-            # Description
-            desc_elem = (
-                await card.query_selector('.job__description') or
-                await card.query_selector('.results__description') or
-                await card.query_selector('.job-card__snippet')
-            )
-            description = await desc_elem.inner_text() if desc_elem else ""
-
-            # Posted date
-            posted_elem = (
-                await card.query_selector('.job__posted') or
-                await card.query_selector('.results__posted') or
-                await card.query_selector('[data-posted-date]')
-            )
-            posted_date = await posted_elem.inner_text() if posted_elem else None
+            company = data.get('company') or "Unknown"
+            location = data.get('location') or "Unknown"
+            salary = data.get('salary')
+            description = data.get('description') or ""
+            posted_date = data.get('posted_date')
 
             # Employment type
             employment_type = None
-            type_elem = (
-                await card.query_selector('.job__type') or
-                await card.query_selector('.results__type') or
-                await card.query_selector('[data-job-type]')
-            )
-            if type_elem:
-                type_text = await type_elem.inner_text()
-                type_lower = type_text.lower()
-                if 'contract' in type_lower:
-                    employment_type = 'contract'
-                elif 'permanent' in type_lower or 'perm' in type_lower:
-                    employment_type = 'permanent'
-                elif 'temp' in type_lower:
-                    employment_type = 'temporary'
+            type_text = data.get('job_type')
+            if type_text:
+                found = {m.lower() for m in self._EMP_RE.findall(type_text)}
+                employment_type = next(
+                    (emp for key, emp in self._EMP_CARD_TYPES.items() if key in found), None)
 
             # Check for remote indicators
-            if not employment_type:
-                location_lower = location.lower() if location else ""
-                if 'remote' in location_lower or 'home' in location_lower or 'wfh' in location_lower:
-                    employment_type = 'WFH'
+            if not employment_type and location and self._REMOTE_RE.search(location):
+                employment_type = 'WFH'
 
             return JobListing(
-                title=title.strip(),
-                company=company.strip(),
-                location=location.strip(),
-                description=description.strip(),
-                salary=salary.strip() if salary else None,
+                title=title,
+                company=company,
+                location=location,
+                description=description,
+                salary=salary or None,
                 job_type=None,
-                posted_date=posted_date.strip() if posted_date else None,
+                posted_date=posted_date or None,
                 url=url,
-                source=self.get_site_name(),
+                source=self.SITE_NAME,
                 scraped_at=scraped_at,
                 employment_type=employment_type
             )
@@ -286,5 +276,4 @@ class CVLibraryScraper(BaseScraper):
 
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+        return datetime.now(timezone.utc).isoformat()
@@ -1,17 +1,45 @@
 """Fetch full job descriptions using curl_cffi to bypass TLS fingerprinting."""
 
+import asyncio
 import json
 import logging
 import re
-from typing import Optional
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
 from urllib.parse import urlparse
 from curl_cffi import requests
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml.html import fragment_fromstring
 import html
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json module when orjson isn't installed
+    orjson = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Fall back to BeautifulSoup when selectolax isn't installed
+    LexborHTMLParser = None
+
 logger = logging.getLogger('scrapers.description_fetcher')
 
 
+def _json_loads(text: str):
+    """Parse JSON text; raises json.JSONDecodeError (orjson's error subclasses it)."""
+    return orjson.loads(text) if orjson else json.loads(text)
+
+
+# Body of each <script type="application/ld+json"> block
+_JSON_LD_RE = re.compile(
+    r'<script\b[^>]*\btype\s*=\s*["\']?application/ld\+json["\']?[^>]*>(.*?)</script\s*>',
+    re.IGNORECASE | re.DOTALL
+)
+
+
 class DescriptionFetcher:
     """
     Fetch full job descriptions using curl_cffi for TLS fingerprint bypass.
@@ -35,6 +63,9 @@ class DescriptionFetcher:
         'Cache-Control': 'max-age=0',
     }
 
+    # Concurrent connections held by the async session
+    MAX_CLIENTS = 10
+
     # Browser impersonations to try (in order of preference)
     BROWSER_TYPES = ['chrome', 'chrome120', 'chrome110', 'edge']
 
@@ -70,16 +101,101 @@ class DescriptionFetcher:
         ],
     }
 
-    def __init__(self, max_retries: int = 3, timeout: int = 30):
+    # Fallback selectors tried after the site-specific ones
+    GENERIC_SELECTORS = (
+        '[data-at="job-description"]',
+        '[class*="job-description"]',
+        '[class*="jobDescription"]',
+        '.description',
+        '#description',
+    )
+
+    # source -> full selector tuple, filled on first use by _selectors_for
+    _SELECTOR_CACHE: Dict[Optional[str], Tuple[str, ...]] = {}
+
+    # Seconds a cached description stays fresh
+    CACHE_TTL = 24 * 60 * 60
+
+    def __init__(self, max_retries: int = 3, timeout: int = 30,
+                 cache_path: Optional[str] = None, cache_ttl: Optional[int] = None):
         """
         Initialize the description fetcher.
 
         Args:
             max_retries: Number of times to retry with different browsers
             timeout: Request timeout in seconds
+            cache_path: SQLite file caching fetched descriptions (None = no cache)
+            cache_ttl: Seconds a cached description is reused (defaults to CACHE_TTL)
         """
         self.max_retries = max_retries
         self.timeout = timeout
+        self.cache_ttl = self.CACHE_TTL if cache_ttl is None else cache_ttl
+        self._cache_lock = threading.Lock()
+        self._cache = self._open_cache(cache_path) if cache_path else None
+        # One pooled session per impersonated browser, created on first use, so
+        # connections are reused and a retry never rides another browser's TLS
+        self._sessions: Dict[str, requests.Session] = {}
+        self._async_sessions: Dict[str, requests.AsyncSession] = {}
+        # host -> browser impersonation that last got a 200 there
+        self._host_browser: Dict[str, str] = {}
+
+    def _open_cache(self, path: str) -> Optional[sqlite3.Connection]:
+        """Open the description cache, creating its table if needed."""
+        try:
+            conn = sqlite3.connect(path, timeout=30.0, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS description_cache (
+                    url TEXT PRIMARY KEY,
+                    fetched_at INTEGER NOT NULL,
+                    description TEXT NOT NULL
+                )
+            """)
+            return conn
+        except sqlite3.Error as e:
+            logger.warning(f"Description cache disabled ({path}): {e}")
+            return None
+
+    def _cache_get(self, url: str) -> Optional[str]:
+        """Return the cached description for url if it is still fresh."""
+        if self._cache is None:
+            return None
+        try:
+            with self._cache_lock:
+                row = self._cache.execute(
+                    "SELECT description FROM description_cache WHERE url = ? AND fetched_at > ?",
+                    (url, int(time.time()) - self.cache_ttl)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Description cache read failed: {e}")
+            return None
+        if row:
+            logger.debug(f"Description cache hit: {url}")
+            return row[0]
+        return None
+
+    def _cache_put(self, url: str, description: str):
+        """Store the description fetched for url."""
+        if self._cache is None:
+            return
+        try:
+            # Named columns: caches created with the old nullable html column still accept this
+            with self._cache_lock:
+                self._cache.execute(
+                    "INSERT OR REPLACE INTO description_cache (url, fetched_at, description) "
+                    "VALUES (?, ?, ?)",
+                    (url, int(time.time()), description)
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Description cache write failed: {e}")
+
+    def invalidate(self, url: str):
+        """Drop url from the description cache so the next fetch goes to the site."""
+        if self._cache is None:
+            return
+        with self._cache_lock:
+            self._cache.execute("DELETE FROM description_cache WHERE url = ?", (url,))
 
     def _detect_source(self, url: str) -> Optional[str]:
         """Detect which job site a URL belongs to."""
@@ -99,6 +215,88 @@ class DescriptionFetcher:
     # Special return value to indicate job is expired/gone
     EXPIRED = "__EXPIRED__"
 
+    def _resolve_source(self, url: str, source: Optional[str]) -> Optional[str]:
+        """Return the given source, or detect it from the URL."""
+        if not source:
+            source = self._detect_source(url)
+            logger.debug(f"Auto-detected source: {source}")
+        return source
+
+    def _handle_response(self, status_code: int, text: str, url: str,
+                         source: Optional[str], browser: str) -> Tuple[Optional[str], bool]:
+        """
+        Interpret one response.
+
+        Returns:
+            (result, gone): result is the description or EXPIRED when the fetch is
+            settled, None to try the next browser; gone is True on a 410.
+        """
+        if status_code == 200:
+            # Check if page content indicates expired listing
+            content_lower = text.lower()
+            expired_indicators = [
+                'no longer available',
+                'has been removed',
+                'expired',
+                'position has been filled',
+                'job is no longer',
+                'this vacancy has',
+                'sorry, this job',
+            ]
+            if any(indicator in content_lower for indicator in expired_indicators):
+                # Check if it's actually an error page (short content or specific patterns)
+                if len(text) < 5000 or 'here are some jobs' in content_lower:
+                    logger.info(f"Job listing expired (content indicates): {url}")
+                    return self.EXPIRED, False
+
+            # Parse HTML and extract description
+            description = self._extract_description(text, source)
+            if description:
+                logger.info(f"Successfully fetched description ({len(description)} chars) using {browser}")
+                return description, False
+            logger.warning(f"Got 200 but couldn't extract description with {browser}")
+        elif status_code == 410:
+            # 410 Gone - job listing has been removed
+            logger.info(f"Job listing expired (410 Gone): {url}")
+            return None, True
+        elif status_code == 404:
+            # 404 Not Found - job listing doesn't exist
+            logger.info(f"Job listing not found (404): {url}")
+            return self.EXPIRED, False
+        else:
+            logger.warning(f"Got status {status_code} with {browser}")
+        return None, False
+
+    def _browser_order(self, host: str) -> list[str]:
+        """BROWSER_TYPES, starting with the last one that got a 200 from host."""
+        preferred = self._host_browser.get(host)
+        if preferred is None:
+            return list(self.BROWSER_TYPES)
+        return [preferred] + [b for b in self.BROWSER_TYPES if b != preferred]
+
+    def _note_status(self, host: str, browser: str, status_code: int):
+        """Remember the browser a host accepts; forget it once the host starts refusing."""
+        if status_code == 200:
+            self._host_browser[host] = browser
+        elif status_code in (403, 429) and self._host_browser.get(host) == browser:
+            del self._host_browser[host]
+
+    def _get_session(self, browser: str) -> requests.Session:
+        """Return the pooled session impersonating browser, for fetch_description."""
+        session = self._sessions.get(browser)
+        if session is None:
+            session = self._sessions[browser] = requests.Session(impersonate=browser)
+        return session
+
+    def _get_async_session(self, browser: str) -> requests.AsyncSession:
+        """Return the pooled async session impersonating browser, for fetch_description_async."""
+        session = self._async_sessions.get(browser)
+        if session is None:
+            session = self._async_sessions[browser] = requests.AsyncSession(
+                impersonate=browser, max_clients=self.MAX_CLIENTS
+            )
+        return session
+
     def fetch_description(self, url: str, source: str = None) -> Optional[str]:
         """
         Fetch full job description from a job URL.
@@ -115,60 +313,33 @@ class DescriptionFetcher:
             logger.warning("No URL provided")
             return None
 
-        # Auto-detect source from URL if not provided
-        if not source:
-            source = self._detect_source(url)
-            logger.debug(f"Auto-detected source: {source}")
-
+        source = self._resolve_source(url, source)
+        cached = self._cache_get(url)
+        if cached:
+            return cached
         got_410 = False  # Track if we got "Gone" status
 
-        for browser in self.BROWSER_TYPES:
+        host = urlparse(url).netloc
+        for browser in self._browser_order(host):
             try:
                 logger.debug(f"Trying to fetch {url} with {browser}")
 
-                response = requests.get(
+                response = self._get_session(browser).get(
                     url,
-                    impersonate=browser,
                     headers=self.DEFAULT_HEADERS,
                     timeout=self.timeout,
                     allow_redirects=True
                 )
 
-                if response.status_code == 200:
-                    # Check if page content indicates expired listing
-                    content_lower = response.text.lower()
-                    expired_indicators = [
-                        'no longer available',
-                        'has been removed',
-                        'expired',
-                        'position has been filled',
-                        'job is no longer',
-                        'this vacancy has',
-                        'sorry, this job',
-                    ]
-                    if any(indicator in content_lower for indicator in expired_indicators):
-                        # Check if it's actually an error page (short content or specific patterns)
-                        if len(response.text) < 5000 or 'here are some jobs' in content_lower:
-                            logger.info(f"Job listing expired (content indicates): {url}")
-                            return self.EXPIRED
-
-                    # Parse HTML and extract description
-                    description = self._extract_description(response.text, source)
-                    if description:
-                        logger.info(f"Successfully fetched description ({len(description)} chars) using {browser}")
-                        return description
-                    else:
-                        logger.warning(f"Got 200 but couldn't extract description with {browser}")
-                elif response.status_code == 410:
-                    # 410 Gone - job listing has been removed
-                    logger.info(f"Job listing expired (410 Gone): {url}")
-                    got_410 = True
-                elif response.status_code == 404:
-                    # 404 Not Found - job listing doesn't exist
-                    logger.info(f"Job listing not found (404): {url}")
-                    return self.EXPIRED
-                else:
-                    logger.warning(f"Got status {response.status_code} with {browser}")
+                self._note_status(host, browser, response.status_code)
+                # response.text decodes the body on every access, so do it once
+                text = response.text
+                result, gone = self._handle_response(response.status_code, text, url, source, browser)
+                if result is not None:
+                    if result != self.EXPIRED:
+                        self._cache_put(url, result)
+                    return result
+                got_410 = got_410 or gone
 
             except Exception as e:
                 logger.warning(f"Error with {browser}: {e}")
@@ -181,20 +352,94 @@ class DescriptionFetcher:
         logger.error(f"Failed to fetch description from {url} after trying all browsers")
         return None
 
-    def _extract_from_json_ld(self, soup: BeautifulSoup) -> Optional[str]:
+    async def fetch_description_async(self, url: str, source: str = None) -> Optional[str]:
+        """
+        Async version of fetch_description sharing one pooled AsyncSession.
+
+        HTML parsing runs in a worker thread so it does not stall the event loop.
+        Call aclose() when done with the fetcher.
+        """
+        if not url:
+            logger.warning("No URL provided")
+            return None
+
+        source = self._resolve_source(url, source)
+        # The cache read can wait on the cache lock or on disk, so keep it off the event loop
+        cached = await asyncio.to_thread(self._cache_get, url)
+        if cached:
+            return cached
+        got_410 = False
+
+        host = urlparse(url).netloc
+        for browser in self._browser_order(host):
+            try:
+                logger.debug(f"Trying to fetch {url} with {browser}")
+
+                response = await self._get_async_session(browser).get(
+                    url,
+                    headers=self.DEFAULT_HEADERS,
+                    timeout=self.timeout,
+                    allow_redirects=True
+                )
+
+                self._note_status(host, browser, response.status_code)
+                text = response.text
+                result, gone = await asyncio.to_thread(
+                    self._handle_response, response.status_code, text, url, source, browser
+                )
+                if result is not None:
+                    if result != self.EXPIRED:
+                        await asyncio.to_thread(self._cache_put, url, result)
+                    return result
+                got_410 = got_410 or gone
+
+            except Exception as e:
+                logger.warning(f"Error with {browser}: {e}")
+                continue
+
+        if got_410:
+            return self.EXPIRED
+
+        logger.error(f"Failed to fetch description from {url} after trying all browsers")
+        return None
+
+    def close(self):
+        """Close the pooled sync sessions and the description cache."""
+        sessions, self._sessions = self._sessions, {}
+        for session in sessions.values():
+            session.close()
+        cache, self._cache = self._cache, None
+        if cache is not None:
+            cache.close()
+
+    async def aclose(self):
+        """Close the pooled async sessions."""
+        sessions, self._async_sessions = self._async_sessions, {}
+        for session in sessions.values():
+            await session.close()
+
+    def __del__(self):
+        # Best effort for callers that never call close(); async sessions need aclose()
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _extract_from_json_ld(self, scripts: Iterable[Optional[str]]) -> Optional[str]:
         """
         Extract job description from JSON-LD structured data.
 
         Many job sites include Schema.org JobPosting markup which contains
-        the full description in a standardized format.
+        the full description in a standardized format. Takes the raw text of
+        each application/ld+json script tag.
         """
         try:
-            # Find all JSON-LD script tags
-            scripts = soup.find_all('script', type='application/ld+json')
-
             for script in scripts:
+                # Skip blocks that can't hold a JobPosting without parsing them
+                if not script or 'JobPosting' not in script:
+                    continue
                 try:
-                    data = json.loads(script.string)
+                    data = _json_loads(script)
 
                     # Handle both single object and array of objects
                     if isinstance(data, list):
@@ -240,13 +485,28 @@ class DescriptionFetcher:
         desc = html.unescape(desc)
 
         # Remove HTML tags but preserve text
-        soup = BeautifulSoup(desc, 'lxml')
-        text = soup.get_text(separator=' ', strip=True)
+        if LexborHTMLParser is not None:
+            body = LexborHTMLParser(desc).body
+            text = body.text(separator=' ', strip=True) if body else ""
+        else:
+            # A bare fragment parse is much cheaper than building a BeautifulSoup document
+            fragment = fragment_fromstring(desc, create_parent='div')
+            etree.strip_elements(fragment, 'script', 'style', with_tail=False)
+            text = ' '.join(fragment.itertext())
 
         # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        return text
+        return ' '.join(text.split())
+
+    def _selectors_for(self, source: Optional[str]) -> Tuple[str, ...]:
+        """Site-specific selectors for source followed by the generic fallbacks."""
+        selectors = self._SELECTOR_CACHE.get(source)
+        if selectors is None:
+            site_selectors = self.SITE_SELECTORS.get(source, []) if source else []
+            selectors = tuple(site_selectors) + tuple(
+                s for s in self.GENERIC_SELECTORS if s not in site_selectors
+            )
+            self._SELECTOR_CACHE[source] = selectors
+        return selectors
 
     def _extract_description(self, html_content: str, source: str = None) -> Optional[str]:
         """
@@ -258,6 +518,10 @@ class DescriptionFetcher:
         3. Generic CSS selectors
         4. Fallback to largest text block
 
+        JSON-LD is pulled out with a regex before any parsing. Steps 2-4 parse
+        with selectolax's Lexbor backend when installed, falling back to
+        BeautifulSoup if it isn't or if Lexbor fails on the page.
+
         Args:
             html_content: The HTML content
             source: The job site source for site-specific selectors
@@ -265,28 +529,65 @@ class DescriptionFetcher:
         Returns:
             The description text or None
         """
-        soup = BeautifulSoup(html_content, 'lxml')
-
-        # 1. Try JSON-LD structured data first (most reliable)
-        json_ld_desc = self._extract_from_json_ld(soup)
+        # 1. JSON-LD straight from the markup, so pages that have it never build a DOM
+        json_ld_desc = self._extract_from_json_ld(
+            m.group(1) for m in _JSON_LD_RE.finditer(html_content)
+        )
         if json_ld_desc:
             logger.info(f"Extracted description from JSON-LD ({len(json_ld_desc)} chars)")
             return json_ld_desc
 
-        # 2. Get site-specific selectors if available
-        selectors = self.SITE_SELECTORS.get(source, []) if source else []
+        if LexborHTMLParser is not None:
+            try:
+                return self._extract_description_lexbor(html_content, source)
+            except Exception as e:
+                logger.debug(f"Lexbor extraction failed, falling back to BeautifulSoup: {e}")
+        return self._extract_description_bs4(html_content, source)
 
-        # 3. Add generic fallback selectors
-        generic_selectors = [
-            '[data-at="job-description"]',
-            '[class*="job-description"]',
-            '[class*="jobDescription"]',
-            '.description',
-            '#description',
-        ]
-        selectors = selectors + [s for s in generic_selectors if s not in selectors]
+    def _extract_description_lexbor(self, html_content: str, source: Optional[str]) -> Optional[str]:
+        """_extract_description using selectolax (Lexbor)."""
+        tree = LexborHTMLParser(html_content)
 
-        for selector in selectors:
+        # 2-3. Site-specific then generic selectors
+        for selector in self._selectors_for(source):
+            try:
+                # Get the largest text block (likely the description)
+                largest_text = max(
+                    (node.text(separator=' ', strip=True) for node in tree.css(selector)),
+                    key=len, default=""
+                )
+
+                # Only return if it's a reasonable length
+                if len(largest_text) > 200:
+                    logger.info(f"Extracted description from selector '{selector}' ({len(largest_text)} chars)")
+                    return largest_text
+            except Exception as e:
+                logger.debug(f"Error with selector '{selector}': {e}")
+                continue
+
+        # 4. Fallback: try to find the largest text block in the body
+        try:
+            body = tree.body
+            if body:
+                # Remove script and style elements
+                tree.strip_tags(['script', 'style', 'nav', 'header', 'footer'])
+
+                # Get all text
+                text = body.text(separator=' ', strip=True)
+                if len(text) > 500:  # Reasonable minimum for a job page
+                    logger.info(f"Extracted description from body fallback ({len(text)} chars)")
+                    return text
+        except Exception as e:
+            logger.debug(f"Error extracting from body: {e}")
+
+        return None
+
+    def _extract_description_bs4(self, html_content: str, source: Optional[str]) -> Optional[str]:
+        """_extract_description using BeautifulSoup and lxml."""
+        soup = BeautifulSoup(html_content, 'lxml')
+
+        # 2-3. Site-specific then generic selectors
+        for selector in self._selectors_for(source):
             try:
                 elements = soup.select(selector)
                 if elements:
@@ -307,14 +608,14 @@ class DescriptionFetcher:
 
         # 4. Fallback: try to find the largest text block in the body
         try:
-            body = soup.find('body')
-            if body:
+            # Same libxml2 tree BeautifulSoup built, but stripped and walked in C
+            body = etree.HTML(html_content).find('body')
+            if body is not None:
                 # Remove script and style elements
-                for script in body(['script', 'style', 'nav', 'header', 'footer']):
-                    script.decompose()
+                etree.strip_elements(body, 'script', 'style', 'nav', 'header', 'footer', with_tail=False)
 
                 # Get all text
-                text = body.get_text(separator=' ', strip=True)
+                text = ' '.join(t.strip() for t in body.itertext() if t.strip())
                 if len(text) > 500:  # Reasonable minimum for a job page
                     logger.info(f"Extracted description from body fallback ({len(text)} chars)")
                     return text
@@ -323,17 +624,46 @@ class DescriptionFetcher:
 
         return None
 
+    async def fetch_multiple_async(self, urls: list[str],
+                                   max_concurrency: Optional[int] = None) -> dict[str, Optional[str]]:
+        """
+        Fetch descriptions for multiple URLs concurrently over the pooled AsyncSession.
+
+        Args:
+            urls: List of URLs to fetch
+            max_concurrency: Maximum fetches in flight (defaults to MAX_CLIENTS)
+
+        Returns:
+            Dictionary mapping URL to description (or None if failed)
+        """
+        sem = asyncio.Semaphore(max_concurrency or self.MAX_CLIENTS)
+
+        async def fetch_one(url: str) -> Optional[str]:
+            async with sem:
+                return await self.fetch_description_async(url)
+
+        unique_urls = list(dict.fromkeys(urls))
+        descriptions = await asyncio.gather(*(fetch_one(url) for url in unique_urls))
+        return dict(zip(unique_urls, descriptions))
+
     def fetch_multiple(self, urls: list[str]) -> dict[str, Optional[str]]:
         """
         Fetch descriptions for multiple URLs.
 
+        Runs fetch_multiple_async on a private event loop; don't call it from
+        inside a running loop.
+
         Args:
             urls: List of URLs to fetch
 
         Returns:
             Dictionary mapping URL to description (or None if failed)
         """
-        results = {}
-        for url in urls:
-            results[url] = self.fetch_description(url)
-        return results
+        async def run():
+            # The async session is bound to this loop, so close it before the loop ends
+            try:
+                return await self.fetch_multiple_async(urls)
+            finally:
+                await self.aclose()
+
+        return asyncio.run(run())
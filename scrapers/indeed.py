@@ -1,6 +1,8 @@
 """Indeed scraper with stealth mode."""
 
 import logging
+import re
+from datetime import datetime, timezone
 from typing import List, Optional
 from urllib.parse import urlencode
 
@@ -9,6 +11,12 @@ from database.schema import JobListing
 
 logger = logging.getLogger('scrapers.indeed')
 
+# jk parameter of a tracking URL like /rc/clk?jk=abc123&...
+_JK_RE = re.compile(r'[?&]jk=([a-f0-9]+)')
+
+# A pound sign or any digit marks snippet text as an actual salary
+_SALARY_RE = re.compile(r'[£\d]')
+
 
 class IndeedScraper(BaseScraper):
     """Scraper for Indeed.co.uk with anti-detection measures.
@@ -18,6 +26,10 @@ class IndeedScraper(BaseScraper):
     """
 
     BASE_URL = "https://uk.indeed.com"
+    SITE_NAME = "indeed"
+
+    # Indeed's bot detection watches engagement, so keep the human-like pauses
+    STEALTH_LEVEL = "full"
 
     # Employment type mappings for Indeed
     EMPLOYMENT_TYPES = {
@@ -32,8 +44,28 @@ class IndeedScraper(BaseScraper):
         'full time': 'fulltime',
     }
 
-    def get_site_name(self) -> str:
-        return "indeed"
+    # Job cards, with the older results-list markup as a fallback
+    _CARD_SEL = '.job_seen_beacon, [data-jk]'
+    _ALT_CARD_SEL = '.jobsearch-ResultsList > li'
+
+    # Card field selectors - Indeed A/B tests its markup, so each field's fallbacks are
+    # joined into one selector and read in one page.evaluate per results page
+    _TITLE_SEL = 'h2.jobTitle a, .jobTitle a, a[data-jk], h2 a'
+    _CARD_FIELDS = {
+        'company': '[data-testid="company-name"], .companyName, .company',
+        'location': '[data-testid="text-location"], .companyLocation, .location',
+        'salary': '[data-testid="attribute_snippet_testid"], .salary-snippet-container',
+        'description': '.job-snippet, [data-testid="jobDescriptionText"], .jobCardShelfContainer',
+        'posted_date': '.date, [data-testid="myJobsStateDate"]',
+    }
+    _CARD_LISTS = {'metadata': '.metadata div, .jobMetaDataGroup'}
+
+    # Employment type keywords in card metadata, matched case-insensitively in one pass;
+    # when several appear the first in _EMP_CARD_TYPES wins, wherever it is in the text
+    _EMP_RE = re.compile(r'contract|permanent|temp', re.I)
+    _EMP_CARD_TYPES = {'contract': 'contract', 'permanent': 'permanent', 'temp': 'temporary'}
+    # Locations that mean the job is (at least partly) worked from home
+    _REMOTE_RE = re.compile(r'remote|home|hybrid', re.I)
 
     def _normalize_employment_type(self, emp_type: str) -> Optional[str]:
         """Normalize employment type to match site expectations."""
@@ -90,7 +122,7 @@ class IndeedScraper(BaseScraper):
         for page_num in range(1, max_pages + 1):
             # Wait for job listings to load - Indeed uses various selectors
             try:
-                await self.page.wait_for_selector('.job_seen_beacon, .jobsearch-ResultsList > li, [data-jk]', timeout=10000)
+                await self.page.wait_for_selector(f'{self._CARD_SEL}, {self._ALT_CARD_SEL}', timeout=10000)
             except:
                 logger.info(f"No more jobs found on page {page_num}")
                 break
@@ -99,67 +131,48 @@ class IndeedScraper(BaseScraper):
             await self.random_delay(1, 2)
             await self.human_like_scroll(2)
 
-            # Extract job cards
-            job_cards = await self.page.query_selector_all('.job_seen_beacon, [data-jk]')
-            logger.info(f"Found {len(job_cards)} job cards on page {page_num}")
+            # Extract every job card's fields in one round trip
+            cards_data = await self._extract_cards(self._CARD_SEL)
+            logger.info(f"Found {len(cards_data)} job cards on page {page_num}")
 
-            if not job_cards:
+            if not cards_data:
                 # Try alternate selector
-                job_cards = await self.page.query_selector_all('.jobsearch-ResultsList > li')
-                logger.info(f"Found {len(job_cards)} job cards using alternate selector")
+                cards_data = await self._extract_cards(self._ALT_CARD_SEL)
+                logger.info(f"Found {len(cards_data)} job cards using alternate selector")
 
-            if not job_cards:
+            if not cards_data:
                 logger.info("No more job cards found, stopping pagination")
                 break
 
-            for card in job_cards:
+            scraped_at = self._get_timestamp()
+            for card_data in cards_data:
                 try:
-                    job_data = await self._extract_job_data(card)
+                    job_data = self._job_from_card_data(card_data, scraped_at)
                     if job_data:
                         jobs.append(job_data)
                         if save_incrementally:
-                            success, message = self.save_job(job_data)
-                            if 'Added' in message:
-                                stats['added'] += 1
-                                logger.info(f"Saved: {job_data.title} at {job_data.company}")
-                            elif 'Updated' in message:
-                                stats['updated'] += 1
-                            elif 'Skipped' in message or 'Duplicate' in message:
-                                stats['skipped'] += 1
-                            else:
-                                stats['errors'] += 1
+                            self.save_job(job_data)
                 except Exception as e:
                     logger.error(f"Error extracting job: {e}")
                     continue
 
             if save_incrementally:
+                for key, count in self.flush_jobs().items():
+                    stats[key] += count
                 logger.info(f"Page {page_num} complete - Total: {len(jobs)} scraped, {stats['added']} added, {stats['skipped']} skipped")
 
-            # Check for next page - Indeed uses various pagination selectors
-            next_button = (
-                await self.page.query_selector('a[data-testid="pagination-page-next"]') or
-                await self.page.query_selector('a[aria-label="Next Page"]') or
-                await self.page.query_selector('a[aria-label="Next"]') or
-                await self.page.query_selector('.np[data-pp]') or
-                await self.page.query_selector('nav[aria-label="pagination"] a:last-child')
-            )
-
-            # Method 2: Look for link containing "Next" text
-            if not next_button:
-                all_links = await self.page.query_selector_all('nav a, .pagination a')
-                for link in all_links:
-                    try:
-                        text = await link.inner_text()
-                        if text.strip().lower() in ['next', '›', '»']:
-                            next_button = link
-                            break
-                    except:
-                        continue
-
-            # Method 3: Look for start parameter (Indeed uses start=10, start=20, etc)
-            if not next_button:
-                next_start = page_num * 10  # Indeed shows 10 jobs per page
-                next_button = await self.page.query_selector(f'a[href*="start={next_start}"]')
+            # Check for next page - Indeed uses various pagination markups, tried in order in one lookup
+            next_start = page_num * 10  # Indeed shows 10 jobs per page
+            next_button = await self.find_first([
+                ('a[data-testid="pagination-page-next"], a[aria-label="Next Page"], '
+                 'a[aria-label="Next"], .np[data-pp]', None),
+                # The last pagination link is only a guess, so it comes after the explicit ones
+                ('nav[aria-label="pagination"] a:last-child', None),
+                # Link containing "Next" text
+                ('nav a, .pagination a', ('next', '›', '»')),
+                # Start parameter (Indeed uses start=10, start=20, etc)
+                (f'a[href*="start={next_start}"]', None),
+            ])
 
             if not next_button:
                 logger.info(f"No next page button found, stopping at page {page_num}")
@@ -195,31 +208,25 @@ class IndeedScraper(BaseScraper):
             logger.info(f"Final stats - Added: {stats['added']}, Updated: {stats['updated']}, Skipped: {stats['skipped']}")
         return jobs
 
-    async def _extract_job_data(self, card) -> Optional[JobListing]:
-        """Extract data from an Indeed job card element."""
-        scraped_at = self._get_timestamp()
+    async def _extract_cards(self, card_selector: str) -> List[dict]:
+        """Read every card matching card_selector in one page.evaluate."""
+        return await self.extract_cards(card_selector, self._TITLE_SEL, self._CARD_FIELDS,
+                                        attrs=('data-jk',), lists=self._CARD_LISTS)
 
+    def _job_from_card_data(self, data: dict, scraped_at: str) -> Optional[JobListing]:
+        """Build a JobListing from the fields extract_cards read off one Indeed card."""
         try:
             # Title and URL - Indeed uses various structures
-            title_elem = (
-                await card.query_selector('h2.jobTitle a') or
-                await card.query_selector('.jobTitle a') or
-                await card.query_selector('a[data-jk]') or
-                await card.query_selector('h2 a')
-            )
-            if not title_elem:
+            title = data.get('title')
+            if title is None:
                 return None
 
-            title = await title_elem.inner_text()
-
             # Get job key first - this gives us a clean, direct URL
-            job_key = await card.get_attribute('data-jk')
+            job_key = data.get('data-jk')
+            href = data.get('url')
             if not job_key:
-                # Try to extract from the link href
-                href = await title_elem.get_attribute('href') or ''
                 # Extract jk parameter from tracking URL like /rc/clk?jk=abc123&...
-                import re
-                jk_match = re.search(r'[?&]jk=([a-f0-9]+)', href)
+                jk_match = _JK_RE.search(href or '')
                 if jk_match:
                     job_key = jk_match.group(1)
 
@@ -228,87 +235,46 @@ class IndeedScraper(BaseScraper):
                 url = f"{self.BASE_URL}/viewjob?jk={job_key}"
             else:
                 # Fallback to href if no job key found
-                url = await title_elem.get_attribute('href')
+                url = href
                 if url and not url.startswith('http'):
                     url = f"{self.BASE_URL}{url}"
 
-            # Company
-            company_elem = (
-                await card.query_selector('[data-testid="company-name"]') or
-                await card.query_selector('.companyName') or
-                await card.query_selector('.company')
-            )
-            company = await company_elem.inner_text() if company_elem else "Unknown"
-
-            # Location
-            location_elem = (
-                await card.query_selector('[data-testid="text-location"]') or
-                await card.query_selector('.companyLocation') or
-                await card.query_selector('.location')
-            )
-            location = await location_elem.inner_text() if location_elem else "Unknown"
+            company = data.get('company') or "Unknown"
+            location = data.get('location') or "Unknown"
 
             # Salary - Indeed often hides this or puts it in metadata
-            salary_elem = (
-                await card.query_selector('[data-testid="attribute_snippet_testid"]') or
-                await card.query_selector('.salary-snippet-container') or
-                await card.query_selector('.metadata.salary-snippet-container')
-            )
             salary = None
-            if salary_elem:
-                salary_text = await salary_elem.inner_text()
-                # Check if it's actually a salary (contains £ or numbers)
-                if '£' in salary_text or any(c.isdigit() for c in salary_text):
-                    salary = salary_text
-
-            # Description snippet
-            desc_elem = (
-                await card.query_selector('.job-snippet') or
-                await card.query_selector('[data-testid="jobDescriptionText"]') or
-                await card.query_selector('.jobCardShelfContainer')
-            )
-            description = await desc_elem.inner_text() if desc_elem else ""
+            salary_text = data.get('salary')
+            # Check if it's actually a salary (contains £ or numbers)
+            if salary_text and _SALARY_RE.search(salary_text):
+                salary = salary_text
 
-            # Posted date
-            posted_elem = (
-                await card.query_selector('.date') or
-                await card.query_selector('[data-testid="myJobsStateDate"]') or
-                await card.query_selector('.job-snippet .date')
-            )
-            posted_date = await posted_elem.inner_text() if posted_elem else None
+            description = data.get('description') or ""
+            posted_date = data.get('posted_date')
 
             # Employment type from metadata
             employment_type = None
-            metadata_elems = await card.query_selector_all('.metadata div, .jobMetaDataGroup')
-            for meta in metadata_elems:
-                meta_text = await meta.inner_text()
-                meta_lower = meta_text.lower()
-                if 'contract' in meta_lower:
-                    employment_type = 'contract'
-                    break
-                elif 'permanent' in meta_lower:
-                    employment_type = 'permanent'
-                    break
-                elif 'temporary' in meta_lower or 'temp' in meta_lower:
-                    employment_type = 'temporary'
+            for meta_text in data.get('metadata') or ():
+                found = {m.lower() for m in self._EMP_RE.findall(meta_text)}
+                employment_type = next(
+                    (emp for key, emp in self._EMP_CARD_TYPES.items() if key in found), None)
+                if employment_type:
                     break
 
             # Check for remote indicators
-            if not employment_type:
-                location_lower = location.lower() if location else ""
-                if 'remote' in location_lower or 'home' in location_lower or 'hybrid' in location_lower:
-                    employment_type = 'WFH'
+            if not employment_type and location and self._REMOTE_RE.search(location):
+                employment_type = 'WFH'
 
             return JobListing(
-                title=title.strip(),
-                company=company.strip(),
-                location=location.strip(),
-                description=description.strip(),
-                salary=salary.strip() if salary else None,
+                title=title,
+                company=company,
+                location=location,
+                description=description,
+                salary=salary or None,
                 job_type=None,
-                posted_date=posted_date.strip() if posted_date else None,
+                posted_date=posted_date or None,
                 url=url,
-                source=self.get_site_name(),
+                source=self.SITE_NAME,
                 scraped_at=scraped_at,
                 employment_type=employment_type
             )
@@ -318,5 +284,4 @@ class IndeedScraper(BaseScraper):
 
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+        return datetime.now(timezone.utc).isoformat()
@@ -1,6 +1,8 @@
 """Reed.co.uk scraper with stealth mode."""
 
 import logging
+import re
+from datetime import datetime, timezone
 from typing import List, Optional
 from urllib.parse import urlencode
 
@@ -14,6 +16,7 @@ class ReedScraper(BaseScraper):
     """Scraper for Reed.co.uk with anti-detection measures."""
 
     BASE_URL = "https://www.reed.co.uk"
+    SITE_NAME = "reed"
 
     # Employment type mappings for Reed
     EMPLOYMENT_TYPES = {
@@ -26,8 +29,24 @@ class ReedScraper(BaseScraper):
         'part time': 'part-time',
     }
 
-    def get_site_name(self) -> str:
-        return "reed"
+    # Job card selectors, read in one page.evaluate per results page
+    _CARD_SEL = 'article[data-qa="job-card"]'
+    _TITLE_SEL = 'h2 a, h3 a, [data-qa="job-card-title"] a'
+    _CARD_FIELDS = {
+        'company': '[data-qa="job-card-company"], .job-card__company',
+        'location': '[data-qa="job-card-location"], .job-card__location',
+        'salary': '[data-qa="job-card-salary"], .job-card__salary',
+        'description': '[data-qa="job-card-description"], .job-card__description',
+        'posted_date': '[data-qa="job-card-posted-date"], .job-card__posted-by',
+        'job_type': '[data-qa="job-card-contract-type"]',
+    }
+
+    # Employment type keywords on a job card, matched case-insensitively in one pass;
+    # when several appear the first in _EMP_CARD_TYPES wins, wherever it is in the text
+    _EMP_RE = re.compile(r'contract|perm|temp', re.I)
+    _EMP_CARD_TYPES = {'contract': 'contract', 'perm': 'permanent', 'temp': 'temporary'}
+    # Locations that mean the job is worked from home
+    _REMOTE_RE = re.compile(r'remote|home|wfh', re.I)
 
     def _normalize_employment_type(self, emp_type: str) -> Optional[str]:
         """Normalize employment type to match site expectations."""
@@ -76,62 +95,46 @@ class ReedScraper(BaseScraper):
         for page_num in range(1, max_pages + 1):
             # Wait for job listings to load
             try:
-                await self.page.wait_for_selector('article[data-qa="job-card"]', timeout=10000)
+                await self.page.wait_for_selector(self._CARD_SEL, timeout=10000)
             except:
                 logger.info(f"No more jobs found on page {page_num}")
                 break
 
-            # Extract job cards
-            job_cards = await self.page.query_selector_all('article[data-qa="job-card"]')
-            logger.info(f"Found {len(job_cards)} job cards on page {page_num}")
+            # Extract every job card's fields in one round trip
+            cards_data = await self.extract_cards(self._CARD_SEL, self._TITLE_SEL, self._CARD_FIELDS)
+            logger.info(f"Found {len(cards_data)} job cards on page {page_num}")
 
-            if not job_cards:
+            if not cards_data:
                 logger.info("No more job cards found, stopping pagination")
                 break
 
-            for card in job_cards:
+            scraped_at = self._get_timestamp()
+            for card_data in cards_data:
                 try:
-                    job_data = await self._extract_job_data(card)
+                    job_data = self._job_from_card_data(card_data, scraped_at)
                     if job_data:
                         jobs.append(job_data)
                         if save_incrementally:
-                            success, message = self.save_job(job_data)
-                            if 'Added' in message:
-                                stats['added'] += 1
-                                logger.info(f"Saved: {job_data.title} at {job_data.company}")
-                            elif 'Updated' in message:
-                                stats['updated'] += 1
-                            elif 'Skipped' in message or 'Duplicate' in message:
-                                stats['skipped'] += 1
-                            else:
-                                stats['errors'] += 1
+                            self.save_job(job_data)
                 except Exception as e:
                     logger.error(f"Error extracting job: {e}")
                     continue
 
             if save_incrementally:
+                for key, count in self.flush_jobs().items():
+                    stats[key] += count
                 logger.info(f"Page {page_num} complete - Total: {len(jobs)} scraped, {stats['added']} added, {stats['skipped']} skipped")
 
             # Check for next page - Reed uses text-based "Next" link with pageno parameter
-            # Try multiple approaches to find the next page link
-            next_button = None
-
-            # Method 1: Look for link containing "Next" text
-            all_links = await self.page.query_selector_all('a')
-            for link in all_links:
-                text = await link.inner_text()
-                if text.strip().lower() == 'next':
-                    next_button = link
-                    break
-
-            # Method 2: Look for pagination links by data attributes
-            if not next_button:
-                next_button = await self.page.query_selector('a[data-qa="pagination-next"]')
-
-            # Method 3: Look for link with pageno parameter for next page
-            if not next_button:
-                next_page_num = page_num + 1
-                next_button = await self.page.query_selector(f'a[href*="pageno={next_page_num}"]')
+            # Try multiple approaches to find the next page link, in order, in one lookup
+            next_button = await self.find_first([
+                # Link containing "Next" text
+                ('a', ('next',)),
+                # Pagination links by data attributes
+                ('a[data-qa="pagination-next"]', None),
+                # Link with pageno parameter for next page
+                (f'a[href*="pageno={page_num + 1}"]', None),
+            ])
 
             if not next_button:
                 logger.info(f"No next page button found, stopping at page {page_num}")
@@ -158,70 +161,46 @@ class ReedScraper(BaseScraper):
             logger.info(f"Final stats - Added: {stats['added']}, Updated: {stats['updated']}, Skipped: {stats['skipped']}")
         return jobs
 
-    async def _extract_job_data(self, card) -> Optional[JobListing]:
-        """Extract data from a Reed job card element."""
-        scraped_at = self._get_timestamp()
-
+    def _job_from_card_data(self, data: dict, scraped_at: str) -> Optional[JobListing]:
+        """Build a JobListing from the fields extract_cards read off one Reed card."""
         try:
             # Title and URL
-            title_elem = await card.query_selector('h2 a, h3 a, [data-qa="job-card-title"] a')
-            if not title_elem:
+            title = data.get('title')
+            if title is None:
                 return None
 
-            title = await title_elem.inner_text()
-            url = await title_elem.get_attribute('href')
+            url = data.get('url')
             if url and not url.startswith('http'):
                 url = f"{self.BASE_URL}{url}"
 
-            # Company
-            company_elem = await card.query_selector('[data-qa="job-card-company"], .job-card__company')
-            company = await company_elem.inner_text() if company_elem else "Unknown"
-
-            # Location
-            location_elem = await card.query_selector('[data-qa="job-card-location"], .job-card__location')
-            location = await location_elem.inner_text() if location_elem else "Unknown"
-
-            # Salary
-            salary_elem = await card.query_selector('[data-qa="job-card-salary"], .job-card__salary')
-            salary = await salary_elem.inner_text() if salary_elem else None
-
-            # Description/snippet
-            desc_elem = await card.query_selector('[data-qa="job-card-description"], .job-card__description')
-            description = await desc_elem.inner_text() if desc_elem else ""
-
-            # Posted date
-            posted_elem = await card.query_selector('[data-qa="job-card-posted-date"], .job-card__posted-by')
-            posted_date = await posted_elem.inner_text() if posted_elem else None
+            company = data.get('company') or "Unknown"
+            location = data.get('location') or "Unknown"
+            salary = data.get('salary')
+            description = data.get('description') or ""
+            posted_date = data.get('posted_date')
 
             # Try to determine employment type from badges or text
             employment_type = None
-            type_elem = await card.query_selector('[data-qa="job-card-contract-type"]')
-            if type_elem:
-                type_text = await type_elem.inner_text()
-                type_lower = type_text.lower()
-                if 'contract' in type_lower:
-                    employment_type = 'contract'
-                elif 'permanent' in type_lower or 'perm' in type_lower:
-                    employment_type = 'permanent'
-                elif 'temp' in type_lower:
-                    employment_type = 'temporary'
+            type_text = data.get('job_type')
+            if type_text:
+                found = {m.lower() for m in self._EMP_RE.findall(type_text)}
+                employment_type = next(
+                    (emp for key, emp in self._EMP_CARD_TYPES.items() if key in found), None)
 
             # Check for remote indicators
-            if not employment_type:
-                location_lower = location.lower() if location else ""
-                if 'remote' in location_lower or 'home' in location_lower or 'wfh' in location_lower:
-                    employment_type = 'WFH'
+            if not employment_type and location and self._REMOTE_RE.search(location):
+                employment_type = 'WFH'
 
             return JobListing(
-                title=title.strip(),
-                company=company.strip(),
-                location=location.strip(),
-                description=description.strip(),
-                salary=salary.strip() if salary else None,
+                title=title,
+                company=company,
+                location=location,
+                description=description,
+                salary=salary or None,
                 job_type=None,
-                posted_date=posted_date.strip() if posted_date else None,
+                posted_date=posted_date or None,
                 url=url,
-                source=self.get_site_name(),
+                source=self.SITE_NAME,
                 scraped_at=scraped_at,
                 employment_type=employment_type
             )
@@ -231,5 +210,4 @@ class ReedScraper(BaseScraper):
 
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+        return datetime.now(timezone.utc).isoformat()
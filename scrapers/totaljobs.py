@@ -2,11 +2,11 @@
 
 import re
 import logging
+from datetime import datetime, timezone
 from typing import List, Optional
 from urllib.parse import urlencode
 
 from scrapers.base import BaseScraper
-from scrapers.description_fetcher import DescriptionFetcher
 from database.schema import JobListing
 
 logger = logging.getLogger('scrapers.totaljobs')
@@ -16,6 +16,7 @@ class TotalJobsScraper(BaseScraper):
     """Scraper for TotalJobs.co.uk with anti-detection measures."""
 
     BASE_URL = "https://www.totaljobs.com"
+    SITE_NAME = "totaljobs"
 
     # Employment type mappings matching TotalJobs expectations
     EMPLOYMENT_TYPES = {
@@ -31,8 +32,25 @@ class TotalJobsScraper(BaseScraper):
         'home': 'whf',
     }
 
-    def get_site_name(self) -> str:
-        return "totaljobs"
+    # Job card selectors, read in one page.evaluate per results page
+    _CARD_SEL = '[data-at="job-item"]'
+    _TITLE_SEL = '[data-at="job-item-title"]'
+    _CARD_FIELDS = {
+        'company': '[data-at="job-item-company-name"]',
+        'location': '[data-at="job-item-location"]',
+        'salary': '[data-at="job-item-salary-info"]',
+        'job_type': '[data-at="job-item-job-type"]',
+        'employment_type': '[data-at="job-item-employment-type"]',
+        'posted_date': '[data-at="job-item-timeago"]',
+        'description': '[data-at="jobcard-content"]',
+    }
+
+    # Job type keywords, matched case-insensitively in one pass;
+    # when several appear the first in _EMP_CARD_TYPES wins, wherever it is in the text
+    _EMP_RE = re.compile(r'contract|perm', re.I)
+    _EMP_CARD_TYPES = {'contract': 'contract', 'perm': 'permanent'}
+    # Locations that mean the job is worked from home
+    _REMOTE_RE = re.compile(r'remote|home', re.I)
 
     def _normalize_employment_type(self, emp_type: str) -> Optional[str]:
         """Normalize employment type to match site expectations."""
@@ -95,50 +113,41 @@ class TotalJobsScraper(BaseScraper):
         for page_num in range(1, max_pages + 1):
             # Wait for job listings to load
             try:
-                await self.page.wait_for_selector('[data-at="job-item"]', timeout=10000)
+                await self.page.wait_for_selector(self._CARD_SEL, timeout=10000)
             except:
                 logger.info(f"No more jobs found on page {page_num}")
                 break
 
-            # Extract job cards
-            job_cards = await self.page.query_selector_all('[data-at="job-item"]')
-            logger.info(f"Found {len(job_cards)} job cards on page {page_num}")
+            # Extract every job card's fields in one round trip
+            cards_data = await self.extract_cards(self._CARD_SEL, self._TITLE_SEL, self._CARD_FIELDS)
+            logger.info(f"Found {len(cards_data)} job cards on page {page_num}")
 
-            if not job_cards:
+            if not cards_data:
                 logger.info("No more job cards found, stopping pagination")
                 break
 
-            for card in job_cards:
+            scraped_at = self._get_timestamp()
+            for card_data in cards_data:
                 try:
-                    job_data = await self._extract_job_data(card)
+                    job_data = self._job_from_card_data(card_data, scraped_at)
                     if job_data:
                         jobs.append(job_data)
                         # Save immediately if incremental saving is enabled
                         if save_incrementally:
-                            success, message = self.save_job(job_data)
-                            if 'Added' in message:
-                                stats['added'] += 1
-                                logger.info(f"Saved: {job_data.title} at {job_data.company}")
-                            elif 'Updated' in message:
-                                stats['updated'] += 1
-                            elif 'Skipped' in message or 'Duplicate' in message:
-                                stats['skipped'] += 1
-                            else:
-                                stats['errors'] += 1
+                            self.save_job(job_data)
                 except Exception as e:
                     logger.error(f"Error extracting job: {e}")
                     continue
 
             # Log progress after each page
             if save_incrementally:
+                for key, count in self.flush_jobs().items():
+                    stats[key] += count
                 logger.info(f"Page {page_num} complete - Total: {len(jobs)} scraped, {stats['added']} added, {stats['skipped']} skipped")
 
             # Check if there's a next page button - try multiple selectors
-            next_button = (
-                await self.page.query_selector('[data-at="pagination-next"]') or
-                await self.page.query_selector('a[aria-label="Next"]') or
-                await self.page.query_selector('li.pagination-next a') or
-                await self.page.query_selector('a.next')
+            next_button = await self.page.query_selector(
+                '[data-at="pagination-next"], a[aria-label="Next"], li.pagination-next a, a.next'
             )
 
             if not next_button:
@@ -181,7 +190,7 @@ class TotalJobsScraper(BaseScraper):
                         raise
 
                 # Wait for job cards to appear (confirmation of page load)
-                await self.page.wait_for_selector('[data-at="job-item"]', timeout=15000)
+                await self.page.wait_for_selector(self._CARD_SEL, timeout=15000)
 
                 logger.info(f"Successfully navigated to page {page_num + 1}")
             except Exception as e:
@@ -201,86 +210,71 @@ class TotalJobsScraper(BaseScraper):
             logger.info(f"Final stats - Added: {stats['added']}, Updated: {stats['updated']}, Skipped: {stats['skipped']}")
         return jobs
 
-    async def _extract_job_data(self, card) -> JobListing:
-        """Extract data from a job card element."""
-        scraped_at = self._get_timestamp()
-
+    def _job_from_card_data(self, data: dict, scraped_at: str) -> JobListing:
+        """Build a JobListing from the fields extract_cards read off one job card."""
         # Title and URL
-        title_elem = await card.query_selector('[data-at="job-item-title"]')
-        title = await title_elem.inner_text() if title_elem else "N/A"
-        url = await title_elem.get_attribute('href') if title_elem else ""
+        title = data.get('title')
+        if title is None:
+            title = "N/A"
+        url = data.get('url') or ""
 
         # Full URL if needed
         if url and not url.startswith('http'):
             url = f"{self.BASE_URL}{url}"
 
-        # Company
-        company_elem = await card.query_selector('[data-at="job-item-company-name"]')
-        company = await company_elem.inner_text() if company_elem else "N/A"
-
-        # Location
-        location_elem = await card.query_selector('[data-at="job-item-location"]')
-        location = await location_elem.inner_text() if location_elem else "N/A"
-
-        # Salary
-        salary_elem = await card.query_selector('[data-at="job-item-salary-info"]')
-        salary = await salary_elem.inner_text() if salary_elem else None
-
-        # Job type
-        type_elem = await card.query_selector('[data-at="job-item-job-type"]')
-        job_type = await type_elem.inner_text() if type_elem else None
+        company = data.get('company')
+        if company is None:
+            company = "N/A"
+        location = data.get('location')
+        if location is None:
+            location = "N/A"
+        salary = data.get('salary')
+        job_type = data.get('job_type')
 
         # Employment type badges (contract, permanent, etc)
-        emp_type_elem = await card.query_selector('[data-at="job-item-employment-type"]')
-        employment_type = await emp_type_elem.inner_text() if emp_type_elem else None
+        employment_type = data.get('employment_type')
 
         # If no employment type found, try to infer from other elements
         if not employment_type:
             # Check for remote/work from home indicators
-            location_lower = location.lower() if location else ""
-            if 'remote' in location_lower or 'home' in location_lower:
+            if location and self._REMOTE_RE.search(location):
                 employment_type = 'WHF'
             elif job_type:
-                job_type_lower = job_type.lower()
-                if 'contract' in job_type_lower:
-                    employment_type = 'contract'
-                elif 'permanent' in job_type_lower or 'perm' in job_type_lower:
-                    employment_type = 'permanent'
+                found = {m.lower() for m in self._EMP_RE.findall(job_type)}
+                employment_type = next(
+                    (emp for key, emp in self._EMP_CARD_TYPES.items() if key in found), None)
 
-        # Posted date
-        posted_elem = await card.query_selector('[data-at="job-item-timeago"]')
-        posted_date = await posted_elem.inner_text() if posted_elem else None
-
-        # Description
-        desc_elem = await card.query_selector('[data-at="jobcard-content"]')
-        description = await desc_elem.inner_text() if desc_elem else ""
+        posted_date = data.get('posted_date')
+        description = data.get('description') or ""
 
         # Clean up description
         description = ' '.join(description.split()) if description else ""
 
         return JobListing(
-            title=title.strip(),
-            company=company.strip(),
-            location=location.strip(),
-            description=description.strip(),
-            salary=salary.strip() if salary else None,
-            job_type=job_type.strip() if job_type else None,
-            posted_date=posted_date.strip() if posted_date else None,
+            title=title,
+            company=company,
+            location=location,
+            description=description,
+            salary=salary or None,
+            job_type=job_type or None,
+            posted_date=posted_date or None,
             url=url,
-            source=self.get_site_name(),
+            source=self.SITE_NAME,
             scraped_at=scraped_at,
-            employment_type=employment_type.strip() if employment_type else None
+            employment_type=employment_type or None
         )
 
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+        return datetime.now(timezone.utc).isoformat()
 
 
 class TotalJobsDetailedScraper(TotalJobsScraper):
     """Enhanced scraper that navigates to each job page for full details."""
 
+    # Detail pages fetched at once when search_jobs(detailed=True)
+    DETAIL_CONCURRENCY = 4
+
     async def _dismiss_overlays(self) -> bool:
         """
         Dismiss cookie consent and login modals that block job description access.
@@ -450,84 +444,6 @@ class TotalJobsDetailedScraper(TotalJobsScraper):
         if not detailed or len(jobs) > max_jobs:
             return jobs[:max_jobs]
 
-        # Fetch detailed descriptions for subset using curl_cffi
+        # Fetch detailed descriptions for the subset over curl_cffi, a few at a time
         logger.info(f"Fetching detailed info for {min(len(jobs), max_jobs)} jobs using curl_cffi...")
-
-        # Initialize the description fetcher with TLS impersonation
-        fetcher = DescriptionFetcher(max_retries=3, timeout=30)
-        detailed_jobs = []
-
-        for i, job in enumerate(jobs[:max_jobs]):
-            if not job.url:
-                detailed_jobs.append(job)
-                continue
-
-            try:
-                logger.info(f"[{i+1}/{min(len(jobs), max_jobs)}] Fetching: {job.title}")
-
-                # Use curl_cffi to fetch the description
-                description = fetcher.fetch_description(job.url)
-
-                if description:
-                    job.description = description
-                    logger.info(f"Got description ({len(description)} chars)")
-                else:
-                    logger.warning(f"Could not extract description for {job.title}")
-
-                detailed_jobs.append(job)
-
-                # Small delay between requests
-                import asyncio
-                await asyncio.sleep(0.5)
-
-            except Exception as e:
-                logger.error(f"Error fetching details for {job.title}: {e}")
-                detailed_jobs.append(job)
-
-        return detailed_jobs
-
-    async def fetch_full_descriptions(self, jobs: List[JobListing], max_jobs: int = None) -> List[JobListing]:
-        """
-        Fetch full descriptions for a list of jobs using curl_cffi.
-
-        Uses curl_cffi's browser TLS impersonation to bypass anti-bot protections
-        that block Playwright/Selenium (like ERR_HTTP2_PROTOCOL_ERROR).
-
-        Args:
-            jobs: List of jobs to fetch descriptions for
-            max_jobs: Maximum number of jobs to process (None = all)
-        """
-        if max_jobs:
-            jobs = jobs[:max_jobs]
-
-        logger.info(f"Fetching full descriptions for {len(jobs)} jobs using curl_cffi...")
-
-        # Initialize the description fetcher with TLS impersonation
-        fetcher = DescriptionFetcher(max_retries=3, timeout=30)
-
-        for i, job in enumerate(jobs):
-            if not job.url:
-                logger.warning(f"Skipping {job.title} - no URL")
-                continue
-
-            try:
-                logger.info(f"[{i+1}/{len(jobs)}] Fetching: {job.title}")
-
-                # Use curl_cffi to fetch the description
-                description = fetcher.fetch_description(job.url)
-
-                if description:
-                    job.description = description
-                    logger.info(f"Updated description for {job.title} ({len(description)} chars)")
-                else:
-                    logger.warning(f"Could not extract description for {job.title}")
-
-                # Small delay between requests (curl_cffi is fast, no need for long delays)
-                import asyncio
-                await asyncio.sleep(0.5)
-
-            except Exception as e:
-                logger.error(f"Error fetching details for {job.title}: {e}")
-
-        logger.info(f"Completed fetching descriptions for {len(jobs)} jobs")
-        return jobs
+        return await self.fetch_full_descriptions(jobs[:max_jobs], max_concurrency=self.DETAIL_CONCURRENCY)
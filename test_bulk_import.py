@@ -0,0 +1,53 @@
+"""Tests for JobDatabase.bulk_import, the path behind main.py --import-jobs."""
+import os
+import tempfile
+
+from database.schema import JobDatabase, JobListing
+
+
+def _index_sql(db):
+    rows = db.conn.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = 'jobs' AND sql IS NOT NULL"
+    ).fetchall()
+    return sorted(row['sql'] for row in rows)
+
+
+def _job(title, company='Acme', location='London', **extra):
+    return JobListing.from_dict(dict(title=title, company=company, location=location,
+                                     description='desc', source='import', scraped_at='2024-01-01',
+                                     **extra))
+
+
+def test_bulk_import_dedups_and_restores_indexes():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = JobDatabase(os.path.join(tmp_dir, 'jobs.db'))
+        try:
+            db.insert_jobs_batch([_job('Data Engineer')])
+            indexes = _index_sql(db)
+
+            stats = db.bulk_import([
+                _job('Python Developer'),
+                _job('Developer Python'),                    # same canonical title: merged in-batch
+                _job('Data Engineer', salary='50k'),         # already stored: updated
+                _job('Go Developer', location='Leeds'),
+            ])
+
+            assert stats == {'added': 2, 'updated': 2, 'skipped': 0, 'errors': 0}
+            assert db.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] == 3
+            assert db.conn.execute(
+                "SELECT salary FROM jobs WHERE title = 'Data Engineer'").fetchone()[0] == '50k'
+            assert _index_sql(db) == indexes
+        finally:
+            db.close()
+
+
+def test_from_dict_ignores_unknown_keys():
+    job = JobListing.from_dict({'id': 7, 'title': 'T', 'company': 'C', 'location': 'L',
+                                'description': 'D', 'is_edited': 0})
+    assert (job.title, job.company, job.location, job.description) == ('T', 'C', 'L', 'D')
+
+
+if __name__ == "__main__":
+    test_bulk_import_dedups_and_restores_indexes()
+    test_from_dict_ignores_unknown_keys()
+    print("OK")
@@ -0,0 +1,43 @@
+"""Tests that the Lexbor and BeautifulSoup description extractors agree on the same pages."""
+try:
+    import selectolax
+except ImportError:  # Fall back to skipping: without selectolax there is nothing to compare
+    selectolax = None
+
+from scrapers.description_fetcher import DescriptionFetcher
+
+PAGES = {
+    'site_selector': ('indeed', '<html><body><div id="jobDescriptionText"><p>'
+                      + 'Job text here. ' * 30
+                      + '</p><ul><li>Python</li><li>SQL &amp; data</li></ul></div></body></html>'),
+    'largest_match': ('reed', '<html><body>'
+                      + '<div class="description">short</div>'
+                      + '<div class="description"><p>' + 'Longer block of text. ' * 20 + '</p></div>'
+                      + '</body></html>'),
+    'generic_selector': ('indeed', '<html><body><div class="my-job-description-x">'
+                         + 'generic words ' * 50 + '</div></body></html>'),
+    'body_fallback': (None, '<html><body><nav>menu</nav><script>var x = 1;</script><main>'
+                      + 'body text ' * 80 + '<b>bold</b> tail</main><footer>footer</footer></body></html>'),
+    'too_short': (None, '<html><body><p>short</p></body></html>'),
+}
+
+
+def test_lexbor_matches_bs4():
+    if selectolax is None:
+        print("selectolax not installed, skipping")
+        return
+    fetcher = DescriptionFetcher()
+    try:
+        for name, (source, page) in sorted(PAGES.items()):
+            lexbor = fetcher._extract_description_lexbor(page, source)
+            bs4 = fetcher._extract_description_bs4(page, source)
+            assert lexbor == bs4, name
+            if name != 'too_short':
+                assert lexbor, name
+    finally:
+        fetcher.close()
+
+
+if __name__ == "__main__":
+    test_lexbor_matches_bs4()
+    print("OK")